@@ -0,0 +1 @@
+"""Benchmarks de rendimiento ejecutables sin ventana (driver de video ``dummy``)."""
@@ -0,0 +1,80 @@
+"""Mide la memoria ocupada por enemigos y proyectiles.
+
+Uso:
+    python -m benchmarks.bench_memory [--enemies 10000] [--projectiles 50000]
+
+Crea las entidades en bloque y reporta los bytes por entidad medidos con
+``tracemalloc``, junto con el tiempo de una recolección completa del GC con
+todas las entidades vivas.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from benchmarks.common import init_headless
+
+
+def _measure(factory, count: int) -> tuple[list, int]:
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    items = [factory(i) for i in range(count)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return items, after - before
+
+
+def run(num_enemies: int = 10_000, num_projectiles: int = 50_000) -> dict:
+    init_headless()
+
+    from entities.enemy import Enemy
+    from entities.projectile import Projectile
+    from maps import LEVELS
+    from maps.map_utils import convertir_camino_a_pixeles, extraer_caminos
+
+    path = convertir_camino_a_pixeles(extraer_caminos(LEVELS[0]["config"]["mapa"])[0])
+    # Precalienta la caché de sprites para no contabilizarla por entidad.
+    Enemy(path, sprite_set="1", radius=10)
+
+    enemies, enemy_bytes = _measure(
+        lambda _: Enemy(path, sprite_set="1", radius=10), num_enemies
+    )
+    target = enemies[0]
+    projectiles, projectile_bytes = _measure(
+        lambda _: Projectile((0, 0), target, damage=10), num_projectiles
+    )
+
+    start = time.perf_counter()
+    gc.collect()
+    gc_ms = (time.perf_counter() - start) * 1000
+
+    return {
+        "enemies": num_enemies,
+        "enemy_bytes_total": enemy_bytes,
+        "bytes_per_enemy": enemy_bytes / max(1, num_enemies),
+        "projectiles": num_projectiles,
+        "projectile_bytes_total": projectile_bytes,
+        "bytes_per_projectile": projectile_bytes / max(1, num_projectiles),
+        "gc_full_collect_ms": gc_ms,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--enemies", type=int, default=10_000)
+    parser.add_argument("--projectiles", type=int, default=50_000)
+    args = parser.parse_args()
+
+    result = run(args.enemies, args.projectiles)
+    print("--- MEMORIA POR ENTIDAD ---")
+    print(f"Enemigos:    {result['enemies']:>7}  -> {result['bytes_per_enemy']:8.1f} B/entidad")
+    print(f"Proyectiles: {result['projectiles']:>7}  -> {result['bytes_per_projectile']:8.1f} B/entidad")
+    print(f"GC completo con entidades vivas: {result['gc_full_collect_ms']:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
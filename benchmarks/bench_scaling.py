@@ -0,0 +1,141 @@
+"""Mide cómo escala el motor con el tamaño del mapa.
+
+Uso:
+    python -m benchmarks.bench_scaling [--sizes 20x15 50x50 100x100 250x250 500x500]
+                                       [--starts 8] [--enemies 200] [--frames 30]
+
+Para cada tamaño genera un mapa procedural (``maps.generator``) y reporta:
+
+- generación del mapa,
+- extracción de caminos (campo de distancias en frío + caminos),
+- construcción del nivel (``compile_level``: tiles, terreno, caminos, casillas),
+- memoria de Python reservada al construir el nivel (``tracemalloc``) y la
+  ocupada por los bloques de terreno pre-renderizados tras dibujar,
+- coste por frame de ``update`` y ``draw`` con ``--enemies`` enemigos vivos,
+  con la cámara en su posición inicial.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+import tracemalloc
+from pathlib import Path
+
+from benchmarks.common import init_headless, summarize
+
+DEFAULT_SIZES = ("20x15", "50x50", "100x100", "250x250", "500x500")
+
+
+def _parse_size(text: str) -> tuple[int, int]:
+    columnas, _, filas = text.lower().partition("x")
+    return int(columnas), int(filas or columnas)
+
+
+def _frame_cost(entry: dict, enemies: int, frames: int, screen) -> dict:
+    from game.game_manager import GameManager
+    from game.level_cache import LevelCache
+    from game.rng import RandomStreams
+
+    game = GameManager(rng=RandomStreams(1234), level_cache=LevelCache([entry]))
+    game.load_level(0)
+    # Oleada infinita para que ningún enemigo cuente como fin de nivel
+    game.enemies_per_wave = 10**9
+    game.lives = 10**9
+    for _ in range(enemies):
+        game.spawn_enemy()
+
+    dt = 1 / 60
+    update_times, draw_times = [], []
+    for _ in range(frames):
+        start = time.perf_counter()
+        game.update(dt)
+        update_times.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        game.draw(screen)
+        draw_times.append(time.perf_counter() - start)
+    terrain_bytes = game.terrain.cached_bytes if game.terrain is not None else 0
+    return {
+        "update": summarize(update_times),
+        "draw": summarize(draw_times),
+        "terrain_bytes": terrain_bytes,
+    }
+
+
+def run_size(columnas: int, filas: int, starts: int, enemies: int, frames: int, screen) -> dict:
+    from game.level_cache import available_sprite_sets, compile_level
+    from maps.generator import crear_nivel_generado
+    from maps.map_utils import _campo_cacheado, extraer_caminos
+
+    start = time.perf_counter()
+    entry = crear_nivel_generado(columnas, filas, num_inicios=starts, semilla=columnas * 1000 + filas)
+    generate_s = time.perf_counter() - start
+    mapa = entry["config"]["mapa"]
+
+    _campo_cacheado.cache_clear()
+    start = time.perf_counter()
+    caminos = extraer_caminos(mapa)
+    paths_s = time.perf_counter() - start
+
+    sprite_sets = available_sprite_sets()
+    _campo_cacheado.cache_clear()
+    tracemalloc.start()
+    start = time.perf_counter()
+    compiled = compile_level(0, entry, sprite_sets)
+    build_s = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del compiled
+
+    frame = _frame_cost(entry, enemies, frames, screen)
+    return {
+        "size": f"{columnas}x{filas}",
+        "cells": columnas * filas,
+        "starts": len(caminos),
+        "path_cells": sum(len(camino) for camino in caminos),
+        "generate_ms": generate_s * 1000,
+        "extract_paths_ms": paths_s * 1000,
+        "build_level_ms": build_s * 1000,
+        "build_python_peak_mb": peak / 2**20,
+        "terrain_mb": frame.pop("terrain_bytes") / 2**20,
+        "frame": frame,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--starts", type=int, default=8)
+    parser.add_argument("--enemies", type=int, default=200)
+    parser.add_argument("--frames", type=int, default=30)
+    parser.add_argument("--output", type=Path, help="guarda los resultados en JSON")
+    args = parser.parse_args()
+
+    screen = init_headless()
+
+    results = []
+    print(
+        f"{'mapa':>9} {'casillas':>9} {'generar':>9} {'caminos':>9} {'nivel':>9} "
+        f"{'py MB':>7} {'terreno MB':>10} {'update p50':>11} {'draw p50':>9}"
+    )
+    for text in args.sizes:
+        columnas, filas = _parse_size(text)
+        result = run_size(columnas, filas, args.starts, args.enemies, args.frames, screen)
+        results.append(result)
+        frame = result["frame"]
+        print(
+            f"{result['size']:>9} {result['cells']:>9} {result['generate_ms']:>7.1f}ms "
+            f"{result['extract_paths_ms']:>7.1f}ms {result['build_level_ms']:>7.1f}ms "
+            f"{result['build_python_peak_mb']:>7.1f} {result['terrain_mb']:>10.1f} "
+            f"{frame['update']['p50_ms']:>9.2f}ms {frame['draw']['p50_ms']:>7.2f}ms"
+        )
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"Resultados guardados en {args.output}")
+
+
+if __name__ == "__main__":
+    main()
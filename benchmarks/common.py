@@ -0,0 +1,74 @@
+"""Utilidades compartidas por los benchmarks."""
+
+from __future__ import annotations
+
+import os
+import time
+
+
+def init_headless(size: tuple[int, int] | None = None):
+    """Inicializa pygame con los drivers ``dummy`` y crea una pantalla oculta.
+
+    Debe llamarse antes de importar módulos que carguen imágenes, ya que
+    ``convert_alpha`` necesita un modo de video activo.
+    """
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    import pygame
+
+    from game import settings
+
+    pygame.init()
+    if size is None:
+        size = (settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT)
+    return pygame.display.set_mode(size)
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Percentil por rango más cercano sobre una lista ya ordenada."""
+
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1)))))
+    return sorted_values[rank]
+
+
+def summarize(durations: list[float]) -> dict:
+    """Resume una lista de duraciones (segundos) en ops/seg y percentiles en ms."""
+
+    ordered = sorted(durations)
+    total = sum(ordered)
+    return {
+        "iterations": len(ordered),
+        "ops_per_sec": len(ordered) / total if total > 0 else 0.0,
+        "mean_ms": total / len(ordered) * 1000 if ordered else 0.0,
+        "p50_ms": percentile(ordered, 50) * 1000,
+        "p95_ms": percentile(ordered, 95) * 1000,
+        "p99_ms": percentile(ordered, 99) * 1000,
+        "max_ms": ordered[-1] * 1000 if ordered else 0.0,
+    }
+
+
+def measure(fn, iterations: int, warmup: int = 1, setup=None, batch: int = 10) -> dict:
+    """Ejecuta ``fn`` varias veces y devuelve el resumen de sus duraciones.
+
+    Si ``fn`` cambia el estado que mide (una partida que avanza), ``setup``
+    lo restablece fuera del tiempo medido antes del calentamiento y de cada
+    lote de ``batch`` iteraciones, para que todas las ejecuciones midan la
+    misma carga.
+    """
+
+    if setup is not None:
+        setup()
+    for _ in range(warmup):
+        fn()
+    durations = []
+    for idx in range(iterations):
+        if setup is not None and idx % batch == 0:
+            setup()
+        start = time.perf_counter()
+        fn()
+        durations.append(time.perf_counter() - start)
+    return summarize(durations)
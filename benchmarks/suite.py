@@ -0,0 +1,341 @@
+"""Suite de benchmarks de ``GameManager`` y utilidades de mapas.
+
+Uso:
+    python -m benchmarks.suite [--output resultados.json] [--quick]
+                               [--baseline benchmarks/baseline.json]
+                               [--threshold 0.25] [--save-baseline]
+
+Todo se ejecuta con ``SDL_VIDEODRIVER=dummy``. Cada caso registra ops/seg y
+percentiles de tiempo por iteración; los resultados se guardan en JSON y, si
+existe una línea base, se comparan contra ella. Un caso cuyo p50 crece más
+que ``threshold`` respecto a la línea base se considera una regresión y el
+proceso termina con código 1.
+
+``benchmarks/baseline.json`` es solo una referencia local: son los tiempos
+de una ejecución completa (sin ``--quick``) en la máquina indicada en sus
+campos ``platform`` y ``python``. Compararse contra ella en otro hardware no
+tiene sentido, así que con una línea base de otra plataforma no se compara
+nada; en cada máquina se genera la suya con ``--save-baseline`` y se vuelve a
+guardar cuando un cambio mejora o empeora un caso a propósito.
+
+Los casos que avanzan una partida (``update``, ``GameEnv.step``) la
+restauran a su estado inicial antes de cada lote de iteraciones: los
+enemigos que llegan al final o mueren no se reponen solos, y sin esto la
+carga cambiaría durante la medición.
+
+Las comprobaciones de corrección (snapshots, grabaciones, caminos y tablas
+de alias) están en ``tests/`` y se ejecutan con ``python -m pytest``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import sys
+from pathlib import Path
+
+from benchmarks.common import init_headless, measure
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+ENEMY_COUNTS = (100, 1_000, 10_000)
+BENCH_LEVEL = 2  # Nivel 3: el mapa más grande y con varios caminos
+
+# Fracción de casillas de construcción ocupadas por torres en cada disposición.
+TOWER_LAYOUTS = {"sin_torres": 0.0, "mitad": 0.5, "completo": 1.0}
+
+
+def _frames_for(count: int, quick: bool) -> int:
+    frames = {100: 300, 1_000: 100, 10_000: 20}.get(count, 50)
+    return max(5, frames // 5) if quick else frames
+
+
+def _build_game(level_index: int, layout: str, enemy_count: int, projectile_mode: str = "homing"):
+    """Crea una partida con torres y enemigos colocados de forma determinista."""
+
+    from entities.tower import Tower
+    from game import settings
+    from game.game_manager import GameManager
+    from game.rng import RandomStreams
+
+    game = GameManager(rng=RandomStreams(1234))
+    game.projectile_mode = projectile_mode
+    game.load_level(level_index)
+
+    fraction = TOWER_LAYOUTS[layout]
+    type_keys = list(settings.TOWER_TYPES) or ["guardian"]
+    num_towers = int(round(len(game.spots) * fraction))
+    for idx, spot in enumerate(game.spots[:num_towers]):
+        game.towers.append(Tower(spot.pos, type_keys[idx % len(type_keys)], game.projectile_pool))
+        spot.occupied = True
+
+    for _ in range(enemy_count):
+        game.spawn_enemy()
+
+    # Mantener la partida en curso durante toda la medición.
+    game.wave_active = False
+    game.lives = 10**9
+    return game
+
+
+def bench_load_level(quick: bool) -> dict:
+    from game.game_manager import GameManager
+
+    game = GameManager()
+    results = {}
+    for index in range(len(game.levels)):
+        results[f"load_level[{index + 1}]"] = measure(
+            lambda: game.load_level(index), iterations=5 if quick else 20
+        )
+    return results
+
+
+def _measure_update(game, iterations: int) -> dict:
+    """Mide ``game.update`` volviendo al estado inicial antes de cada lote."""
+    from game import snapshot
+
+    start = snapshot.capture(game)
+    return measure(
+        lambda: game.update(1 / 60),
+        iterations=iterations,
+        setup=lambda: snapshot.restore(game, start),
+    )
+
+
+def bench_update(quick: bool) -> dict:
+    results = {}
+    for layout in ("sin_torres", "completo"):
+        for count in ENEMY_COUNTS:
+            game = _build_game(BENCH_LEVEL, layout, count)
+            results[f"update[{layout},{count}]"] = _measure_update(game, _frames_for(count, quick))
+    # Proyectiles con impacto programado: no se avanzan en cada update
+    for count in ENEMY_COUNTS:
+        game = _build_game(BENCH_LEVEL, "completo", count, projectile_mode="intercept")
+        results[f"update[completo,intercept,{count}]"] = _measure_update(
+            game, _frames_for(count, quick)
+        )
+    return results
+
+
+def bench_targeting(quick: bool) -> dict:
+    """Elección de objetivo desde todas las casillas con 10 000 enemigos repartidos."""
+    from game import settings, targeting
+
+    game = _build_game(BENCH_LEVEL, "sin_torres", ENEMY_COUNTS[-1])
+    # Repartir los enemigos a lo largo de los caminos
+    for _ in range(120):
+        game.update(1 / 60)
+    centers = [spot.pos for spot in game.spots]
+    reach = settings.TOWER_RANGE
+    index = game.enemy_index
+    enemies = game.enemies
+
+    results = {}
+    for strategy in targeting.STRATEGIES:
+        results[f"targeting[indice,{strategy}]"] = measure(
+            lambda: [index.select(center, reach, strategy) for center in centers],
+            iterations=5 if quick else 20,
+        )
+        results[f"targeting[lista,{strategy}]"] = measure(
+            lambda: [targeting.select(enemies, center, reach, strategy) for center in centers],
+            iterations=2 if quick else 5,
+        )
+    return results
+
+
+def bench_board_tensors(quick: bool) -> dict:
+    """Volcado del tablero a arreglos NumPy con cada cantidad de enemigos."""
+    results = {}
+    for count in ENEMY_COUNTS:
+        game = _build_game(BENCH_LEVEL, "completo", count)
+        board = game.export_board()
+        results[f"board_tensors[{count}]"] = measure(
+            board.update, iterations=_frames_for(count, quick)
+        )
+    return results
+
+
+def bench_agent_env(quick: bool) -> dict:
+    """Pasos de agente por segundo de una y de ocho partidas en el mismo proceso."""
+    from game.agent_env import GameEnv
+    from game.vector_env import VectorGameEnv
+
+    env = GameEnv(BENCH_LEVEL, seed=1234)
+    vector = VectorGameEnv(8, BENCH_LEVEL, seed=1234)
+    idle = [0] * vector.num_envs
+
+    return {
+        "GameEnv.step": measure(
+            lambda: env.step(0),
+            iterations=50 if quick else 300,
+            setup=lambda: env.reset(seed=1234),
+            batch=50,
+        ),
+        "VectorGameEnv.step[8]": measure(
+            lambda: vector.step(idle),
+            iterations=10 if quick else 50,
+            setup=lambda: vector.reset(seed=1234),
+        ),
+    }
+
+
+def bench_draw(screen, quick: bool) -> dict:
+    results = {}
+    for count in ENEMY_COUNTS:
+        game = _build_game(BENCH_LEVEL, "completo", count)
+        results[f"draw[completo,{count}]"] = measure(
+            lambda: game.draw(screen), iterations=_frames_for(count, quick)
+        )
+    return results
+
+
+def bench_extraer_caminos(quick: bool) -> dict:
+    from maps import LEVELS
+    from maps import map_utils
+
+    def cold(mapa):
+        # Sin caché: incluye la BFS desde el final.
+        map_utils._campo_cacheado.cache_clear()
+        return map_utils.extraer_caminos(mapa)
+
+    results = {}
+    for index, level in enumerate(LEVELS):
+        mapa = level["config"]["mapa"]
+        results[f"extraer_caminos[{index + 1}]"] = measure(
+            lambda: cold(mapa), iterations=50 if quick else 500
+        )
+        results[f"extraer_caminos_cache[{index + 1}]"] = measure(
+            lambda: map_utils.extraer_caminos(mapa), iterations=50 if quick else 500
+        )
+    return results
+
+
+def bench_remove_background(quick: bool) -> dict:
+    import pygame
+
+    from entities.tower import Tower
+    from utils.helpers import remove_background
+
+    # Se compone el sprite sobre un fondo opaco para que el relleno por
+    # inundación recorra la imagen completa (el PNG original ya es transparente).
+    sprite = pygame.image.load(str(Tower._image_path)).convert_alpha()
+    image = pygame.Surface(sprite.get_size())
+    image.fill((255, 255, 255))
+    image.blit(sprite, (0, 0))
+    image = image.convert_alpha()
+    return {
+        "remove_background[torre_pred]": measure(
+            lambda: remove_background(image), iterations=2 if quick else 5
+        )
+    }
+
+
+def bench_simulation(quick: bool) -> dict:
+    from game.simulation.env_controller import TowerDefenseEnv
+
+    def run_sim():
+        TowerDefenseEnv(num_towers=2, lambda_rate=0.9, mu_rate=1.2, seed=99).run(sim_time=600)
+
+    return {
+        "TowerDefenseEnv.run[600s]": measure(run_sim, iterations=3 if quick else 10)
+    }
+
+
+def run_suite(quick: bool = False) -> dict:
+    screen = init_headless()
+    results: dict[str, dict] = {}
+    # El motor de SimPy imprime cada llegada y atención; se silencia para no
+    # distorsionar las mediciones.
+    with contextlib.redirect_stdout(io.StringIO()):
+        results.update(bench_load_level(quick))
+        results.update(bench_update(quick))
+        results.update(bench_targeting(quick))
+        results.update(bench_board_tensors(quick))
+        results.update(bench_agent_env(quick))
+        results.update(bench_draw(screen, quick))
+        results.update(bench_extraer_caminos(quick))
+        results.update(bench_remove_background(quick))
+        results.update(bench_simulation(quick))
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """Devuelve los casos cuya mediana empeoró más que ``threshold``.
+
+    Se compara el p50 en lugar del promedio para que un par de iteraciones
+    lentas (GC, planificador del SO) no disparen falsas regresiones.
+    """
+
+    regressions = []
+    for name, current in results.items():
+        reference = baseline.get(name)
+        if not reference:
+            continue
+        base_p50 = reference.get("p50_ms", 0.0)
+        if base_p50 <= 0:
+            continue
+        ratio = current["p50_ms"] / base_p50
+        if ratio > 1.0 + threshold:
+            regressions.append(
+                f"{name}: p50 {current['p50_ms']:.3f} ms vs {base_p50:.3f} ms base (x{ratio:.2f})"
+            )
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", type=Path, default=Path("bench_results.json"))
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--threshold", type=float, default=0.25)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--quick", action="store_true")
+    args = parser.parse_args()
+
+    results = run_suite(quick=args.quick)
+    payload = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "quick": args.quick,
+        "results": results,
+    }
+    args.output.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
+
+    print(f"{'Caso':<34} {'ops/s':>10} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for name, data in results.items():
+        print(
+            f"{name:<34} {data['ops_per_sec']:>10.1f} {data['p50_ms']:>9.3f} "
+            f"{data['p95_ms']:>9.3f} {data['p99_ms']:>9.3f}"
+        )
+    print(f"Resultados guardados en {args.output}")
+
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
+        print(f"Línea base actualizada en {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print("Sin línea base para comparar (usa --save-baseline para crearla).")
+        return 0
+
+    baseline_payload = json.loads(args.baseline.read_text(encoding="utf-8"))
+    machine = (baseline_payload.get("platform"), baseline_payload.get("python"))
+    if machine != (payload["platform"], payload["python"]):
+        print(
+            f"La línea base es de otra máquina ({machine[0]}, Python {machine[1]}): "
+            "no se compara (usa --save-baseline para crear una local)."
+        )
+        return 0
+    regressions = compare(results, baseline_payload.get("results", {}), args.threshold)
+    if regressions:
+        print(f"\n--- REGRESIONES (umbral {args.threshold:.0%}) ---")
+        for line in regressions:
+            print(line)
+        return 1
+    print("Sin regresiones respecto a la línea base.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
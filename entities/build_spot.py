@@ -59,7 +59,7 @@ class BuildSpot:
         if image is not None:
             cls._base_image_cache[size] = image
         return image
-    def draw(self, surface):
+    def draw(self, surface, offset=(0, 0)):
         """Renderiza el punto de construcción si está disponible."""
 
         if self.occupied:
@@ -67,9 +67,11 @@ class BuildSpot:
 
         image = self._get_base_image(self.size)
         if image is not None:
-            rect = image.get_rect(center=self.pos)
+            rect = image.get_rect(center=(self.pos[0] + offset[0], self.pos[1] + offset[1]))
             surface.blit(image, rect)
             return
 
-        pygame.draw.rect(surface, settings.get_color("spot"), self.rect, border_radius=8)
+        pygame.draw.rect(
+            surface, settings.get_color("spot"), self.rect.move(offset), border_radius=8
+        )
 
@@ -2,6 +2,7 @@
 import pygame, math
 import math
 import random
+from itertools import count, islice
 from pathlib import Path
 
 from game import settings
@@ -12,9 +13,53 @@ class Enemy:
 
     SPRITE_BASE_PATH = Path(__file__).resolve().parents[1] / "maps" / "assets" / "images" / "enemy"
     _SPRITE_CACHE: dict[object, dict[str, list[pygame.Surface]]] = {}
-
-
-    def __init__(
+    # Placeholders compartidos por (radio, color): todas las instancias del mismo
+    # tipo reutilizan la misma superficie en lugar de crear una propia.
+    _PLACEHOLDER_CACHE: dict[tuple[int | None, tuple[int, int, int] | None], pygame.Surface] = {}
+
+    animation_speed = 6.0  # frames por segundo
+    # Número de serie por aparición: distingue una instancia reciclada de la
+    # anterior (proyectiles con impacto programado).
+    _serials = count(1)
+
+    # Sin ``__dict__`` por instancia: oleadas grandes ocupan menos memoria y
+    # generan menos trabajo para el recolector de basura.
+    __slots__ = (
+        "serial",
+        "path",
+        "flow",
+        "cell",
+        "grid_cell",
+        "pos",
+        "prev_pos",
+        "index",
+        "speed",
+        "alive",
+        "max_health",
+        "health",
+        "reward",
+        "base_radius",
+        "base_color",
+        "placeholder_image",
+        "sprite_set",
+        "sprites",
+        "direction",
+        "facing_left",
+        "frame_index",
+        "animation_timer",
+        "current_image",
+        "visible_image",
+        "rect",
+        "radius",
+        "collision_radius",
+    )
+
+    def __init__(self, *args, **kwargs):
+        # Mismos argumentos que ``reset``: la reserva de enemigos
+        # (``utils.pool.ObjectPool``) reutiliza instancias llamando a ``reset``.
+        self.reset(*args, **kwargs)
+
+    def reset(
         self,
         path,
         speed_range=(1.5, 3.0),
@@ -25,40 +70,66 @@ class Enemy:
         sprite_set: str | None = None,
         radius: int | None = None,
         color: tuple[int, int, int] | None = None,
+        rng: random.Random | None = None,
+        flow=None,
+        base_speed: float | None = None,
+        base_health: int | None = None,
     ):
+        # ``rng`` permite usar un flujo propio; sin él se usa el módulo global.
+        # ``base_speed``/``base_health`` evitan el sorteo cuando ya vienen dados
+        # (calendario de la oleada); los multiplicadores se aplican igualmente.
+        rng = rng if rng is not None else random
+        self.serial = next(Enemy._serials)
         self.path = path
         self.pos = list(path[0])
+        self.prev_pos = (self.pos[0], self.pos[1])
         self.index = 0
-        base_speed = random.uniform(*speed_range)
+        # Con un campo de flujo, ``path`` solo aporta el punto de aparición y
+        # ``cell`` es la casilla hacia la que avanza el enemigo.
+        self.flow = flow
+        self.cell = flow.next_cell(flow.cell_at(*path[0])) if flow is not None else -1
+        # Casilla en ``game.targeting.EnemyIndex`` (-1 si no está indexado)
+        self.grid_cell = -1
+        if base_speed is None:
+            base_speed = rng.uniform(*speed_range)
         self.speed = base_speed * speed_multiplier
         self.alive = True
-        base_health = random.randint(*health_range)
+        if base_health is None:
+            base_health = rng.randint(*health_range)
         self.max_health = max(1, int(base_health * health_multiplier))
         self.health = self.max_health
         self.reward = reward if reward is not None else settings.ENEMY_REWARD
 
-        self.base_radius = max(1, int(radius)) if radius is not None else 10
-        self.base_color = (
+        base_radius = max(1, int(radius)) if radius is not None else 10
+        base_color = (
             color if color is not None else settings.get_color("enemy", (200, 60, 60))
         )
-
-                # Superficie de respaldo utilizada cuando no existen fotogramas reales.
-        # Mantener un placeholder permanente evita parpadeos visibles al cambiar
-        # entre sprites o cuando un conjunto carece de ciertas direcciones.
-        self.placeholder_image = self._create_placeholder_surface(
-            self.base_radius, self.base_color
-        )
-
-        # Configuración visual / animación
-        self.sprite_set = str(sprite_set) if sprite_set else "1"
-        self.sprites = self._load_sprite_set(
-            self.sprite_set, placeholder_radius=self.base_radius, placeholder_color=self.base_color
+        sprite_set = str(sprite_set) if sprite_set else "1"
+
+        # Una instancia reciclada del mismo tipo conserva sus superficies y no
+        # vuelve a consultar las cachés.
+        same_look = (
+            getattr(self, "sprite_set", None) == sprite_set
+            and self.base_radius == base_radius
+            and self.base_color == base_color
         )
+        self.base_radius = base_radius
+        self.base_color = base_color
+        self.sprite_set = sprite_set
+        if not same_look:
+            # Superficie de respaldo utilizada cuando no existen fotogramas reales.
+            # Mantener un placeholder permanente evita parpadeos visibles al cambiar
+            # entre sprites o cuando un conjunto carece de ciertas direcciones.
+            self.placeholder_image = self._get_placeholder_surface(base_radius, base_color)
+
+            # Configuración visual / animación
+            self.sprites = self._load_sprite_set(
+                sprite_set, placeholder_radius=base_radius, placeholder_color=base_color
+            )
         self.direction = "down"
         self.facing_left = False
         self.frame_index = 0
         self.animation_timer = 0.0
-        self.animation_speed = 6.0  # frames por segundo
         self.current_image: pygame.Surface | None = None
         self.visible_image: pygame.Surface | None = self.placeholder_image
         self.rect: pygame.Rect | None = None
@@ -66,6 +137,68 @@ class Enemy:
         self.collision_radius = max(10, self.base_radius // 2)
         self._update_image(force=True)
 
+    @classmethod
+    def restore(
+        cls,
+        path,
+        *,
+        pos,
+        index: int,
+        speed: float,
+        health: int,
+        max_health: int,
+        reward: int,
+        alive: bool,
+        radius: int,
+        color: tuple[int, int, int],
+        sprite_set: str,
+        direction: str = "down",
+        facing_left: bool = False,
+        frame_index: int = 0,
+        animation_timer: float = 0.0,
+        flow=None,
+        cell: int = -1,
+        pool=None,
+    ) -> "Enemy":
+        """Reconstruye un enemigo a partir de valores ya calculados.
+
+        No realiza extracciones aleatorias ni accesos a disco (los sprites
+        salen de la caché), por lo que es la vía usada por los snapshots. Con
+        ``pool`` la instancia sale de esa reserva.
+        """
+        enemy = pool.take() if pool is not None else cls.__new__(cls)
+        enemy.serial = next(Enemy._serials)
+        enemy.path = path
+        enemy.flow = flow
+        enemy.cell = cell
+        enemy.grid_cell = -1
+        enemy.pos = [pos[0], pos[1]]
+        enemy.prev_pos = (pos[0], pos[1])
+        enemy.index = index
+        enemy.speed = speed
+        enemy.alive = alive
+        enemy.max_health = max_health
+        enemy.health = health
+        enemy.reward = reward
+        enemy.base_radius = radius
+        enemy.base_color = color
+        enemy.placeholder_image = cls._get_placeholder_surface(radius, color)
+        enemy.sprite_set = sprite_set
+        enemy.sprites = cls._load_sprite_set(
+            sprite_set, placeholder_radius=radius, placeholder_color=color
+        )
+        enemy.direction = direction
+        enemy.facing_left = facing_left
+        enemy.frame_index = frame_index
+        enemy.animation_timer = animation_timer
+        enemy.current_image = None
+        enemy.visible_image = enemy.placeholder_image
+        enemy.rect = None
+        enemy.radius = radius
+        enemy.collision_radius = max(10, radius // 2)
+        enemy._update_image(force=True)
+        return enemy
+
     # ------------------------------------------------------------------
     # Carga de sprites
     # ------------------------------------------------------------------
@@ -87,7 +220,7 @@ class Enemy:
             return cls._SPRITE_CACHE[cache_key]
 
         base_dir = cls.SPRITE_BASE_PATH / sprite_set
-        placeholder = cls._create_placeholder_surface(placeholder_radius, placeholder_color)
+        placeholder = cls._get_placeholder_surface(placeholder_radius, placeholder_color)
         animations: dict[str, list[pygame.Surface]] = {}
         placeholder_flags: dict[str, bool] = {}
 
@@ -115,6 +248,17 @@ class Enemy:
         cls._SPRITE_CACHE[cache_key] = animations
         return animations
 
+    @classmethod
+    def _get_placeholder_surface(
+        cls, radius: int | None = None, color: tuple[int, int, int] | None = None
+    ) -> pygame.Surface:
+        key = (radius, tuple(color) if color is not None else None)
+        cached = cls._PLACEHOLDER_CACHE.get(key)
+        if cached is None:
+            cached = cls._create_placeholder_surface(radius, color)
+            cls._PLACEHOLDER_CACHE[key] = cached
+        return cached
+
     @staticmethod
     def _create_placeholder_surface(
         radius: int | None = None, color: tuple[int, int, int] | None = None
@@ -160,19 +304,49 @@ class Enemy:
     # ------------------------------------------------------------------
     # Ciclo de vida del enemigo
     # ------------------------------------------------------------------
+    @property
+    def reached_end(self) -> bool:
+        """Indica si el enemigo llegó al final de su recorrido."""
+        if self.flow is None:
+            return self.index >= len(self.path) - 1
+        return self.cell < 0
+
+    def waypoints(self):
+        """Próximos puntos de paso, en orden, hasta el final del recorrido."""
+        flow = self.flow
+        if flow is None:
+            yield from islice(self.path, self.index + 1, None)
+            return
+        cell = self.cell
+        following = flow.next
+        while cell >= 0:
+            yield flow.center(cell)
+            cell = following[cell]
+
     def update(self, dt: float):
-        if self.index >= len(self.path) - 1 or not self.alive:
+        pos = self.pos
+        # Posición del paso anterior, para interpolar al dibujar
+        self.prev_pos = (pos[0], pos[1])
+        if not self.alive or self.reached_end:
             return
 
-        target = self.path[self.index + 1]
-        dx, dy = target[0] - self.pos[0], target[1] - self.pos[1]
+        # ``speed`` está en píxeles por frame de referencia
+        step = self.speed * dt * settings.SPEED_REFERENCE_HZ
+        flow = self.flow
+        if flow is None:
+            target = self.path[self.index + 1]
+        else:
+            target = flow.center(self.cell)
+        dx, dy = target[0] - pos[0], target[1] - pos[1]
         dist = math.hypot(dx, dy)
 
-        if dist < self.speed:
+        if dist < step:
             self.index += 1
+            if flow is not None:
+                self.cell = flow.next[self.cell]
         else:
-            self.pos[0] += self.speed * dx / dist
-            self.pos[1] += self.speed * dy / dist
+            pos[0] += step * dx / dist
+            pos[1] += step * dy / dist
 
         self._update_direction(dx, dy)
         self._animate(dt)
@@ -256,12 +430,20 @@ class Enemy:
     # ------------------------------------------------------------------
     # Renderizado
     # ------------------------------------------------------------------
-    def draw(self, surface: pygame.Surface):
+    def draw(self, surface: pygame.Surface, offset: tuple[int, int] = (0, 0), alpha: float = 1.0):
         image = self.current_image or self.visible_image or self.placeholder_image
         rect = self.rect
+        ox, oy = offset
+        if alpha < 1.0:
+            # Interpolación entre los dos últimos pasos de simulación, aplicada
+            # como un desplazamiento adicional del dibujo.
+            px, py = self.prev_pos
+            x, y = self.pos
+            ox += int(px + (x - px) * alpha) - int(x)
+            oy += int(py + (y - py) * alpha) - int(y)
 
         if image is None:
-            center = (int(self.pos[0]), int(self.pos[1]))
+            center = (int(self.pos[0]) + ox, int(self.pos[1]) + oy)
             pygame.draw.circle(surface, self.base_color, center, self.base_radius)
             bar_width = 36
             bar_height = 6
@@ -273,7 +455,7 @@ class Enemy:
                 self.rect = rect
             self._sync_rect_position()
             if self.rect:
-                rect = self.rect
+                rect = self.rect.move(ox, oy) if ox or oy else self.rect
             surface.blit(image, rect)
 
             bar_width = max(rect.width, 36)
@@ -4,21 +4,93 @@ import math
 import pygame
 
 from game import settings
+from game.events import EventType
 
 
 class Projectile:
+    __slots__ = (
+        "pos",
+        "prev_pos",
+        "target",
+        "target_serial",
+        "speed",
+        "damage",
+        "alive",
+        # Modo intercepción (game/ballistics.py): punto e instantes del vuelo
+        "impact",
+        "fire_time",
+        "hit_time",
+    )
+
     def __init__(self, pos, target, damage, speed=None):
-        self.pos = list(pos)
+        self.reset(pos, target, damage, speed)
+
+    def reset(self, pos, target, damage, speed=None):
+        """(Re)inicia el proyectil; lo usan el constructor y la reserva de la torre."""
+        if not hasattr(self, "pos"):
+            self.pos = [pos[0], pos[1]]
+        else:
+            self.pos[0] = pos[0]
+            self.pos[1] = pos[1]
+        self.prev_pos = (pos[0], pos[1])
         self.target = target
+        # Identifica al enemigo aunque su instancia se recicle antes del impacto
+        self.target_serial = target.serial
         self.speed = speed if speed is not None else settings.PROJECTILE_SPEED
         self.damage = damage
         self.alive = True
+        self.impact = None
+        self.fire_time = 0.0
+        self.hit_time = None
+
+    def aim(self, impact, fire_time: float, hit_time: float):
+        """Convierte el proyectil en uno de trayectoria recta con impacto programado."""
+        self.impact = impact
+        self.fire_time = fire_time
+        self.hit_time = hit_time
+
+    def _apply_damage(self, events=None, source=None):
+        """Daña al objetivo y publica el impacto y, si lo abate, la baja."""
+        target = self.target
+        target.health -= self.damage
+        if events is not None:
+            events.emit(EventType.HIT, target, source, self.damage)
+        if target.health <= 0:
+            target.health = 0      # Evita números negativos
+            target.alive = False   # Marca enemigo como eliminado
+            # La baja se publica en el mismo tick del impacto letal; el
+            # enemigo sale de la lista en el siguiente
+            if events is not None:
+                events.emit(EventType.KILL, target, source, target.reward)
+
+    @property
+    def tracking(self) -> bool:
+        """``True`` mientras el objetivo siga en juego (vivo y sin reciclar)."""
+        target = self.target
+        return target.alive and target.serial == self.target_serial
+
+    def land(self, events=None, source=None) -> bool:
+        """Resuelve un impacto programado; devuelve ``True`` si alcanzó al objetivo.
+
+        ``events`` (un ``EventBus``) recibe el impacto y la baja, atribuidos a
+        la torre ``source``.
+        """
+        self.alive = False
+        if not self.tracking:
+            return False
+        self._apply_damage(events, source)
+        return True
+
+    def update(self, dt: float | None = None, events=None, source=None) -> bool:
+        """Avanza el proyectil; devuelve ``True`` si impactó en este paso.
 
-    def update(self):
-        # Si el objetivo ya murió, eliminar el proyectil
-        if not self.target.alive:
+        ``events`` y ``source`` como en :meth:`land`.
+        """
+        self.prev_pos = (self.pos[0], self.pos[1])
+        # Si el objetivo ya murió (o su instancia se recicló), eliminar el proyectil
+        if not self.tracking:
             self.alive = False
-            return
+            return False
 
         # Calcular dirección hacia el objetivo
         dx = self.target.pos[0] - self.pos[0]
@@ -27,21 +99,34 @@ class Projectile:
 
         # Si el proyectil está suficientemente cerca, aplica daño
         if dist < 10:
-            self.target.health -= self.damage
-            if self.target.health <= 0:
-                self.target.health = 0      # Evita números negativos
-                self.target.alive = False   # Marca enemigo como eliminado
+            self._apply_damage(events, source)
             self.alive = False               # Destruye el proyectil tras impacto
+            return True
         else:
-            # Movimiento normal del proyectil hacia el objetivo
-            self.pos[0] += self.speed * dx / dist
-            self.pos[1] += self.speed * dy / dist
+            # Movimiento normal del proyectil hacia el objetivo (``speed`` en
+            # píxeles por frame de referencia; sin ``dt`` se avanza un frame)
+            step = self.speed if dt is None else self.speed * dt * settings.SPEED_REFERENCE_HZ
+            self.pos[0] += step * dx / dist
+            self.pos[1] += step * dy / dist
+        return False
 
 
-    def draw(self, surface):
+    def draw(self, surface, offset=(0, 0), alpha=1.0, now: float | None = None):
+        x, y = self.pos
+        if self.hit_time is not None:
+            # Trayectoria recta: la posición solo se calcula al dibujar
+            flight = self.hit_time - self.fire_time
+            progress = 1.0 if now is None or flight <= 0 else (now - self.fire_time) / flight
+            progress = min(1.0, max(0.0, progress))
+            x += (self.impact[0] - x) * progress
+            y += (self.impact[1] - y) * progress
+        elif alpha < 1.0:
+            px, py = self.prev_pos
+            x = px + (x - px) * alpha
+            y = py + (y - py) * alpha
         pygame.draw.circle(
             surface,
             settings.get_color("projectile"),
-            (int(self.pos[0]), int(self.pos[1])),
+            (int(x) + offset[0], int(y) + offset[1]),
             7,
         )
\ No newline at end of file
@@ -4,15 +4,18 @@ from __future__ import annotations
 import math
 import time
 from pathlib import Path
-import random
 
 import pygame
 
 from game import settings
+from game.ballistics import solve_intercept
+from game.events import EventType
+from game.targeting import STRATEGIES, next_strategy, select
 from entities.projectile import Projectile
 
 
-from utils.helpers import remove_background
+from utils.helpers import compact, remove_background
+from utils.pool import ObjectPool
 
 
 class Tower:
@@ -25,8 +28,13 @@ class Tower:
     )
     _image_cache: pygame.Surface | None = None
 
-    def __init__(self, pos, tower_type: str = "guardian"):
+    def __init__(self, pos, tower_type: str = "guardian", projectile_pool: ObjectPool | None = None):
         self.pos = (int(pos[0]), int(pos[1]))
+        # Reserva de proyectiles (la de la partida, compartida por sus torres):
+        # los que impactan o pierden su objetivo vuelven aquí.
+        self.projectile_pool = (
+            projectile_pool if projectile_pool is not None else ObjectPool(Projectile)
+        )
         self.type_key = tower_type
         self.type_config = self._resolve_type_config(tower_type)
 
@@ -36,48 +44,143 @@ class Tower:
         self.projectile_speed = self.type_config.get("projectile_speed", settings.PROJECTILE_SPEED)
         self.name = self.type_config.get("label", "Torre")
         self.upgrade_levels = {key: 0 for key in settings.TOWER_UPGRADES}
-        self.last_shot = 0
+        # Estrategia de selección de objetivo (ver ``game.targeting``)
+        self.targeting = self.type_config.get("targeting", settings.TOWER_TARGETING)
+        # -inf permite disparar en cuanto aparece el primer objetivo.
+        self.last_shot = float("-inf")
         self.projectiles = []
+        # Proyectiles de impacto programado ya resueltos y pendientes de retirar
+        self.spent_projectiles = 0
+        # Estado en ``game.tower_scheduler.TowerScheduler``: próximo despertar y
+        # si tiene proyectiles en vuelo
+        self.wake_time = float("inf")
+        self.armed = False
         self.image = self._load_image()
 
-    def update(self, enemies):
-        now = time.time()
-        # Mantener solo proyectiles activos
-        self.projectiles = [p for p in self.projectiles if p.alive]
-
-        # Actualizar proyectiles
-        for p in self.projectiles:
-            p.update()
+    def update(
+        self,
+        enemies,
+        now: float | None = None,
+        dt: float | None = None,
+        events=None,
+        hits=None,
+        index=None,
+    ):
+        # ``now`` es el tiempo de simulación; sin él se usa el reloj de pared.
+        # ``dt`` es la duración del paso, usada para mover los proyectiles.
+        # ``events`` (un ``EventBus``) recibe los disparos e impactos.
+        # ``hits`` (un ``HitScheduler``) activa el modo intercepción: los
+        # proyectiles no se avanzan y sus impactos los resuelve el montículo.
+        # ``index`` (un ``EnemyIndex``) acota la búsqueda de objetivo a las
+        # casillas al alcance.
+        if now is None:
+            now = time.time()
+        self.update_projectiles(dt, events, hits)
 
         # Buscar objetivo y disparar si corresponde
         if now - self.last_shot >= 1 / self.fire_rate:
-            target = self.get_target(enemies)
-            if target:
-                self.shoot(target)
-                self.last_shot = now
+            self.try_fire(enemies, now, events, hits, index)
+
+    def update_projectiles(self, dt: float | None = None, events=None, hits=None) -> bool:
+        """Avanza (o retira) los proyectiles; devuelve si queda alguno en vuelo."""
+        pool = self.projectile_pool
 
-    def get_target(self, enemies):
-        """Busca el primer enemigo dentro del rango"""
+        def release(projectile):
+            if projectile.alive:
+                return True
+            projectile.target = None
+            pool.release(projectile)
+            return False
+
+        if hits is None:
+            # Actualizar proyectiles y devolver a la reserva los que ya
+            # impactaron, en una pasada
+            def step(projectile):
+                projectile.update(dt, events, self)
+                return release(projectile)
+
+            compact(self.projectiles, step)
+        elif self.spent_projectiles:
+            compact(self.projectiles, release)
+            self.spent_projectiles = 0
+        return bool(self.projectiles)
+
+    def try_fire(self, enemies, now: float, events=None, hits=None, index=None) -> float:
+        """Dispara al enemigo en alcance que elige su estrategia.
+
+        Devuelve 0 si disparó; si no, una cota inferior de los segundos que
+        faltan para que algún enemigo pueda entrar en alcance (que puede ser
+        0, o ``inf`` si no hay ninguno que se mueva).
+        """
+        target, delay = self.scan(enemies, index)
+        if target is None:
+            return delay
+        self.shoot(target, now, hits)
+        self.last_shot = now
+        if events is not None:
+            events.emit(EventType.SHOT, target, self)
+        return 0.0
+
+    def scan(self, enemies, index=None):
+        """Objetivo según ``targeting``, o ``None`` y la cota de espera hasta el próximo."""
+        if index is not None:
+            target = index.select(self.pos, self.range, self.targeting)
+        else:
+            target = select(enemies, self.pos, self.range, self.targeting)
+        if target is not None:
+            return target, 0.0
+        # Nadie en alcance: cota de espera para el planificador. El índice la
+        # saca de las casillas cercanas; sin él se recorre la lista, como en select
+        if index is not None:
+            return None, index.entry_delay(self.pos, self.range)
+        px, py = self.pos
+        reach = self.range
+        delay = float("inf")
         for enemy in enemies:
             if not enemy.alive:
                 continue
-            dx = enemy.pos[0] - self.pos[0]
-            dy = enemy.pos[1] - self.pos[1]
-            distance = math.hypot(dx, dy)
-            if distance <= self.range:
-                return enemy
-        return None
-
-    def shoot(self, target):
-        """Crea un proyectil que sigue a su objetivo"""
-        projectile = Projectile(
-            list(self.pos),
+            distance = math.hypot(enemy.pos[0] - px, enemy.pos[1] - py)
+            speed = enemy.speed * settings.SPEED_REFERENCE_HZ
+            if speed > 0:
+                delay = min(delay, (distance - reach) / speed)
+        return None, delay
+
+    def entry_delay(self, enemy) -> float:
+        """Segundos que ``enemy`` necesita como mínimo para entrar en alcance."""
+        distance = math.hypot(enemy.pos[0] - self.pos[0], enemy.pos[1] - self.pos[1])
+        if distance <= self.range:
+            return 0.0
+        speed = enemy.speed * settings.SPEED_REFERENCE_HZ
+        return (distance - self.range) / speed if speed > 0 else float("inf")
+
+    def get_target(self, enemies, index=None):
+        """Busca el enemigo dentro del rango según la estrategia de la torre"""
+        return self.scan(enemies, index)[0]
+
+    @property
+    def targeting_label(self) -> str:
+        return STRATEGIES.get(self.targeting, self.targeting)
+
+    def cycle_targeting(self) -> str:
+        """Pasa a la siguiente estrategia de selección de objetivo."""
+        self.targeting = next_strategy(self.targeting)
+        return self.targeting
+
+    def shoot(self, target, now: float = 0.0, hits=None):
+        """Crea un proyectil que sigue a su objetivo (o lo intercepta, con ``hits``)"""
+        projectile = self.projectile_pool.acquire(
+            self.pos,
             target,
             damage=self.damage,
             speed=self.projectile_speed,
         )
+        if hits is not None:
+            flight, impact = solve_intercept(
+                self.pos, self.projectile_speed * settings.SPEED_REFERENCE_HZ, target
+            )
+            projectile.aim(impact, now, now + flight)
+            hits.schedule(projectile, self)
         self.projectiles.append(projectile)
-        print(f"Torre en {self.pos} disparó a enemigo en {target.pos}")
 
     def get_rect(self) -> pygame.Rect:
         if self.image is not None:
@@ -153,22 +256,30 @@ class Tower:
         cls._image_cache = remove_background(scaled)
         return cls._image_cache
 
-    def draw(self, surface, selected: bool = False):
+    def draw(
+        self,
+        surface,
+        selected: bool = False,
+        offset=(0, 0),
+        alpha: float = 1.0,
+        now: float | None = None,
+    ):
+        pos = (self.pos[0] + offset[0], self.pos[1] + offset[1])
         if self.image is not None:
-            rect = self.image.get_rect(center=self.pos)
+            rect = self.image.get_rect(center=pos)
             surface.blit(self.image, rect)
         else:
-            pygame.draw.circle(surface, settings.get_color("tower"), self.pos, 20)
+            pygame.draw.circle(surface, settings.get_color("tower"), pos, 20)
 
 
         # Dibujar rango de ataque (transparente)
-        pygame.draw.circle(surface, (80, 80, 150, 60), self.pos, self.range, 1)
+        pygame.draw.circle(surface, (80, 80, 150, 60), pos, self.range, 1)
         if selected:
             highlight_radius = max(24, self.get_rect().width // 2 + 6)
-            pygame.draw.circle(surface, (220, 220, 120), self.pos, highlight_radius, 2)
+            pygame.draw.circle(surface, (220, 220, 120), pos, highlight_radius, 2)
         # Dibujar proyectiles
         for p in self.projectiles:
-            p.draw(surface)
+            p.draw(surface, offset, alpha, now)
 
     @staticmethod
     def _resolve_type_config(tower_type: str) -> dict:
@@ -0,0 +1,272 @@
+# game/agent_env.py
+"""Entorno estilo Gym sobre las reglas de ``GameManager`` sin ventana.
+
+:class:`GameEnv` expone una partida de un nivel con la interfaz de Gymnasium
+(``reset``/``step``) para entrenar agentes:
+
+- **Acción**: un entero. ``0`` no hace nada; luego vienen, por casilla de
+  construcción, una acción por tipo de torre (construir) y, por casilla, una
+  por mejora de ``settings.TOWER_UPGRADES`` (mejorar la torre construida en
+  ella). Las acciones imposibles (casilla ocupada, sin dinero, mejora al
+  máximo) no hacen nada; :meth:`GameEnv.action_mask` indica cuáles son
+  válidas.
+- **Observación**: un ``ndarray`` ``float32`` con dinero, vidas, oleada,
+  enemigos pendientes y vivos y tiempo, seguido de un bloque por casilla:
+  ocupada, tipo de torre (one-hot), nivel de cada mejora y enemigos en las
+  casillas del mapa al alcance (del índice de objetivos).
+- **Tablero** (opcional, ``board=True``): ``env.board`` es un
+  :class:`game.observation.BoardTensors` del tamaño del mapa que se
+  actualiza tras cada ``reset`` y ``step``.
+- **Recompensa**: recompensa de los enemigos abatidos por ``kill_scale`` menos
+  ``leak_penalty`` por cada enemigo que llega al final.
+
+Cada ``step`` avanza ``ticks_per_step`` pasos fijos de simulación. Un
+episodio termina al perder o superar el nivel y se trunca tras
+``max_steps`` pasos. Si Gymnasium está instalado, la clase deriva de
+``gymnasium.Env`` y declara sus espacios; si no, ofrece la misma interfaz.
+Las versiones vectorizadas están en ``game.vector_env``.
+"""
+
+from __future__ import annotations
+
+import os
+
+import numpy as np
+
+try:
+    import gymnasium
+    from gymnasium import spaces
+except ImportError:  # Gymnasium es opcional: la interfaz es la misma
+    gymnasium = None
+    spaces = None
+
+from game import settings
+from game.events import EventType
+from game.observation import BoardTensors, board_size, map_shape
+from game.rng import RandomStreams
+
+GLOBAL_FEATURES = ("dinero", "vidas", "oleada", "pendientes", "vivos", "tiempo")
+
+
+def init_headless():
+    """Prepara pygame sin ventana (las imágenes necesitan un modo de video)."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    import pygame
+
+    pygame.init()
+    if pygame.display.get_surface() is None:
+        pygame.display.set_mode((1, 1))
+
+
+class GameEnv(gymnasium.Env if gymnasium is not None else object):
+    """Una partida de ``level`` controlada por acciones discretas."""
+
+    metadata = {"render_modes": ["rgb_array"]}
+
+    def __init__(
+        self,
+        level: int = 0,
+        ticks_per_step: int = 30,
+        max_steps: int = 10_000,
+        kill_scale: float = 0.01,
+        leak_penalty: float = 1.0,
+        projectile_mode: str | None = None,
+        level_cache=None,
+        seed: int | None = None,
+        board: bool = False,
+    ):
+        init_headless()
+        from game.game_manager import GameManager
+
+        self.level = level
+        self.ticks_per_step = ticks_per_step
+        self.max_steps = max_steps
+        self.kill_scale = kill_scale
+        self.leak_penalty = leak_penalty
+        self.game = GameManager(rng=RandomStreams(seed), level_cache=level_cache)
+        if projectile_mode is not None:
+            self.game.projectile_mode = projectile_mode
+        self.game.events.subscribe(EventType.KILL, self._on_kill)
+        self.game.events.subscribe(EventType.LEAK, self._on_leak)
+
+        self.tower_types = list(settings.TOWER_TYPES) or ["guardian"]
+        self.upgrade_keys = list(settings.TOWER_UPGRADES)
+        self.game.load_level(level)
+        self.num_spots = len(self.game.spots)
+        self.spot_size = 2 + len(self.tower_types) + len(self.upgrade_keys)
+        self.observation_size = len(GLOBAL_FEATURES) + self.num_spots * self.spot_size
+        self.num_actions = 1 + self.num_spots * (len(self.tower_types) + len(self.upgrade_keys))
+        self._spot_towers: list = [None] * self.num_spots
+        self._reward = 0.0
+        self.steps = 0
+        self.board = None
+        self.board_shape = map_shape(self.game.level_config["mapa"])
+        self.board_size = board_size(self.board_shape) if board else 0
+        if board:
+            self.board = BoardTensors(self.game, self.board_shape)
+            self.board.update()
+
+        if spaces is not None:
+            self.action_space = spaces.Discrete(self.num_actions)
+            self.observation_space = spaces.Box(
+                low=0.0, high=np.inf, shape=(self.observation_size,), dtype=np.float32
+            )
+
+    # ------------------------------------------------------------------
+    # Eventos de la partida
+    # ------------------------------------------------------------------
+    def _on_kill(self, event):
+        self._reward += event.value * self.kill_scale
+
+    def _on_leak(self, event):
+        self._reward -= self.leak_penalty
+
+    # ------------------------------------------------------------------
+    # Interfaz Gym
+    # ------------------------------------------------------------------
+    def reset(self, seed: int | None = None, options: dict | None = None, out=None):
+        """Reinicia el nivel; devuelve ``(observación, info)``.
+
+        Con ``seed`` se vuelven a sembrar los flujos aleatorios; sin ella
+        continúan, como al reintentar un nivel.
+        """
+        if gymnasium is not None:
+            super().reset(seed=seed)
+        game = self.game
+        if seed is not None:
+            game.rng.reseed(seed)
+        game.load_level(self.level)
+        self._spot_towers = [None] * self.num_spots
+        self._reward = 0.0
+        self.steps = 0
+        if self.board is not None:
+            self.board.update()
+        return self.observe(out), self._info()
+
+    def step(self, action: int, out=None):
+        """Aplica ``action`` y avanza; devuelve ``(obs, recompensa, terminado, truncado, info)``.
+
+        ``out`` es un arreglo opcional donde escribir la observación (lo usan
+        los entornos vectorizados para no copiar).
+        """
+        game = self.game
+        valid = self.apply_action(int(action))
+        self._reward = 0.0
+        dt = 1.0 / settings.SIMULATION_HZ
+        for _ in range(self.ticks_per_step):
+            game.update(dt)
+            if game.state != "playing":
+                break
+        self.steps += 1
+        if self.board is not None:
+            self.board.update()
+        terminated = game.state != "playing"
+        truncated = not terminated and self.steps >= self.max_steps
+        info = self._info()
+        info["action_valid"] = valid
+        return self.observe(out), self._reward, terminated, truncated, info
+
+    def render(self):
+        """Imagen RGB (alto × ancho × 3) de la partida en curso."""
+        import pygame
+
+        surface = pygame.Surface((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT))
+        self.game.draw(surface)
+        return np.transpose(pygame.surfarray.array3d(surface), (1, 0, 2))
+
+    def close(self):
+        pass
+
+    # ------------------------------------------------------------------
+    # Acciones
+    # ------------------------------------------------------------------
+    def decode_action(self, action: int) -> tuple[str, int, str] | None:
+        """``("build", casilla, tipo)``, ``("upgrade", casilla, mejora)`` o ``None``."""
+        if action <= 0 or action >= self.num_actions:
+            return None
+        action -= 1
+        builds = self.num_spots * len(self.tower_types)
+        if action < builds:
+            spot, kind = divmod(action, len(self.tower_types))
+            return "build", spot, self.tower_types[kind]
+        spot, kind = divmod(action - builds, len(self.upgrade_keys))
+        return "upgrade", spot, self.upgrade_keys[kind]
+
+    def apply_action(self, action: int) -> bool:
+        """Ejecuta ``action``; devuelve si tuvo efecto."""
+        decoded = self.decode_action(action)
+        if decoded is None:
+            return action == 0
+        kind, spot_index, key = decoded
+        game = self.game
+        if kind == "build":
+            tower = game.build_tower(game.spots[spot_index], key)
+            if tower is None:
+                return False
+            self._spot_towers[spot_index] = tower
+            return True
+        tower = self._spot_towers[spot_index]
+        return tower is not None and game.upgrade_tower(tower, key)
+
+    def action_mask(self, out=None) -> np.ndarray:
+        """Arreglo booleano con las acciones que tendrían efecto ahora."""
+        mask = out if out is not None else np.zeros(self.num_actions, dtype=bool)
+        mask[:] = False
+        mask[0] = True
+        money = self.game.money
+        types = len(self.tower_types)
+        builds = 1 + self.num_spots * types
+        costs = [
+            settings.TOWER_TYPES.get(key, {}).get("cost", settings.TOWER_COST)
+            for key in self.tower_types
+        ]
+        upgrade_costs = [settings.TOWER_UPGRADES[key].get("cost", 0) for key in self.upgrade_keys]
+        for index, spot in enumerate(self.game.spots):
+            if not spot.occupied:
+                for kind, cost in enumerate(costs):
+                    mask[1 + index * types + kind] = money >= cost
+            tower = self._spot_towers[index]
+            if tower is not None:
+                base = builds + index * len(self.upgrade_keys)
+                for kind, key in enumerate(self.upgrade_keys):
+                    mask[base + kind] = money >= upgrade_costs[kind] and tower.can_upgrade(key)
+        return mask
+
+    # ------------------------------------------------------------------
+    # Observaciones
+    # ------------------------------------------------------------------
+    def observe(self, out=None) -> np.ndarray:
+        """Escribe la observación en ``out`` (o en un arreglo nuevo) y la devuelve."""
+        obs = out if out is not None else np.empty(self.observation_size, dtype=np.float32)
+        game = self.game
+        obs[0] = game.money
+        obs[1] = game.lives
+        obs[2] = game.wave
+        obs[3] = max(0, game.enemies_per_wave - game.spawned_in_wave)
+        # Los abatidos salen del índice al instante (de la lista, un tick después)
+        obs[4] = len(game.enemy_index)
+        obs[5] = game.elapsed
+
+        spots = obs[len(GLOBAL_FEATURES):].reshape(self.num_spots, self.spot_size)
+        spots[:] = 0.0
+        types = len(self.tower_types)
+        index = game.enemy_index
+        buckets = index.buckets
+        for spot_index, spot in enumerate(game.spots):
+            row = spots[spot_index]
+            tower = self._spot_towers[spot_index]
+            reach = settings.TOWER_RANGE
+            if tower is not None:
+                row[0] = 1.0
+                if tower.type_key in self.tower_types:
+                    row[1 + self.tower_types.index(tower.type_key)] = 1.0
+                for kind, key in enumerate(self.upgrade_keys):
+                    row[1 + types + kind] = tower.get_upgrade_level(key)
+                reach = tower.range
+            row[-1] = sum(len(buckets[cell]) for _, cell in index.coverage(spot.pos, reach))
+        return obs
+
+    def _info(self) -> dict:
+        game = self.game
+        return {"state": game.state, "wave": game.wave, "money": game.money, "lives": game.lives}
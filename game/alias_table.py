@@ -0,0 +1,104 @@
+# game/alias_table.py
+"""Muestreo ponderado con el método de alias de Walker (variante de Vose).
+
+Los pesos de ``CONFIG_NIVEL_N['enemigos']`` (campo ``peso``) se compilan una
+vez por nivel en una :class:`AliasTable`. Cada extracción cuesta O(1): un
+único número uniforme elige una columna y decide entre su índice y su alias.
+Para una oleada completa, :meth:`AliasTable.draw_many` hace lo mismo de forma
+vectorizada con un ``numpy.random.Generator``.
+
+La misma tabla la usan el juego (``GameManager`` y ``WaveSchedule``) y el
+motor de SimPy multiclase (``EnemyGenerator``).
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Sequence
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: ``draw_many`` acepta random.Random
+    np = None
+
+
+class AliasTable:
+    """Tabla de alias para elegir índices ``0..n-1`` según ``weights``.
+
+    Pesos negativos cuentan como cero; si ninguno es positivo, la elección es
+    uniforme (igual que ``random.choices`` sin pesos).
+    """
+
+    __slots__ = ("size", "prob", "alias", "_prob_np", "_alias_np")
+
+    def __init__(self, weights: Sequence[float]):
+        weights = [max(0.0, float(w)) for w in weights]
+        size = len(weights)
+        if size == 0:
+            raise ValueError("La tabla de alias necesita al menos un peso")
+        total = sum(weights)
+        if total <= 0:
+            weights = [1.0] * size
+            total = float(size)
+
+        # Probabilidades escaladas para que la media sea 1
+        scaled = [w * size / total for w in weights]
+        prob = [1.0] * size
+        alias = list(range(size))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            less = small.pop()
+            more = large.pop()
+            prob[less] = scaled[less]
+            alias[less] = more
+            # La columna grande cede lo que le falta a la pequeña
+            scaled[more] = (scaled[more] + scaled[less]) - 1.0
+            (small if scaled[more] < 1.0 else large).append(more)
+        # Lo que queda en cualquiera de las listas vale 1 salvo error de redondeo
+
+        self.size = size
+        self.prob = prob
+        self.alias = alias
+        self._prob_np = None
+        self._alias_np = None
+
+    @classmethod
+    def from_tiers(cls, tiers: Sequence[dict]) -> "AliasTable | None":
+        """Tabla para los tipos de enemigo de un nivel (``None`` si no hay tipos)."""
+        if not tiers:
+            return None
+        return cls([tier.get("peso", 1.0) for tier in tiers])
+
+    def __len__(self) -> int:
+        return self.size
+
+    def probabilities(self) -> list[float]:
+        """Probabilidad de cada índice reconstruida a partir de la tabla."""
+        result = [0.0] * self.size
+        for i, (p, a) in enumerate(zip(self.prob, self.alias)):
+            result[i] += p / self.size
+            result[a] += (1.0 - p) / self.size
+        return result
+
+    def draw(self, rng: random.Random) -> int:
+        """Un índice en O(1) consumiendo un solo ``rng.random()``."""
+        u = rng.random() * self.size
+        i = int(u)
+        return i if u - i < self.prob[i] else self.alias[i]
+
+    def draw_many(self, rng, count: int):
+        """``count`` índices de una vez.
+
+        Con un ``numpy.random.Generator`` devuelve un ``ndarray`` calculado en
+        bloque; con un ``random.Random`` devuelve una lista.
+        """
+        if np is not None and isinstance(rng, np.random.Generator):
+            if self._prob_np is None:
+                self._prob_np = np.asarray(self.prob)
+                self._alias_np = np.asarray(self.alias, dtype=np.intp)
+            u = rng.random(count) * self.size
+            columns = u.astype(np.intp)
+            return np.where(u - columns < self._prob_np[columns], columns, self._alias_np[columns])
+        draw = self.draw
+        return [draw(rng) for _ in range(count)]
@@ -0,0 +1,128 @@
+# game/ballistics.py
+"""Proyectiles de intercepción analítica con impactos programados.
+
+En el modo ``"intercept"`` (``settings.PROJECTILE_MODE``) un disparo no
+persigue a su objetivo frame a frame. Al disparar se calcula en qué instante
+y punto un proyectil en línea recta alcanza al enemigo, suponiendo que este
+sigue su camino (o el campo de flujo) a velocidad constante, y el impacto se
+guarda en un montículo ordenado por tiempo (:class:`HitScheduler`). En cada
+tick solo se resuelven los impactos vencidos; la posición del proyectil se
+calcula únicamente al dibujarlo. Así el coste por frame de los proyectiles es
+casi nulo y las ejecuciones sin ventana no los avanzan nunca.
+
+El daño se aplica en el instante programado si el objetivo sigue en juego
+(el mismo enemigo, vivo y sin haber escapado); si no, el proyectil se pierde.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+
+from game import settings
+
+HOMING_MODE = "homing"
+INTERCEPT_MODE = "intercept"
+
+# Tramos del recorrido del enemigo que se examinan como máximo por disparo
+MAX_SEGMENTS = 64
+
+
+def _first_root(a: float, b: float, c: float, limit: float) -> float | None:
+    """Menor raíz de ``a·τ² + b·τ + c`` dentro de ``[0, limit]``."""
+    if c <= 0:
+        return 0.0
+    if abs(a) < 1e-12:
+        if b == 0:
+            return None
+        root = -c / b
+        return root if 0 <= root <= limit else None
+    disc = b * b - 4 * a * c
+    if disc < 0:
+        return None
+    sq = math.sqrt(disc)
+    r1 = (-b - sq) / (2 * a)
+    r2 = (-b + sq) / (2 * a)
+    for root in (r1, r2) if r1 <= r2 else (r2, r1):
+        if 0 <= root <= limit:
+            return root
+    return None
+
+
+def solve_intercept(origin, speed: float, enemy) -> tuple[float, tuple[float, float]]:
+    """Tiempo de vuelo y punto de impacto de un disparo desde ``origin``.
+
+    ``speed`` está en píxeles por segundo. El enemigo se modela recorriendo
+    sus próximos puntos de paso a ``speed`` constante; en cada tramo se
+    resuelve ``|E(t) - origin| = speed·t``. Si no hay intercepción (el enemigo
+    escapa antes) se apunta al último punto examinado.
+    """
+    ox, oy = origin
+    ax, ay = enemy.pos
+    enemy_speed = enemy.speed * settings.SPEED_REFERENCE_HZ
+    s2 = speed * speed
+    t0 = 0.0
+    for segment, (bx, by) in enumerate(enemy.waypoints()):
+        if segment >= MAX_SEGMENTS:
+            break
+        length = math.hypot(bx - ax, by - ay)
+        if length > 0 and enemy_speed > 0:
+            duration = length / enemy_speed
+            ux = (bx - ax) / length * enemy_speed
+            uy = (by - ay) / length * enemy_speed
+            wx, wy = ax - ox, ay - oy
+            tau = _first_root(
+                enemy_speed * enemy_speed - s2,
+                2 * (wx * ux + wy * uy - s2 * t0),
+                wx * wx + wy * wy - s2 * t0 * t0,
+                duration,
+            )
+            if tau is not None:
+                return t0 + tau, (ax + ux * tau, ay + uy * tau)
+            t0 += duration
+        ax, ay = bx, by
+    return math.hypot(ax - ox, ay - oy) / speed if speed > 0 else 0.0, (ax, ay)
+
+
+class HitScheduler:
+    """Montículo de impactos pendientes ordenado por instante de impacto."""
+
+    def __init__(self):
+        self._heap: list = []
+        self._seq = 0
+        self.scheduled = 0
+        self.landed = 0
+        self.missed = 0
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def clear(self):
+        self._heap.clear()
+
+    def schedule(self, projectile, tower):
+        # La secuencia desempata impactos simultáneos en orden de disparo
+        self._seq += 1
+        heapq.heappush(self._heap, (projectile.hit_time, self._seq, projectile, tower))
+        self.scheduled += 1
+
+    @property
+    def next_time(self) -> float:
+        return self._heap[0][0] if self._heap else float("inf")
+
+    def resolve(self, now: float, events=None) -> int:
+        """Aplica los impactos con instante ``<= now``; devuelve cuántos acertaron."""
+        heap = self._heap
+        landed = 0
+        while heap and heap[0][0] <= now:
+            _, _, projectile, tower = heapq.heappop(heap)
+            if not projectile.alive:
+                continue
+            # La torre retira el proyectil de su lista en su próximo update
+            tower.spent_projectiles += 1
+            if projectile.land(events, tower):
+                landed += 1
+            else:
+                self.missed += 1
+        self.landed += landed
+        return landed
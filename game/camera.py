@@ -0,0 +1,203 @@
+# game/camera.py
+"""Cámara 2D (desplazamiento y zoom) y terreno dividido en bloques.
+
+Las coordenadas del mundo son las mismas píxeles que ya usan enemigos, torres
+y casillas (incluido ``map_offset``). La cámara define qué rectángulo del
+mundo se ve en pantalla:
+
+- Con zoom 1 el mundo se dibuja directamente sobre la pantalla desplazado.
+- Con otro zoom se dibuja la región visible en una superficie intermedia del
+  tamaño ``viewport / zoom`` y se escala una sola vez.
+
+En ambos casos solo se dibujan los elementos y bloques de terreno que caen
+dentro de la vista, así que el coste depende del tamaño de la pantalla y no
+del mapa.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import OrderedDict
+
+import pygame
+
+from game import settings
+
+
+class Camera:
+    """Vista de la porción visible del mundo."""
+
+    def __init__(self, viewport: tuple[int, int] | None = None):
+        if viewport is None:
+            viewport = (settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT)
+        self.width, self.height = viewport
+        self.x = 0.0
+        self.y = 0.0
+        self.zoom = 1.0
+        self.bounds = pygame.Rect(0, 0, self.width, self.height)
+
+    # ------------------------------------------------------------------
+    # Configuración
+    # ------------------------------------------------------------------
+    def set_world(self, world_rect: pygame.Rect):
+        """Ajusta los límites al mapa cargado y vuelve a la vista inicial.
+
+        Los límites incluyen siempre la pantalla completa, de modo que los
+        mapas que caben en ella se ven exactamente igual que sin cámara.
+        """
+        self.bounds = pygame.Rect(world_rect).union(pygame.Rect(0, 0, self.width, self.height))
+        self.reset()
+
+    def reset(self):
+        self.x = float(self.bounds.left)
+        self.y = float(self.bounds.top)
+        self.zoom = 1.0
+        self.clamp()
+
+    def set_view(self, x: float, y: float, zoom: float):
+        self.x = float(x)
+        self.y = float(y)
+        self.zoom = max(settings.CAMERA_MIN_ZOOM, min(settings.CAMERA_MAX_ZOOM, float(zoom)))
+        self.clamp()
+
+    @property
+    def view_size(self) -> tuple[float, float]:
+        """Tamaño en píxeles del mundo de la región visible."""
+        return self.width / self.zoom, self.height / self.zoom
+
+    def clamp(self):
+        view_w, view_h = self.view_size
+        bounds = self.bounds
+        if view_w >= bounds.width:
+            self.x = bounds.centerx - view_w / 2
+        else:
+            self.x = max(bounds.left, min(bounds.right - view_w, self.x))
+        if view_h >= bounds.height:
+            self.y = bounds.centery - view_h / 2
+        else:
+            self.y = max(bounds.top, min(bounds.bottom - view_h, self.y))
+
+    # ------------------------------------------------------------------
+    # Controles
+    # ------------------------------------------------------------------
+    def pan(self, dx: float, dy: float):
+        """Desplaza la vista ``dx``, ``dy`` píxeles de pantalla."""
+        self.x += dx / self.zoom
+        self.y += dy / self.zoom
+        self.clamp()
+
+    def zoom_at(self, factor: float, screen_pos: tuple[int, int]):
+        """Cambia el zoom manteniendo fijo el punto del mundo bajo ``screen_pos``."""
+        anchor = self.screen_to_world(screen_pos)
+        self.zoom = max(settings.CAMERA_MIN_ZOOM, min(settings.CAMERA_MAX_ZOOM, self.zoom * factor))
+        self.x = anchor[0] - screen_pos[0] / self.zoom
+        self.y = anchor[1] - screen_pos[1] / self.zoom
+        self.clamp()
+
+    # ------------------------------------------------------------------
+    # Conversión y visibilidad
+    # ------------------------------------------------------------------
+    @property
+    def offset(self) -> tuple[int, int]:
+        """Desplazamiento entero que convierte mundo en coordenadas de la vista."""
+        return -int(math.floor(self.x)), -int(math.floor(self.y))
+
+    def view_rect(self) -> pygame.Rect:
+        """Rectángulo del mundo visible (en píxeles del mundo)."""
+        view_w, view_h = self.view_size
+        left = int(math.floor(self.x))
+        top = int(math.floor(self.y))
+        return pygame.Rect(left, top, int(math.ceil(view_w)) + 1, int(math.ceil(view_h)) + 1)
+
+    def world_to_screen(self, pos) -> tuple[int, int]:
+        return (
+            int(round((pos[0] - self.x) * self.zoom)),
+            int(round((pos[1] - self.y) * self.zoom)),
+        )
+
+    def screen_to_world(self, pos) -> tuple[float, float]:
+        return pos[0] / self.zoom + self.x, pos[1] / self.zoom + self.y
+
+
+class TerrainChunks:
+    """Terreno estático pre-renderizado por bloques bajo demanda.
+
+    Cada bloque cubre ``chunk_tiles`` x ``chunk_tiles`` casillas y se dibuja la
+    primera vez que entra en la vista. Los bloques se conservan en una caché
+    LRU, de modo que la memoria queda acotada aunque el mapa sea enorme.
+    """
+
+    def __init__(
+        self,
+        tiles,
+        map_offset: tuple[int, int],
+        map_size: tuple[int, int],
+        tile_size: int = settings.TILE_SIZE,
+        chunk_tiles: int = settings.TERRAIN_CHUNK_TILES,
+        max_cached: int = settings.TERRAIN_CHUNK_CACHE,
+    ):
+        self.offset = map_offset
+        self.size = map_size
+        self.chunk_px = tile_size * chunk_tiles
+        self.columns = max(1, math.ceil(map_size[0] / self.chunk_px))
+        self.rows = max(1, math.ceil(map_size[1] / self.chunk_px))
+        self.max_cached = max_cached
+        self._cache: OrderedDict[tuple[int, int], pygame.Surface] = OrderedDict()
+
+        # Tiles agrupados por bloque (posiciones relativas al mapa)
+        self._tiles: dict[tuple[int, int], list[tuple[pygame.Surface, tuple[int, int]]]] = {}
+        ox, oy = map_offset
+        for tile in tiles:
+            x = tile.rect.x - ox
+            y = tile.rect.y - oy
+            key = (x // self.chunk_px, y // self.chunk_px)
+            self._tiles.setdefault(key, []).append(
+                (tile.image, (x % self.chunk_px, y % self.chunk_px))
+            )
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    @property
+    def cached_bytes(self) -> int:
+        return sum(s.get_width() * s.get_height() * s.get_bytesize() for s in self._cache.values())
+
+    def _chunk(self, key: tuple[int, int]) -> pygame.Surface:
+        surface = self._cache.get(key)
+        if surface is not None:
+            self._cache.move_to_end(key)
+            return surface
+
+        width = min(self.chunk_px, self.size[0] - key[0] * self.chunk_px)
+        height = min(self.chunk_px, self.size[1] - key[1] * self.chunk_px)
+        surface = pygame.Surface((width, height)).convert()
+        surface.blits(self._tiles.get(key, ()), doreturn=False)
+        self._cache[key] = surface
+        while len(self._cache) > self.max_cached:
+            self._cache.popitem(last=False)
+        return surface
+
+    def visible_chunks(self, view: pygame.Rect):
+        """Índices ``(col, fila)`` de los bloques que intersectan ``view``."""
+        ox, oy = self.offset
+        first_col = max(0, (view.left - ox) // self.chunk_px)
+        last_col = min(self.columns - 1, (view.right - 1 - ox) // self.chunk_px)
+        first_row = max(0, (view.top - oy) // self.chunk_px)
+        last_row = min(self.rows - 1, (view.bottom - 1 - oy) // self.chunk_px)
+        for row in range(first_row, last_row + 1):
+            for col in range(first_col, last_col + 1):
+                yield col, row
+
+    def draw(self, surface: pygame.Surface, view: pygame.Rect, offset: tuple[int, int] = (0, 0)):
+        keys = list(self.visible_chunks(view))
+        # La caché debe poder contener al menos todo lo visible
+        self.max_cached = max(self.max_cached, 2 * len(keys))
+        base_x = self.offset[0] + offset[0]
+        base_y = self.offset[1] + offset[1]
+        surface.blits(
+            [
+                (self._chunk(key), (base_x + key[0] * self.chunk_px, base_y + key[1] * self.chunk_px))
+                for key in keys
+            ],
+            doreturn=False,
+        )
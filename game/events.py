@@ -0,0 +1,104 @@
+# game/events.py
+"""Bus de eventos en proceso para la partida.
+
+Los sistemas de simulación (enemigos, torres, oleadas) publican lo que
+ocurre con :meth:`EventBus.emit` y los interesados (economía, métricas,
+trazas, interfaz) se suscriben por tipo de evento, en lugar de volver a
+recorrer las listas de entidades para descubrirlo.
+
+Los eventos se acumulan durante el tick y se entregan juntos, en orden de
+emisión, con :meth:`EventBus.dispatch` al final de ``GameManager.update``.
+Los registros se reservan de antemano y se reutilizan en cada tick: un
+manejador no debe guardar el objeto :class:`Event` que recibe, sino copiar los
+campos que necesite.
+"""
+
+from __future__ import annotations
+
+from enum import IntEnum
+
+
+class EventType(IntEnum):
+    SPAWN = 0        # entity: enemigo creado
+    KILL = 1         # entity: enemigo abatido, value: recompensa
+    LEAK = 2         # entity: enemigo que llegó al final
+    SHOT = 3         # entity: objetivo, source: torre
+    HIT = 4          # entity: objetivo, source: torre, value: daño
+    WAVE_START = 5   # value: número de oleada
+    LEVEL_END = 6    # value: 1 si se superó el nivel, 0 si fue derrota
+
+
+class Event:
+    """Registro reutilizable de un evento."""
+
+    __slots__ = ("type", "time", "entity", "source", "value")
+
+    def __init__(self):
+        self.type = EventType.SPAWN
+        self.time = 0.0
+        self.entity = None
+        self.source = None
+        self.value = 0.0
+
+
+class EventBus:
+    """Cola de eventos del tick con entrega por lotes a los suscriptores."""
+
+    def __init__(self, capacity: int = 256):
+        self._records = [Event() for _ in range(capacity)]
+        self._count = 0
+        self._handlers: list[list] = [[] for _ in EventType]
+        # Reloj que se asigna a cada evento emitido (tiempo de simulación)
+        self.time = 0.0
+        self.dispatched = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def subscribe(self, event_type: EventType, handler):
+        """Registra ``handler(event)`` para los eventos de ``event_type``."""
+        self._handlers[event_type].append(handler)
+
+    def unsubscribe(self, event_type: EventType, handler):
+        handlers = self._handlers[event_type]
+        if handler in handlers:
+            handlers.remove(handler)
+
+    def emit(self, event_type: EventType, entity=None, source=None, value: float = 0.0):
+        records = self._records
+        if self._count == len(records):
+            # Se duplica la reserva en lugar de crear un registro por evento
+            records.extend(Event() for _ in range(len(records)))
+        event = records[self._count]
+        self._count += 1
+        event.type = event_type
+        event.time = self.time
+        event.entity = entity
+        event.source = source
+        event.value = value
+
+    def dispatch(self) -> int:
+        """Entrega los eventos pendientes en orden de emisión y vacía la cola.
+
+        Los manejadores pueden emitir nuevos eventos; se entregan en esta misma
+        llamada, a continuación de los existentes.
+        """
+        handlers = self._handlers
+        records = self._records
+        index = 0
+        while index < self._count:
+            event = records[index]
+            for handler in handlers[event.type]:
+                handler(event)
+            index += 1
+        self.clear()
+        self.dispatched += index
+        return index
+
+    def clear(self):
+        """Descarta los eventos pendientes sin entregarlos."""
+        for event in self._records[: self._count]:
+            # No retener entidades ya eliminadas hasta el próximo uso del registro
+            event.entity = None
+            event.source = None
+        self._count = 0
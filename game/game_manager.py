@@ -1,25 +1,38 @@
 # game/game_manager.py
-import random
+import logging
+import math
+import time
 from typing import List, Optional
 from pathlib import Path
 
 import pygame
 
-from game import settings
+from game import settings, snapshot
+from game.ballistics import INTERCEPT_MODE, HitScheduler
+from game.camera import Camera, TerrainChunks
+from game.events import EventBus, EventType
+from game.observation import BoardTensors
+from game.queue_stats import LiveQueueStats
+from game.rng import RandomStreams
+from game.targeting import EnemyIndex
+from game.tower_scheduler import TowerScheduler
+from game.wave_schedule import WaveSchedule
 from entities.enemy import Enemy
+from entities.projectile import Projectile
 from entities.tower import Tower
 from entities.build_spot import BuildSpot
 from utils.ui_panel import MetricsPanel
+from utils.frame_profiler import FrameProfiler
+from utils.helpers import compact
+from utils.pool import ObjectPool
+from game.level_cache import LevelCache
 from maps import LEVELS
-from maps.map_utils import (
-    TILE_SIZE,
-    convertir_camino_a_pixeles,
-    dimensiones_mapa,
-    obtener_posiciones_por_tipo,
-)
+
+# Avisos de la partida (niveles, oleadas); main.py los muestra por consola
+log = logging.getLogger(__name__)
 
 class GameManager:
-    def __init__(self):
+    def __init__(self, rng: RandomStreams | None = None, level_cache: LevelCache | None = None):
         pygame.font.init()
         self.font = pygame.font.SysFont("Arial", 24)
         self.title_font = pygame.font.SysFont("Arial", 48, bold=True)
@@ -28,24 +41,65 @@ class GameManager:
         self.description_font = pygame.font.SysFont("Arial", 20)
 
 
+        # Flujos aleatorios independientes por subsistema (llegadas, tipos,
+        # caminos y estadísticas de enemigos).
+        self.rng = rng if rng is not None else RandomStreams()
+
         # Estado general
-        self.levels = LEVELS
+        self.levels = level_cache.levels if level_cache is not None else LEVELS
+        # Niveles compilados; puede compartirse entre varias instancias
+        self.level_cache = level_cache if level_cache is not None else LevelCache(self.levels)
         self.state: str = "menu"
         self.current_level_index: Optional[int] = None
         self.level_config = None
+        # Estado inicial del nivel en curso, usado para reiniciar sin recargarlo
+        self._level_start_snapshot: bytes | None = None
 
         # Elementos del mapa
         self.tiles: Optional[pygame.sprite.Group] = None
+        self.terrain: Optional[TerrainChunks] = None
         self.map_offset = (0, 0)
+        # Vista del mundo; con zoom distinto de 1 se dibuja en ``_world_view``
+        self.camera = Camera()
+        self._world_view: Optional[pygame.Surface] = None
         self.paths: List[List[tuple[int, int]]] = []
+        self.flow_field = None
         self.spots: List[BuildSpot] = []
         self.towers: List[Tower] = []
         self.enemies: List[Enemy] = []
+        # Enemigos por casilla, para que las torres elijan objetivo
+        self.enemy_index = EnemyIndex()
         self.enemy_tiers: List[dict] = []
+        self.tier_table = None
 
         # Control de oleadas
+        # Tiempo desde el inicio de la oleada y calendario de apariciones
         self.spawn_timer = 0.0
-        self.enemy_interval = 0.0
+        self.wave_schedule = WaveSchedule()
+        # Enemigos reutilizables; los que salen de la lista en un tick vuelven
+        # a la reserva cuando ya se entregaron sus eventos.
+        self.enemy_pool = ObjectPool(Enemy, settings.ENEMY_POOL_SIZE)
+        # Proyectiles de todas las torres de esta partida
+        self.projectile_pool = ObjectPool(Projectile, settings.PROJECTILE_POOL_SIZE)
+        self._retired_enemies: List[Enemy] = []
+        # Impactos programados de los proyectiles en modo intercepción
+        self.projectile_mode = settings.PROJECTILE_MODE
+        self.hits = HitScheduler()
+        # Despertares de las torres (recarga o enemigos al alcance)
+        self.tower_scheduler = TowerScheduler()
+        self.elapsed = 0.0  # tiempo de simulación del nivel en curso
+        # Tiempo real pendiente de simular y fracción de paso para interpolar
+        self.sim_accumulator = 0.0
+        self.render_alpha = 1.0
+        # Volcado del tablero a arreglos NumPy en cada tick (ver export_board)
+        self.board_tensors: BoardTensors | None = None
+
+        # Eventos de la simulación; la economía se actualiza al despacharlos
+        self.events = EventBus()
+        self.events.subscribe(EventType.KILL, self._on_enemy_killed)
+        self.events.subscribe(EventType.LEAK, self._on_enemy_leaked)
+        # λ, μ, L y W medidos a partir de los eventos de la partida
+        self.queue_stats = LiveQueueStats(self.events)
         self.wave = 0
         self.target_waves = 0
         self.enemies_per_wave = 0
@@ -53,10 +107,14 @@ class GameManager:
         self.wave_active = False
         self.lambda_base = settings.LAMBDA_RATE
 
-        # Recursos y dificultad
+        # Recursos y dificultad (valores de menú hasta cargar un nivel)
         self.money = settings.STARTING_MONEY
+        self.lives = settings.MAX_LIVES
+        self.speed_multiplier = 1.0
+        self.health_multiplier = 1.0
         self.total_spawned = 0
-        self.metrics_panel = MetricsPanel(self.font)
+        self.profiler = FrameProfiler()
+        self.metrics_panel = MetricsPanel(self.small_font, on_export=self.export_frame_timings)
         self.wave_speed_growth = 1.0
         self.wave_health_growth = 1.0
 
@@ -92,8 +150,9 @@ class GameManager:
 
         inner_width = button_width - horizontal_padding * 2
         for idx, level in enumerate(self.levels):
-            config = level["config"]
-            subtitle = self._format_level_summary(config)
+            # Los niveles en archivo dan sus datos de menú sin leer el mapa
+            info = level.get("info") or level["config"]
+            subtitle = self._format_level_summary(info)
             subtitle_lines = self._wrap_text(
                 self.description_font, subtitle, inner_width
             ) if subtitle else []
@@ -115,7 +174,7 @@ class GameManager:
 
             layout_data.append(
                 {
-                    "config": config,
+                    "info": info,
                     "index": idx,
                     "subtitle": subtitle,
                     "subtitle_lines": subtitle_lines,
@@ -140,7 +199,7 @@ class GameManager:
             height = item["height"]
             center = (center_x, int(current_top + height / 2))
             button = self._make_button(
-                item["config"]["nombre"],
+                item["info"]["nombre"],
                 center,
                 lambda index=item["index"]: self.load_level(index),
                 level_index=item["index"],
@@ -183,42 +242,31 @@ class GameManager:
         level_entry = self.levels[index]
         self.level_config = level_entry["config"]
 
-        # Construcción visual del mapa
-        self.tiles, raw_paths = level_entry["creator"]()
-        mapa = self.level_config["mapa"]
-        map_width, map_height = dimensiones_mapa(mapa)
-        offset_x = max(0, (settings.SCREEN_WIDTH - map_width) // 2)
-        offset_y = max(0, (settings.SCREEN_HEIGHT - map_height) // 2)
-        self.map_offset = (offset_x, offset_y)
-
-        if self.tiles:
-            for tile in self.tiles:
-                tile.rect.x += offset_x
-                tile.rect.y += offset_y
-
-        self.paths = [convertir_camino_a_pixeles(camino, self.map_offset) for camino in raw_paths if camino]
-        if not self.paths:
-            fallback = obtener_posiciones_por_tipo(mapa, 1)
-            if fallback:
-                self.paths = [convertir_camino_a_pixeles(fallback, self.map_offset)]
-
-        build_coords = obtener_posiciones_por_tipo(mapa, 2)
-        self.spots = [
-            BuildSpot(
-                (
-                    col * TILE_SIZE + TILE_SIZE // 2 + offset_x,
-                    fila * TILE_SIZE + TILE_SIZE // 2 + offset_y,
-                )
-            )
-            for col, fila in build_coords
-        ]
-        for spot in self.spots:
-            spot.occupied = False
+        # Tiles, terreno, caminos, casillas y tipos de enemigo se compilan una
+        # sola vez por nivel y se reutilizan en reinicios y cambios de nivel.
+        compiled = self.level_cache.get(index)
+        self.tiles = compiled.tiles
+        self.terrain = compiled.terrain
+        self.map_offset = compiled.map_offset
+        self.camera.set_world(pygame.Rect(compiled.map_offset, compiled.map_size))
+        self.paths = compiled.paths
+        self.flow_field = compiled.flow_field
+        self.spots = [BuildSpot(pos) for pos in compiled.spot_positions]
 
         # Reinicio de estado jugable
+        self.release_entities()
         self.towers = []
-        self.enemies = []
+        self.enemy_index = EnemyIndex(
+            compiled.map_offset, compiled.map_size, compiled.paths, compiled.flow_field
+        )
         self.spawn_timer = 0.0
+        self.elapsed = 0.0
+        self.sim_accumulator = 0.0
+        self.render_alpha = 1.0
+        self.events.clear()
+        self.queue_stats.reset()
+        self.hits.clear()
+        self.tower_scheduler.clear()
         multipliers = self.level_config.get("multiplicadores", {})
         self.speed_multiplier = multipliers.get("velocidad", 1.0)
         self.health_multiplier = multipliers.get("salud", 1.0)
@@ -227,15 +275,13 @@ class GameManager:
         crecimiento = self.level_config.get("crecimiento_oleada", {})
         self.wave_speed_growth = crecimiento.get("velocidad", 1.05)
         self.wave_health_growth = crecimiento.get("salud", 1.1)
-        available_sprite_sets = self._get_available_sprite_sets()
-        self.enemy_tiers = self._prepare_enemy_tiers(
-            self.level_config.get("enemigos", []), available_sprite_sets
-        )
-        self.enemy_interval = random.expovariate(self.lambda_base)
+        self.enemy_tiers = compiled.enemy_tiers
+        self.tier_table = compiled.tier_table
         self.wave = 1
         self.target_waves = self.level_config.get("oleadas_victoria", 5)
         self.enemies_per_wave = 6 + index * 2
         self.spawned_in_wave = 0
+        self._schedule_wave()
         self.wave_active = True
         self.money = self.level_config.get("dinero_inicial", settings.STARTING_MONEY)
         self.total_spawned = 0
@@ -249,11 +295,32 @@ class GameManager:
         self._wave_was_active = True
         self.pause_button["text"] = "Menú"
         self.state = "playing"
-        print(f"--- Inicia Nivel {index + 1}: {self.level_config['nombre']} ---")
+        self._level_start_snapshot = snapshot.capture(self, include_rng=False)
+        log.info("--- Inicia Nivel %d: %s ---", index + 1, self.level_config["nombre"])
 
     def restart_level(self):
-        if self.current_level_index is not None:
+        if self.current_level_index is None:
+            return
+        if self._level_start_snapshot is None:
             self.load_level(self.current_level_index)
+            return
+        # Restaurar el estado inicial evita reconstruir tiles, caminos y
+        # casillas. Los flujos aleatorios continúan para que el reintento no
+        # sea una copia exacta del intento anterior.
+        self.metrics_panel.visible = False
+        snapshot.restore(self, self._level_start_snapshot, restore_rng=False)
+        self._schedule_wave()
+        log.info(
+            "--- Reinicia Nivel %d: %s ---", self.current_level_index + 1, self.level_config["nombre"]
+        )
+
+    def save_snapshot(self, path) -> Path:
+        """Guarda la partida en curso (incluido el estado aleatorio) en ``path``."""
+        return snapshot.save(self, path)
+
+    def load_snapshot(self, path):
+        """Restaura una partida guardada con :meth:`save_snapshot`."""
+        snapshot.load(self, path)
 
     def enter_pause_menu(self):
         if self.state != "playing":
@@ -292,15 +359,23 @@ class GameManager:
         self.state = "menu"
         self.current_level_index = None
         self.level_config = None
+        self._level_start_snapshot = None
         self.tiles = None
+        self.terrain = None
+        self.camera.set_world(pygame.Rect(0, 0, 0, 0))
         self.paths = []
+        self.flow_field = None
         self.spots = []
+        self.release_entities()
         self.towers = []
-        self.enemies = []
+        self.enemy_index = EnemyIndex()
         self.wave = 0
         self.target_waves = 0
         self.enemies_per_wave = 0
         self.spawned_in_wave = 0
+        self.wave_schedule = WaveSchedule()
+        self.hits.clear()
+        self.tower_scheduler.clear()
         self.wave_active = False
         self.money = settings.STARTING_MONEY
         self.lives = settings.MAX_LIVES
@@ -317,29 +392,116 @@ class GameManager:
     # ------------------------------------------------------------------
 
     def calculate_metrics(self):
+        # Valores medidos durante la partida (ver game/queue_stats.py); λ
+        # configurado se muestra como referencia.
         c = len(self.towers)
-        λ = round(self.lambda_base, 2)
-        if c > 0:
-            avg_fire_rate = sum(tower.fire_rate for tower in self.towers) / c
-        else:
-            avg_fire_rate = settings.TOWER_FIRE_RATE
-        μ = round(avg_fire_rate, 2)
-        ρ = round(λ / (c * μ), 3) if c > 0 else 0
-        L = len(self.enemies)
-        return {"λ": λ, "μ": μ, "c": c, "ρ": ρ, "Enemigos (L)": L}
+        stats = self.queue_stats.summary(self.elapsed, c)
+        return {
+            "λ config": round(self.lambda_base, 2),
+            "λ medido": f"{stats['lambda_ewma']:.2f} (ventana {stats['lambda_window']:.2f})",
+            "μ efectivo": round(stats["mu_effective"], 2),
+            "c": c,
+            "ρ medido": round(stats["rho"], 3),
+            "Enemigos (L)": len(self.enemies),
+            "L promedio": round(stats["L"], 2),
+            "W (s)": round(stats["W"], 2),
+            "Little λW": f"{stats['little_lambda_w']:.2f} (error {stats['little_error']:.0%})",
+            "Reserva enemigos": self._format_pool(self.enemy_pool),
+            "Reserva proyectiles": self._format_pool(self.projectile_pool),
+        }
+
+    @staticmethod
+    def _format_pool(pool: ObjectPool) -> str:
+        return f"{pool.in_use}/{pool.size} (máx {pool.high_water}, nuevas {pool.allocations})"
+
+
+    def metrics_sample(self) -> dict:
+        """Muestra numérica del estado para ``utils.metrics_exporter``."""
+        c = len(self.towers)
+        stats = self.queue_stats.summary(self.elapsed, c)
+        return {
+            "td_fps": self.profiler.fps_percentiles(),
+            "td_phase_ms": self.profiler.phase_averages_ms(),
+            "td_enemies_alive": len(self.enemies),
+            "td_towers": c,
+            "td_money": self.money,
+            "td_lives": self.lives,
+            "td_wave": self.wave,
+            "td_level": 0 if self.current_level_index is None else self.current_level_index + 1,
+            "td_lambda": {"config": self.lambda_base, "medido": stats["lambda_ewma"]},
+            "td_mu_effective": stats["mu_effective"],
+            "td_rho": stats["rho"],
+            "td_queue_L": stats["L"],
+            "td_queue_W_seconds": stats["W"],
+            "td_level_departures": {"abatido": stats["kills"], "escapado": stats["leaks"]},
+            "td_pool_size": {"enemigos": self.enemy_pool.size, "proyectiles": self.projectile_pool.size},
+            "td_pool_high_water": {
+                "enemigos": self.enemy_pool.high_water,
+                "proyectiles": self.projectile_pool.high_water,
+            },
+            "td_pool_allocations": {
+                "enemigos": self.enemy_pool.allocations,
+                "proyectiles": self.projectile_pool.allocations,
+            },
+        }
 
+    def export_board(self, block=None, shape: tuple[int, int] | None = None) -> BoardTensors:
+        """Vuelca el tablero en cada tick sobre ``block`` (ver ``game.observation``)."""
+        self.board_tensors = BoardTensors(self, shape, block)
+        self.board_tensors.update()
+        return self.board_tensors
+
+    def export_frame_timings(self):
+        """Guarda en CSV los tiempos por fase de la ventana actual del profiler."""
+        filename = time.strftime("frame_timings_%Y%m%d_%H%M%S.csv")
+        path = self.profiler.export_csv(filename)
+        log.info("Tiempos por frame exportados a %s", path)
+        return path
+
+    def advance(self, frame_dt: float) -> int:
+        """Avanza la simulación en pasos fijos según el tiempo real transcurrido.
+
+        Devuelve el número de pasos ejecutados y deja en ``render_alpha`` la
+        fracción del siguiente paso ya transcurrida, usada al dibujar.
+        """
+        if self.state != "playing":
+            self.sim_accumulator = 0.0
+            self.render_alpha = 1.0
+            return 0
+
+        step = 1.0 / settings.SIMULATION_HZ
+        self.sim_accumulator += frame_dt
+        steps = 0
+        while self.sim_accumulator >= step:
+            if steps == settings.MAX_SIMULATION_STEPS:
+                # Frame muy lento: se descarta el retraso en vez de acumularlo
+                self.sim_accumulator %= step
+                break
+            self.update(step)
+            self.sim_accumulator -= step
+            steps += 1
+            if self.state != "playing":
+                self.sim_accumulator = 0.0
+                break
+        self.render_alpha = self.sim_accumulator / step
+        return steps
 
     def update(self, dt):
         if self.state != "playing":
             return
+        profiler = self.profiler
+        profiler.mark()
+        self.elapsed += dt
+        events = self.events
+        events.time = self.elapsed
         if self.wave_active:
             self.spawn_timer += dt
 
-            # Generación exponencial de llegadas (λ)
-            if self.spawn_timer >= self.enemy_interval and self.spawned_in_wave < self.enemies_per_wave:
-                self.spawn_enemy()
-                self.spawn_timer = 0
-                self.enemy_interval = random.expovariate(self.lambda_base)
+            # Llegadas exponenciales (λ) ya sorteadas al iniciar la oleada: se
+            # generan todas las que vencieron en este paso
+            schedule = self.wave_schedule
+            while self.spawn_timer >= schedule.next_time:
+                self.spawn_enemy(*schedule.pop())
                 self.spawned_in_wave += 1
 
             # Si todos los enemigos de la oleada murieron, pasar a la siguiente
@@ -348,43 +510,103 @@ class GameManager:
                     self.handle_level_complete()
                 else:
                     self.next_wave()
+        profiler.lap("spawn")
+
+        # Actualizar enemigos y retirar en la misma pasada los que llegaron al
+        # final o murieron
+        compact(self.enemies, lambda enemy: self._step_enemy(enemy, dt))
+        profiler.lap("enemigos")
+
+        # Actualizar torres y proyectiles (en modo intercepción solo se
+        # resuelven los impactos que vencen en este paso). Solo se atienden
+        # las torres que terminaron de recargar o a las que puede llegar un
+        # enemigo, y las que tienen proyectiles en vuelo.
+        hits = self.hits if self.projectile_mode == INTERCEPT_MODE else None
+        if hits is not None:
+            hits.resolve(self.elapsed, events)
+        self.tower_scheduler.update(
+            self.towers, self.enemies, self.elapsed, dt, events, hits, self.enemy_index
+        )
+        profiler.lap("torres")
 
-        # Actualizar enemigos (posición, vida)
-        for enemy in list(self.enemies):
-            enemy.update(dt)
+        # Entrega por lotes de los eventos del tick (dinero, vidas, métricas...)
+        events.dispatch()
+        retired = self._retired_enemies
+        if retired:
+            self.enemy_pool.release_all(retired)
+            retired.clear()
+        if self.board_tensors is not None:
+            self.board_tensors.update()
 
-            # Si el enemigo llega al final del camino, se pierde una vida
-            if enemy.index >= len(enemy.path) - 1:
-                self.enemies.remove(enemy)
-                self.lives -= 1
-                if self.lives <= 0:
-                    self.trigger_game_over()
 
-        # Eliminar enemigos muertos y sumar dinero
-        for enemy in list(self.enemies):
-            if not enemy.alive:
-                self.money += enemy.reward
-                self.enemies.remove(enemy)
+    def release_entities(self):
+        """Devuelve a sus reservas los enemigos y proyectiles de la partida.
 
-        # Actualizar torres y proyectiles
+        Se usa antes de descartar las listas (cargar nivel, volver al menú,
+        restaurar un snapshot) para que las reservas no pierdan instancias.
+        """
         for tower in self.towers:
-            tower.update(self.enemies)
+            for projectile in tower.projectiles:
+                projectile.target = None
+            tower.projectile_pool.release_all(tower.projectiles)
+            tower.projectiles = []
+        self.enemy_pool.release_all(self.enemies)
+        self.enemies = []
 
+    def _step_enemy(self, enemy: Enemy, dt: float) -> bool:
+        """Actualiza un enemigo; devuelve ``False`` si debe salir de la lista."""
+        enemy.update(dt)
+        if enemy.reached_end:
+            # Fuera de juego: los proyectiles que lo perseguían se descartan
+            enemy.alive = False
+            self.events.emit(EventType.LEAK, enemy)
+        elif enemy.alive:
+            self.enemy_index.move(enemy)
+            return True
+        self.enemy_index.remove(enemy)
+        self._retired_enemies.append(enemy)
+        return False
 
-    def spawn_enemy(self):
-        if not self.paths:
-            return
-        path = random.choice(self.paths)
+    def _on_enemy_leaked(self, event):
+        # Si el enemigo llega al final del camino, se pierde una vida
+        self.lives -= 1
+        if self.lives <= 0:
+            self.trigger_game_over()
 
+    def _on_enemy_killed(self, event):
+        self.money += event.entity.reward
+        # Sale del índice ya; de la lista, al retirarlo en el próximo tick
+        self.enemy_index.remove(event.entity)
 
+    def spawn_enemy(
+        self,
+        tier_index: int | None = None,
+        path_index: int | None = None,
+        base_speed: float | None = None,
+        base_health: int | None = None,
+    ):
+        """Genera un enemigo.
+
+        Sin argumentos sortea tipo, camino y estadísticas en el momento; la
+        oleada en curso pasa los valores de su calendario pre-generado.
+        """
+        if not self.paths:
+            return
+        if path_index is None:
+            path = self.rng.path.choice(self.paths)
+        else:
+            path = self.paths[path_index]
 
-        tier = self._choose_enemy_tier()
+        if tier_index is None:
+            tier = self._choose_enemy_tier()
+        else:
+            tier = self.enemy_tiers[tier_index] if self.enemy_tiers else {}
         sprite_set = str(tier.get("sprite_set", "1")) if tier else "1"
 
 
         velocidad_factor = tier.get("velocidad_factor", 1.0)
         salud_factor = tier.get("salud_factor", 1.0)
-        enemy = Enemy(
+        enemy = self.enemy_pool.acquire(
             path,
             speed_range=tier.get("velocidad", (1.5, 3.0)),
             health_range=tier.get("salud", (80, 150)),
@@ -394,9 +616,16 @@ class GameManager:
             sprite_set=sprite_set,
             radius=tier.get("radio"),
             color=tier.get("color"),
+            rng=self.rng.enemy_stats,
+            flow=self.flow_field,
+            base_speed=base_speed,
+            base_health=base_health,
         )
         self.enemies.append(enemy)
+        self.enemy_index.add(enemy)
         self.total_spawned += 1
+        self.events.emit(EventType.SPAWN, enemy)
+        self.tower_scheduler.enemy_appeared(enemy)
 
     
 
@@ -410,50 +639,31 @@ class GameManager:
         self.health_multiplier *= self.wave_health_growth
         self.spawned_in_wave = 0
         self.wave_active = True
-        self.enemy_interval = random.expovariate(self.lambda_base)
-        print(f"--- Inicia Oleada {self.wave} ---")
-        print(
-            f"Multiplicadores actuales -> Velocidad: {self.speed_multiplier:.2f}, Salud: {self.health_multiplier:.2f}"
+        self._schedule_wave()
+        self.events.emit(EventType.WAVE_START, value=self.wave)
+        log.info("--- Inicia Oleada %d ---", self.wave)
+        log.info(
+            "Multiplicadores actuales -> Velocidad: %.2f, Salud: %.2f",
+            self.speed_multiplier,
+            self.health_multiplier,
+        )
+
+    def _schedule_wave(self):
+        """Sortea de una vez las apariciones de la oleada actual."""
+        self.spawn_timer = 0.0
+        self.wave_schedule = WaveSchedule.generate(
+            self.rng,
+            self.enemies_per_wave,
+            self.lambda_base,
+            self.enemy_tiers,
+            len(self.paths),
+            self.tier_table,
         )
 
     def _choose_enemy_tier(self) -> dict:
         if not self.enemy_tiers:
             return {}
-        pesos = [max(0.0, tier.get("peso", 1.0)) for tier in self.enemy_tiers]
-        if sum(pesos) <= 0:
-            pesos = None
-        return random.choices(self.enemy_tiers, weights=pesos, k=1)[0]
-
-    @staticmethod
-    def _get_available_sprite_sets() -> list[str]:
-        base_path = (
-            Path(__file__).resolve().parents[1] / "maps" / "assets" / "images" / "enemy"
-        )
-        if not base_path.exists():
-            return ["1"]
-
-        sprite_sets = [entry.name for entry in base_path.iterdir() if entry.is_dir()]
-        return sorted(sprite_sets)
-
-    @staticmethod
-    def _prepare_enemy_tiers(tiers: list[dict], sprite_sets: list[str]) -> list[dict]:
-        if not tiers:
-            return []
-        if not sprite_sets:
-            sprite_sets = ["1"]
-
-        prepared: list[dict] = []
-
-        for idx, tier in enumerate(tiers):
-            tier_copy = dict(tier)
-            if "sprite_set" in tier_copy and tier_copy["sprite_set"]:
-                tier_copy["sprite_set"] = str(tier_copy["sprite_set"])
-            else:
-                sprite_index = idx % len(sprite_sets)
-                tier_copy["sprite_set"] = sprite_sets[sprite_index]
-            prepared.append(tier_copy)
-
-        return prepared
+        return self.enemy_tiers[self.tier_table.draw(self.rng.tier)]
 
     @staticmethod
     def _format_multiplier(multiplier: float) -> str:
@@ -486,6 +696,7 @@ class GameManager:
             return
         self.state = "game_over"
         self.wave_active = False
+        self.events.emit(EventType.LEVEL_END, value=0)
         self._set_overlay_buttons([
             ("Reintentar", self.restart_level),
             ("Volver al menú", self.back_to_menu),
@@ -493,6 +704,7 @@ class GameManager:
 
     def handle_level_complete(self):
         self.wave_active = False
+        self.events.emit(EventType.LEVEL_END, value=1)
         self.state = "victory" if self.current_level_index == len(self.levels) - 1 else "level_complete"
         options = []
         if self.state == "level_complete":
@@ -515,6 +727,29 @@ class GameManager:
     # ------------------------------------------------------------------
     # Interacción de usuario
     # ------------------------------------------------------------------
+    def handle_camera_event(self, event) -> bool:
+        """Zoom con la rueda y arrastre con el botón central o derecho."""
+        if self.state not in {"playing", "paused"}:
+            return False
+        if event.type == pygame.MOUSEWHEEL and event.y:
+            factor = settings.CAMERA_ZOOM_STEP ** event.y
+            self.camera.zoom_at(factor, pygame.mouse.get_pos())
+            return True
+        if event.type == pygame.MOUSEMOTION and (event.buttons[1] or event.buttons[2]):
+            self.camera.pan(-event.rel[0], -event.rel[1])
+            return True
+        return False
+
+    def scroll_camera(self, dt: float, keys):
+        """Desplaza la cámara con las flechas o WASD según ``pygame.key.get_pressed()``."""
+        if self.state not in {"playing", "paused"}:
+            return
+        dx = (keys[pygame.K_RIGHT] or keys[pygame.K_d]) - (keys[pygame.K_LEFT] or keys[pygame.K_a])
+        dy = (keys[pygame.K_DOWN] or keys[pygame.K_s]) - (keys[pygame.K_UP] or keys[pygame.K_w])
+        if dx or dy:
+            step = settings.CAMERA_PAN_SPEED * dt
+            self.camera.pan(dx * step, dy * step)
+
     def handle_click(self, pos):
         if self.state == "menu":
             for button in self.menu_buttons:
@@ -542,7 +777,8 @@ class GameManager:
             if self.tower_menu and self._handle_tower_menu_click(pos):
                 return
 
-            tower = self._get_tower_at(pos)
+            world_pos = self.camera.screen_to_world(pos)
+            tower = self._get_tower_at(world_pos)
             if tower:
                 self.close_build_menu()
 
@@ -553,7 +789,7 @@ class GameManager:
                 return
 
             for spot in self.spots:
-                if spot.rect.collidepoint(pos) and not spot.occupied:
+                if spot.rect.collidepoint(world_pos) and not spot.occupied:
                     if self.build_menu and self.build_menu.get("spot") is spot:
                         self.close_build_menu()
                     else:
@@ -579,23 +815,23 @@ class GameManager:
 
     def open_tower_menu(self, tower: Tower):
         total_buttons = len(settings.TOWER_UPGRADES)
-        if total_buttons == 0:
-            self.tower_menu = None
-            return
 
         button_width = 230
         button_height = 64
+        targeting_height = 44
         spacing = 10
-        total_height = total_buttons * button_height + (total_buttons - 1) * spacing
+        # Mejoras más el botón que alterna la estrategia de objetivo
+        total_height = total_buttons * (button_height + spacing) + targeting_height
 
         tower_rect = tower.get_rect()
-        offset = tower_rect.width // 2 + 16
-        x = tower.pos[0] + offset
+        offset = int(tower_rect.width * self.camera.zoom) // 2 + 16
+        screen_x, screen_y = self.camera.world_to_screen(tower.pos)
+        x = screen_x + offset
         if x + button_width + 10 > settings.SCREEN_WIDTH:
-            x = tower.pos[0] - offset - button_width
+            x = screen_x - offset - button_width
         x = max(10, min(settings.SCREEN_WIDTH - button_width - 10, x))
 
-        y = tower.pos[1] - total_height // 2
+        y = screen_y - total_height // 2
         y = max(10, min(settings.SCREEN_HEIGHT - total_height - 10, y))
 
         buttons = []
@@ -605,7 +841,8 @@ class GameManager:
             buttons.append({"rect": rect, "key": key})
             current_y += button_height + spacing
 
-        self.tower_menu = {"tower": tower, "buttons": buttons}
+        targeting_rect = pygame.Rect(x, current_y, button_width, targeting_height)
+        self.tower_menu = {"tower": tower, "buttons": buttons, "targeting_rect": targeting_rect}
 
     def close_tower_menu(self):
         self.tower_menu = None
@@ -626,12 +863,13 @@ class GameManager:
         total_height = len(options) * button_height + (len(options) - 1) * spacing
 
         x_offset = max(80, settings.TILE_SIZE)
-        x = spot.pos[0] + x_offset
+        screen_x, screen_y = self.camera.world_to_screen(spot.pos)
+        x = screen_x + x_offset
         if x + button_width + 10 > settings.SCREEN_WIDTH:
-            x = spot.pos[0] - x_offset - button_width
+            x = screen_x - x_offset - button_width
         x = max(20, min(settings.SCREEN_WIDTH - button_width - 20, x))
 
-        y = spot.pos[1] - total_height // 2
+        y = screen_y - total_height // 2
         y = max(20, min(settings.SCREEN_HEIGHT - total_height - 20, y))
 
         buttons: list[dict] = []
@@ -672,6 +910,13 @@ class GameManager:
             if button["rect"].collidepoint(pos):
                 self._attempt_tower_upgrade(button["key"])
                 return True
+        targeting_rect = self.tower_menu.get("targeting_rect")
+        if targeting_rect is not None and targeting_rect.collidepoint(pos):
+            tower = self.tower_menu.get("tower")
+            if tower is not None:
+                # El menú muestra la nueva estrategia en el siguiente frame
+                tower.cycle_targeting()
+            return True
         return False
 
     def _attempt_tower_upgrade(self, key: str):
@@ -682,20 +927,25 @@ class GameManager:
         if tower is None:
             return
 
-        config = settings.TOWER_UPGRADES.get(key)
-        if not config:
-            return
+        if self.upgrade_tower(tower, key):
+            self.open_tower_menu(tower)
 
-        if not tower.can_upgrade(key):
-            return
+    def upgrade_tower(self, tower: Tower, key: str) -> bool:
+        """Aplica la mejora ``key`` a ``tower`` si es posible y se puede pagar."""
+        config = settings.TOWER_UPGRADES.get(key)
+        if not config or not tower.can_upgrade(key):
+            return False
 
         cost = config.get("cost", 0)
         if self.money < cost:
-            return
+            return False
 
-        if tower.apply_upgrade(key):
-            self.money -= cost
-            self.open_tower_menu(tower)
+        if not tower.apply_upgrade(key):
+            return False
+        self.money -= cost
+        # Más alcance o cadencia pueden adelantar su próximo disparo
+        self.tower_scheduler.wake(tower, self.elapsed)
+        return True
 
     def _handle_build_menu_click(self, pos) -> bool:
         if not self.build_menu:
@@ -719,19 +969,27 @@ class GameManager:
         tower_type = button.get("type")
         if not tower_type:
             return
-        config = button.get("config", {})
-        cost = config.get("cost", settings.TOWER_COST)
-
-        if self.money < cost:
+        if self.build_tower(spot, tower_type) is None:
             self.build_menu["blocked"] = tower_type
             return
 
-        tower = Tower(spot.pos, tower_type)
+        self.close_build_menu()
+        self.close_tower_menu()
+
+    def build_tower(self, spot: BuildSpot, tower_type: str) -> Tower | None:
+        """Construye una torre en ``spot``; ``None`` si está ocupada o no alcanza el dinero."""
+        if spot.occupied:
+            return None
+        config = settings.TOWER_TYPES.get(tower_type, {})
+        cost = config.get("cost", settings.TOWER_COST)
+        if self.money < cost:
+            return None
+
+        tower = Tower(spot.pos, tower_type, self.projectile_pool)
         self.towers.append(tower)
         self.money -= cost
         spot.occupied = True
-        self.close_build_menu()
-        self.close_tower_menu()
+        return tower
 
     def _draw_tower_menu(self, surface):
         if not self.tower_menu:
@@ -742,7 +1000,7 @@ class GameManager:
             return
         
         tower_rect = tower.get_rect()
-        name_pos = (tower.pos[0], tower_rect.top - 6)
+        name_pos = self.camera.world_to_screen((tower.pos[0], tower_rect.top - 6))
         self._draw_text_with_shadow(
             surface,
             self.small_font,
@@ -885,27 +1143,85 @@ class GameManager:
                 anchor="center",
             )
 
+        # Botón de estrategia de objetivo (cambia a la siguiente al pulsarlo)
+        targeting_rect = self.tower_menu.get("targeting_rect")
+        if targeting_rect is not None:
+            card = pygame.Surface(targeting_rect.size, pygame.SRCALPHA)
+            card.fill((40, 45, 75, 235))
+            surface.blit(card, targeting_rect.topleft)
+            pygame.draw.rect(surface, (160, 180, 255), targeting_rect, width=2, border_radius=10)
+            self._draw_text_with_shadow(
+                surface,
+                self.small_font,
+                f"Objetivo: {tower.targeting_label}",
+                (245, 245, 255),
+                targeting_rect.center,
+                anchor="center",
+            )
+
     # ------------------------------------------------------------------
     # Renderizado
     # ------------------------------------------------------------------
 
 
     def draw(self, surface):
+        profiler = self.profiler
+        profiler.mark()
         surface.fill(settings.get_color("bg"))
 
         if self.state == "menu":
             self._draw_menu(surface)
+            profiler.lap("ui")
             return
 
-        if self.tiles:
-            self.tiles.draw(surface)
+        camera = self.camera
+        if camera.zoom == 1.0:
+            world = surface
+        else:
+            # Con zoom se dibuja la región visible a escala 1 y se escala una vez
+            view_size = tuple(int(math.ceil(v)) for v in camera.view_size)
+            if self._world_view is None or self._world_view.get_size() != view_size:
+                self._world_view = pygame.Surface(view_size).convert()
+            world = self._world_view
+            world.fill(settings.get_color("bg"))
+
+        view = camera.view_rect()
+        offset = camera.offset
+        if self.terrain is not None:
+            self.terrain.draw(world, view, offset)
         for spot in self.spots:
-            spot.draw(surface)
+            if view.colliderect(spot.rect):
+                spot.draw(world, offset)
+        profiler.lap("mapa")
+
+        # Solo se dibuja lo que cae dentro de la vista (con margen para
+        # sprites, barras de vida y círculos de alcance).
+        selected_tower = self.tower_menu.get("tower") if self.tower_menu else None
+        alpha = self.render_alpha if self.state == "playing" else 1.0
+        # Instante que representa el dibujo (el mismo que interpola ``alpha``)
+        render_time = self.elapsed - (1.0 - alpha) / settings.SIMULATION_HZ
         for tower in self.towers:
-            selected = self.tower_menu and self.tower_menu.get("tower") is tower
-            tower.draw(surface, selected=bool(selected))
+            reach = int(tower.range) + 8
+            if view.colliderect(
+                (tower.pos[0] - reach, tower.pos[1] - reach, 2 * reach, 2 * reach)
+            ):
+                tower.draw(
+                    world,
+                    selected=tower is selected_tower,
+                    offset=offset,
+                    alpha=alpha,
+                    now=render_time,
+                )
+        margin = settings.TILE_SIZE
+        left, top = view.left - margin, view.top - margin
+        right, bottom = view.right + margin, view.bottom + margin
         for enemy in self.enemies:
-            enemy.draw(surface)
+            x, y = enemy.pos
+            if left <= x <= right and top <= y <= bottom:
+                enemy.draw(world, offset, alpha)
+        if world is not surface:
+            pygame.transform.scale(world, surface.get_size(), surface)
+        profiler.lap("entidades")
         self._draw_hud(surface)
 
         if self.tower_menu:
@@ -917,6 +1233,7 @@ class GameManager:
         if self.state in {"game_over", "level_complete", "victory", "paused"}:
 
             self._draw_overlay(surface)
+        profiler.lap("ui")
 
     def _draw_hud(self, surface):
         level_text = "-" if self.current_level_index is None else str(self.current_level_index + 1)
@@ -934,6 +1251,11 @@ class GameManager:
 
         if self.state in {"playing", "paused"}:
             self._draw_button(surface, self.pause_button)
+            self.metrics_panel.draw_button(surface)
+            if self.metrics_panel.visible:
+                metrics = self.calculate_metrics()
+                metrics.update(self.profiler.summary())
+                self.metrics_panel.draw_panel(surface, metrics)
 
     def _draw_button(self, surface, button: dict, *, highlight: bool = False):
         """Renderiza un botón genérico usado en menús y overlays."""
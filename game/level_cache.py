@@ -0,0 +1,168 @@
+# game/level_cache.py
+"""Niveles compilados y reutilizables entre llamadas a ``load_level``.
+
+Compilar un nivel implica crear sus tiles, extraer los caminos, convertirlos a
+píxeles, localizar las casillas de construcción, preparar los tipos de enemigo
+y agrupar el terreno en bloques pre-renderizables. Todo eso depende solo del
+índice del nivel (y del tamaño de pantalla), así que se hace una vez y los
+reinicios o cambios de nivel posteriores reutilizan el resultado.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pygame
+
+from game import settings
+from game.alias_table import AliasTable
+from game.camera import TerrainChunks
+from game.navigation import FLOW_MODE, FlowField
+from maps.map_utils import (
+    TILE_SIZE,
+    convertir_camino_a_pixeles,
+    dimensiones_mapa,
+    obtener_posiciones_por_tipo,
+)
+
+ENEMY_SPRITES_PATH = (
+    Path(__file__).resolve().parents[1] / "maps" / "assets" / "images" / "enemy"
+)
+
+
+def available_sprite_sets() -> list[str]:
+    """Carpetas de sprites de enemigos disponibles en disco."""
+    if not ENEMY_SPRITES_PATH.exists():
+        return ["1"]
+    return sorted(entry.name for entry in ENEMY_SPRITES_PATH.iterdir() if entry.is_dir())
+
+
+def prepare_enemy_tiers(tiers: list[dict], sprite_sets: list[str]) -> list[dict]:
+    """Copia los tipos de enemigo asignando un sprite set a los que no lo tienen."""
+    if not tiers:
+        return []
+    if not sprite_sets:
+        sprite_sets = ["1"]
+
+    prepared: list[dict] = []
+    for idx, tier in enumerate(tiers):
+        tier_copy = dict(tier)
+        if "sprite_set" in tier_copy and tier_copy["sprite_set"]:
+            tier_copy["sprite_set"] = str(tier_copy["sprite_set"])
+        else:
+            tier_copy["sprite_set"] = sprite_sets[idx % len(sprite_sets)]
+        prepared.append(tier_copy)
+    return prepared
+
+
+class CompiledLevel:
+    """Datos inmutables de un nivel listos para iniciar una partida."""
+
+    def __init__(
+        self,
+        index: int,
+        config: dict,
+        tiles: pygame.sprite.Group | None,
+        terrain: TerrainChunks | None,
+        map_offset: tuple[int, int],
+        paths: list[list[tuple[int, int]]],
+        spot_positions: list[tuple[int, int]],
+        enemy_tiers: list[dict],
+        flow_field: FlowField | None = None,
+        map_size: tuple[int, int] = (0, 0),
+    ):
+        self.index = index
+        self.config = config
+        self.tiles = tiles
+        self.terrain = terrain
+        self.map_offset = map_offset
+        self.map_size = map_size
+        self.paths = paths
+        self.spot_positions = spot_positions
+        self.enemy_tiers = enemy_tiers
+        # Pesos de ``enemy_tiers`` compilados para sortear tipos en O(1)
+        self.tier_table = AliasTable.from_tiers(enemy_tiers)
+        # En modo flujo, ``paths`` contiene un punto por entrada y los enemigos
+        # se guían por ``flow_field``.
+        self.flow_field = flow_field
+
+
+def compile_level(index: int, level_entry: dict, sprite_sets: list[str]) -> CompiledLevel:
+    config = level_entry["config"]
+    mapa = config["mapa"]
+
+    tiles, raw_paths = level_entry["creator"]()
+    map_width, map_height = dimensiones_mapa(mapa)
+    offset_x = max(0, (settings.SCREEN_WIDTH - map_width) // 2)
+    offset_y = max(0, (settings.SCREEN_HEIGHT - map_height) // 2)
+    offset = (offset_x, offset_y)
+
+    terrain = None
+    if tiles:
+        for tile in tiles:
+            tile.rect.x += offset_x
+            tile.rect.y += offset_y
+        # El terreno es estático: se pre-renderiza por bloques, y solo los que
+        # entran en la vista de la cámara.
+        terrain = TerrainChunks(tiles, offset, (map_width, map_height))
+
+    flow_field = None
+    if config.get("navegacion", settings.NAVIGATION_MODE) == FLOW_MODE:
+        compiled_map = getattr(level_entry, "compiled", None)
+        if compiled_map is not None:
+            # Niveles en archivo: el campo ya viene compilado (y mapeado en memoria)
+            flow_field = FlowField(compiled_map().campo, offset)
+        else:
+            flow_field = FlowField.from_map(mapa, offset, config.get("tipos_camino", (1,)))
+        paths = [[point] for point in flow_field.spawn_points(mapa)]
+    else:
+        paths = [convertir_camino_a_pixeles(camino, offset) for camino in raw_paths if camino]
+    if not paths:
+        flow_field = None
+        fallback = obtener_posiciones_por_tipo(mapa, 1)
+        if fallback:
+            paths = [convertir_camino_a_pixeles(fallback, offset)]
+
+    spot_positions = [
+        (
+            col * TILE_SIZE + TILE_SIZE // 2 + offset_x,
+            fila * TILE_SIZE + TILE_SIZE // 2 + offset_y,
+        )
+        for col, fila in obtener_posiciones_por_tipo(mapa, 2)
+    ]
+
+    enemy_tiers = prepare_enemy_tiers(config.get("enemigos", []), sprite_sets)
+    return CompiledLevel(
+        index,
+        config,
+        tiles,
+        terrain,
+        offset,
+        paths,
+        spot_positions,
+        enemy_tiers,
+        flow_field,
+        (map_width, map_height),
+    )
+
+
+class LevelCache:
+    """Compila cada nivel bajo demanda y conserva el resultado."""
+
+    def __init__(self, levels: list[dict]):
+        self.levels = levels
+        self._compiled: dict[int, CompiledLevel] = {}
+        self._sprite_sets: list[str] | None = None
+
+    def get(self, index: int) -> CompiledLevel:
+        compiled = self._compiled.get(index)
+        if compiled is None:
+            if self._sprite_sets is None:
+                self._sprite_sets = available_sprite_sets()
+            compiled = compile_level(index, self.levels[index], self._sprite_sets)
+            self._compiled[index] = compiled
+        return compiled
+
+    def clear(self):
+        self._compiled.clear()
+        self._sprite_sets = None
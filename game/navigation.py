@@ -0,0 +1,71 @@
+# game/navigation.py
+"""Navegación por campo de flujo.
+
+En lugar de que cada enemigo copie un camino completo, cada casilla del mapa
+guarda hacia qué vecina hay que avanzar para acercarse al final (ver
+``maps.map_utils.CampoDistancias``). Un enemigo solo necesita conocer la
+casilla a la que se dirige: al llegar, consulta la tabla una vez y obtiene la
+siguiente. Así, mapas con muchas entradas o rutas que se ramifican y
+convergen comparten una única tabla.
+"""
+
+from __future__ import annotations
+
+from maps.map_utils import TILE_SIZE, CampoDistancias, calcular_campo_distancias
+
+# Valor de ``navegacion`` en la configuración de un nivel para activar este modo.
+FLOW_MODE = "flujo"
+PATH_MODE = "caminos"
+
+
+class FlowField:
+    """Campo de flujo en coordenadas de píxel para un mapa desplazado ``offset``."""
+
+    def __init__(self, campo: CampoDistancias, offset=(0, 0), tile_size: int = TILE_SIZE):
+        self.campo = campo
+        self.columns = campo.columnas
+        self.rows = campo.filas
+        self.next = campo.siguiente
+        self.distance = campo.distancia
+        self.tile_size = tile_size
+        half = tile_size // 2
+        self._base_x = offset[0] + half
+        self._base_y = offset[1] + half
+        self.offset = (offset[0], offset[1])
+
+    @classmethod
+    def from_map(cls, mapa, offset=(0, 0), tipos_camino=(1,), tipo_inicio=3, tipo_fin=4):
+        campo = calcular_campo_distancias(mapa, tipos_camino, tipo_inicio, tipo_fin)
+        return cls(campo, offset)
+
+    def center(self, cell: int) -> tuple[int, int]:
+        """Centro en píxeles de la casilla ``cell`` (índice plano)."""
+        columns = self.columns
+        return (
+            (cell % columns) * self.tile_size + self._base_x,
+            (cell // columns) * self.tile_size + self._base_y,
+        )
+
+    def cell_at(self, x: float, y: float) -> int:
+        """Índice de la casilla que contiene el punto en píxeles, o -1 si cae fuera."""
+        col = int((x - self.offset[0]) // self.tile_size)
+        row = int((y - self.offset[1]) // self.tile_size)
+        if not (0 <= col < self.columns and 0 <= row < self.rows):
+            return -1
+        return row * self.columns + col
+
+    def next_cell(self, cell: int) -> int:
+        return self.next[cell] if cell >= 0 else -1
+
+    def reachable(self, cell: int) -> bool:
+        return cell >= 0 and self.distance[cell] >= 0
+
+    def spawn_points(self, mapa, tipo_inicio: int = 3) -> list[tuple[int, int]]:
+        """Centros de las casillas de inicio desde las que se alcanza el final."""
+        points = []
+        for row, fila in enumerate(mapa):
+            for col, valor in enumerate(fila):
+                cell = row * self.columns + col
+                if valor == tipo_inicio and self.distance[cell] >= 0:
+                    points.append(self.center(cell))
+        return points
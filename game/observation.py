@@ -0,0 +1,183 @@
+# game/observation.py
+"""Estado de la partida como tensores NumPy escritos en su sitio.
+
+:class:`BoardTensors` vuelca en cada tick el tablero en arreglos ``float32``
+reservados una sola vez, para análisis y agentes que no deben recorrer
+objetos de Python ni copiar nada:
+
+- ``scalars``: dinero, vidas, oleada, enemigos vivos, tiempo y número de
+  tick (:data:`SCALARS`);
+- ``board``: ``(canales, filas, columnas)`` con la matriz del mapa
+  (``level_config['mapa']``), enemigos y salud total por casilla, torres que
+  cubren cada casilla y su daño por segundo combinado (:data:`CHANNELS`).
+
+Todo vive en un único bloque contiguo (escalares y después el tablero). Por
+defecto es un ``bytearray`` propio, pero puede ser cualquier búfer escribible
+(``multiprocessing.RawArray``, ``shared_memory.SharedMemory.buf``, ``mmap``,
+la fila de un arreglo más grande...). Los consumidores leen el mismo bloque
+con :func:`board_views` o :meth:`BoardTensors.memoryview`, sin copias.
+
+El mapa y la cobertura solo se recalculan al cambiar de nivel o de torres;
+enemigos y salud se cuentan en cada ``update`` con ``np.bincount`` sobre la
+casilla que ya guarda el índice de objetivos de cada enemigo.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from game import settings
+
+SCALARS = ("dinero", "vidas", "oleada", "vivos", "tiempo", "tick")
+CHANNELS = ("mapa", "enemigos", "salud", "cobertura", "dps")
+
+
+def map_shape(mapa) -> tuple[int, int]:
+    """``(filas, columnas)`` de una matriz de mapa."""
+    return len(mapa), len(mapa[0]) if mapa else 0
+
+
+def board_size(shape: tuple[int, int]) -> int:
+    """Número de ``float32`` del bloque para un tablero de ``shape`` casillas."""
+    rows, columns = shape
+    return len(SCALARS) + len(CHANNELS) * rows * columns
+
+
+def board_views(block, shape: tuple[int, int]) -> tuple[np.ndarray, np.ndarray]:
+    """Vistas ``(scalars, board)`` sobre un bloque, sin copiarlo.
+
+    ``block`` es un búfer de bytes o un arreglo ``float32`` de
+    :func:`board_size` elementos; con un arreglo de varias filas (un bloque
+    por partida) las vistas llevan delante las mismas dimensiones.
+    """
+    data = block if isinstance(block, np.ndarray) else np.frombuffer(block, dtype=np.float32)
+    size = board_size(shape)
+    if data.shape[-1] < size:
+        raise ValueError(f"El bloque tiene {data.shape[-1]} valores; hacen falta {size}")
+    data = data[..., :size]
+    scalars = data[..., : len(SCALARS)]
+    board = data[..., len(SCALARS):].reshape(*data.shape[:-1], len(CHANNELS), *shape)
+    return scalars, board
+
+
+class BoardTensors:
+    """Volcado por tick del estado de ``game`` sobre un bloque reservado.
+
+    ``shape`` es la capacidad ``(filas, columnas)`` del tablero; por defecto
+    la del mapa más grande de ``game.levels``, de modo que el mismo bloque
+    sirve para todos los niveles (los más pequeños ocupan la esquina superior
+    izquierda y el resto queda a cero).
+    """
+
+    def __init__(self, game, shape: tuple[int, int] | None = None, block=None):
+        self.game = game
+        if shape is None:
+            shapes = [map_shape(level["config"]["mapa"]) for level in game.levels]
+            shape = (max((s[0] for s in shapes), default=0), max((s[1] for s in shapes), default=0))
+        self.shape = (int(shape[0]), int(shape[1]))
+        self.block = block if block is not None else bytearray(board_size(self.shape) * 4)
+        self.scalars, self.board = board_views(self.block, self.shape)
+        self.scalars[:] = 0.0
+        self.board[:] = 0.0
+        for name, channel in zip(CHANNELS, self.board):
+            setattr(self, name, channel)
+        self.ticks = 0
+        self._level = None
+        self._region = (0, 0)
+        self._centers = None
+        self._towers_key = None
+
+    def memoryview(self) -> memoryview:
+        """El bloque completo como ``memoryview`` de ``float32``."""
+        return memoryview(self.block).cast("B").cast("f")[: board_size(self.shape)]
+
+    def rebind(self, block):
+        """Pasa a escribir en ``block`` (otro búfer del mismo tamaño o mayor)."""
+        self.block = block
+        self.scalars, self.board = board_views(block, self.shape)
+        for name, channel in zip(CHANNELS, self.board):
+            setattr(self, name, channel)
+        self._level = None
+        self.update()
+
+    # ------------------------------------------------------------------
+    # Partes estáticas por nivel o por conjunto de torres
+    # ------------------------------------------------------------------
+    def _load_level(self):
+        game = self.game
+        self.board[:] = 0.0
+        self._level = game.level_config
+        self._towers_key = None
+        if game.level_config is None:
+            self._region = (0, 0)
+            self._centers = None
+            return
+        mapa = game.level_config["mapa"]
+        rows, columns = map_shape(mapa)
+        if rows > self.shape[0] or columns > self.shape[1]:
+            raise ValueError(
+                f"El mapa de {rows}x{columns} no cabe en un tablero de {self.shape[0]}x{self.shape[1]}"
+            )
+        self._region = (rows, columns)
+        self.mapa[:rows, :columns] = mapa
+        tile = settings.TILE_SIZE
+        offset_x, offset_y = game.map_offset
+        xs = offset_x + tile * (np.arange(columns, dtype=np.float32) + 0.5)
+        ys = offset_y + tile * (np.arange(rows, dtype=np.float32) + 0.5)
+        self._centers = (xs[np.newaxis, :], ys[:, np.newaxis])
+
+    def _update_coverage(self):
+        towers = self.game.towers
+        key = tuple((t.pos, t.range, t.damage, t.fire_rate) for t in towers)
+        if key == self._towers_key:
+            return
+        self._towers_key = key
+        rows, columns = self._region
+        coverage = self.cobertura[:rows, :columns]
+        dps = self.dps[:rows, :columns]
+        coverage[:] = 0.0
+        dps[:] = 0.0
+        xs, ys = self._centers
+        for (px, py), reach, damage, fire_rate in key:
+            inside = (xs - px) ** 2 + (ys - py) ** 2 <= reach * reach
+            coverage += inside
+            dps += inside * np.float32(damage * fire_rate)
+
+    # ------------------------------------------------------------------
+    # Volcado por tick
+    # ------------------------------------------------------------------
+    def update(self):
+        """Escribe el estado actual de la partida en el bloque."""
+        game = self.game
+        if game.level_config is not self._level:
+            self._load_level()
+        self.ticks += 1
+        scalars = self.scalars
+        scalars[5] = self.ticks
+        if self._centers is None:
+            # Sin nivel cargado (menú) no hay partida que volcar
+            scalars[:5] = 0.0
+            return
+        enemies = game.enemies
+        scalars[0] = game.money
+        scalars[1] = game.lives
+        scalars[2] = game.wave
+        scalars[4] = game.elapsed
+        self._update_coverage()
+
+        # Las casillas del índice de objetivos coinciden con las del mapa; los
+        # enemigos abatidos en este tick aún no salieron de la lista (-1).
+        rows, columns = self._region
+        count = len(enemies)
+        cells = np.fromiter(
+            (enemy.grid_cell if enemy.alive else -1 for enemy in enemies), dtype=np.intp, count=count
+        )
+        health = np.fromiter((enemy.health for enemy in enemies), dtype=np.float32, count=count)
+        alive = cells >= 0
+        cells = cells[alive]
+        scalars[3] = len(cells)
+        cell_count = rows * columns
+        density = np.bincount(cells, minlength=cell_count)
+        self.enemigos[:rows, :columns] = density.reshape(rows, columns)
+        totals = np.bincount(cells, weights=health[alive], minlength=cell_count)
+        self.salud[:rows, :columns] = totals.reshape(rows, columns)
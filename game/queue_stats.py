@@ -0,0 +1,155 @@
+# game/queue_stats.py
+"""Estimaciones de teoría de colas medidas durante la partida.
+
+El juego se modela como una cola M/M/c: los enemigos son clientes que llegan
+(aparecen), esperan y salen del sistema al ser abatidos o al escapar; las
+torres son los servidores. En lugar de calcular λ, μ y ρ a partir de la
+configuración, :class:`LiveQueueStats` los mide con los eventos del bus:
+
+- λ medido: inverso de la media exponencial (EWMA) de los tiempos entre
+  llegadas, y tasa de llegadas en una ventana deslizante.
+- μ efectivo: inverso de la EWMA del tiempo de atención, desde el primer
+  disparo a un enemigo hasta que cae (la "ocupación" de la torre que lo atacó).
+- L: número medio de enemigos en el sistema, integrado en el tiempo.
+- W: tiempo medio en el sistema (de la aparición a la salida).
+- Ley de Little: compara L con λ·W usando los promedios acumulados.
+
+Cada evento se procesa en O(1) y el resumen también es O(1).
+"""
+
+from __future__ import annotations
+
+from collections import deque
+
+from game.events import EventBus, EventType
+
+
+class LiveQueueStats:
+    """Estimadores incrementales alimentados por un :class:`EventBus`."""
+
+    def __init__(self, events: EventBus, window: float = 30.0, alpha: float = 0.1):
+        self.window = window
+        self.alpha = alpha
+        events.subscribe(EventType.SPAWN, self._on_spawn)
+        events.subscribe(EventType.KILL, self._on_kill)
+        events.subscribe(EventType.LEAK, self._on_leak)
+        events.subscribe(EventType.SHOT, self._on_shot)
+        self.reset()
+
+    def reset(self):
+        self._arrival_times: deque[float] = deque()
+        self._last_arrival: float | None = None
+        self._interarrival_ewma: float | None = None
+        self._service_ewma: float | None = None
+        # Instante de llegada y del primer disparo de cada enemigo en el sistema
+        self._entered: dict[int, float] = {}
+        self._engaged: dict[int, float] = {}
+
+        self.in_system = 0
+        self._area = 0.0          # ∫ L(t) dt
+        self._last_change = 0.0
+        self.start_time: float | None = None
+
+        self.arrivals = 0
+        self.departures = 0
+        self.kills = 0
+        self.leaks = 0
+        self._sojourn_total = 0.0
+
+    # ------------------------------------------------------------------
+    # Eventos
+    # ------------------------------------------------------------------
+    def _advance(self, now: float):
+        if self.start_time is None:
+            self.start_time = now
+        self._area += self.in_system * (now - self._last_change)
+        self._last_change = now
+
+    def _ewma(self, current: float | None, sample: float) -> float:
+        if current is None:
+            return sample
+        return current + self.alpha * (sample - current)
+
+    def _on_spawn(self, event):
+        now = event.time
+        self._advance(now)
+        self.in_system += 1
+        self.arrivals += 1
+        self._entered[id(event.entity)] = now
+
+        if self._last_arrival is not None:
+            self._interarrival_ewma = self._ewma(self._interarrival_ewma, now - self._last_arrival)
+        self._last_arrival = now
+
+        times = self._arrival_times
+        times.append(now)
+        while times and times[0] < now - self.window:
+            times.popleft()
+
+    def _on_shot(self, event):
+        key = id(event.entity)
+        if key in self._entered and key not in self._engaged:
+            self._engaged[key] = event.time
+
+    def _depart(self, event) -> tuple[bool, float | None]:
+        """Registra una salida; devuelve si el enemigo se medía y su primer disparo."""
+        now = event.time
+        key = id(event.entity)
+        engaged = self._engaged.pop(key, None)
+        entered = self._entered.pop(key, None)
+        if entered is None:
+            # Enemigo anterior a la medición (p. ej. restaurado de un snapshot)
+            return False, None
+        self._advance(now)
+        self.in_system -= 1
+        self.departures += 1
+        self._sojourn_total += now - entered
+        return True, engaged
+
+    def _on_kill(self, event):
+        tracked, engaged = self._depart(event)
+        if tracked:
+            self.kills += 1
+        if engaged is not None:
+            self._service_ewma = self._ewma(self._service_ewma, event.time - engaged)
+
+    def _on_leak(self, event):
+        tracked, _ = self._depart(event)
+        if tracked:
+            self.leaks += 1
+
+    # ------------------------------------------------------------------
+    # Resumen
+    # ------------------------------------------------------------------
+    def summary(self, now: float, servers: int) -> dict:
+        """Valores actuales de los estimadores en el instante ``now``."""
+        start = self.start_time if self.start_time is not None else now
+        elapsed = now - start
+        area = self._area + self.in_system * (now - self._last_change)
+
+        lam_ewma = 1.0 / self._interarrival_ewma if self._interarrival_ewma else 0.0
+        span = min(self.window, elapsed)
+        lam_window = len(self._arrival_times) / span if span > 0 else 0.0
+        mu = 1.0 / self._service_ewma if self._service_ewma else 0.0
+        rho = lam_ewma / (servers * mu) if servers and mu else 0.0
+
+        # Little: L = λ·W con los promedios acumulados del mismo intervalo
+        L = area / elapsed if elapsed > 0 else 0.0
+        lam_avg = self.arrivals / elapsed if elapsed > 0 else 0.0
+        W = self._sojourn_total / self.departures if self.departures else 0.0
+        little = lam_avg * W
+        little_error = abs(L - little) / L if L > 0 else 0.0
+
+        return {
+            "lambda_ewma": lam_ewma,
+            "lambda_window": lam_window,
+            "mu_effective": mu,
+            "rho": rho,
+            "L": L,
+            "W": W,
+            "little_lambda_w": little,
+            "little_error": little_error,
+            "in_system": self.in_system,
+            "kills": self.kills,
+            "leaks": self.leaks,
+        }
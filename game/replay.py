@@ -0,0 +1,299 @@
+# game/replay.py
+"""Grabación y reproducción determinista de partidas.
+
+Una grabación guarda la semilla, el nivel inicial, la duración de cada tick
+(en milisegundos, tal como la devuelve ``clock.tick``) y los clics recibidos
+por ``GameManager.handle_click`` junto con la vista de la cámara. Con eso basta para volver a ejecutar la
+partida sin ventana y a máxima velocidad.
+
+Cada ``hash_interval`` ticks se guarda además un hash del estado del juego;
+al reproducir se recalculan y la primera discrepancia indica el tick a partir
+del cual la simulación dejó de ser idéntica.
+
+Cada cambio en la simulación debe subir :data:`VERSION`: los hashes de una
+grabación solo son válidos para la simulación que los produjo.
+
+Uso:
+    python -m game.replay partida.tdr [--verbose]
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import struct
+import sys
+import time
+import zlib
+from array import array
+from pathlib import Path
+
+MAGIC = b"TDRP"
+VERSION = 1
+# magic, versión, semilla, nivel (-1 = menú), intervalo de hash, ticks, clics,
+# hashes, proyectiles de intercepción
+_HEADER = struct.Struct("<4sBQhHIII?")
+# tick, x, y (pantalla), vista de la cámara (x, y, zoom)
+_CLICK = struct.Struct("<Ihhddd")
+
+
+def state_hash(game) -> int:
+    """Hash de 64 bits con el estado jugable relevante para detectar desincronías."""
+
+    enemies = tuple(
+        (enemy.pos[0], enemy.pos[1], enemy.index, enemy.health, enemy.alive)
+        for enemy in game.enemies
+    )
+    towers = tuple(
+        (
+            tower.pos,
+            tower.type_key,
+            tower.targeting,
+            tuple(sorted(tower.upgrade_levels.items())),
+            tower.last_shot,
+            # Solo los proyectiles que aún pueden impactar (los que van hacia un
+            # objetivo ya retirado no se guardan en los snapshots)
+            tuple((p.pos[0], p.pos[1]) for p in tower.projectiles if p.alive and p.tracking),
+        )
+        for tower in game.towers
+    )
+    snapshot = (
+        game.state,
+        game.current_level_index,
+        game.wave,
+        game.spawned_in_wave,
+        game.enemies_per_wave,
+        game.money,
+        getattr(game, "lives", None),
+        game.total_spawned,
+        game.spawn_timer,
+        game.wave_schedule.next_time,
+        enemies,
+        towers,
+    )
+    digest = hashlib.blake2b(repr(snapshot).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+class Replay:
+    """Contenido de una grabación."""
+
+    def __init__(
+        self,
+        seed: int,
+        level: int | None = None,
+        hash_interval: int = 30,
+        tick_ms: array | None = None,
+        clicks: list[tuple[int, int, int, float, float, float]] | None = None,
+        hashes: array | None = None,
+        projectile_mode: str = "homing",
+    ):
+        self.seed = seed
+        self.level = level
+        self.hash_interval = max(1, hash_interval)
+        self.tick_ms = tick_ms if tick_ms is not None else array("H")
+        self.clicks = clicks if clicks is not None else []
+        self.hashes = hashes if hashes is not None else array("Q")
+        self.projectile_mode = projectile_mode
+
+    def save(self, path: str | Path) -> Path:
+        path = Path(path)
+        clicks = b"".join(_CLICK.pack(*click) for click in self.clicks)
+        payload = zlib.compress(self.tick_ms.tobytes() + clicks + self.hashes.tobytes(), 9)
+        header = _HEADER.pack(
+            MAGIC,
+            VERSION,
+            self.seed,
+            -1 if self.level is None else self.level,
+            self.hash_interval,
+            len(self.tick_ms),
+            len(self.clicks),
+            len(self.hashes),
+            self.projectile_mode == "intercept",
+        )
+        path.write_bytes(header + payload)
+        return path
+
+    @classmethod
+    def load(cls, path: str | Path) -> "Replay":
+        data = Path(path).read_bytes()
+        magic, version = struct.unpack_from("<4sB", data)
+        if magic != MAGIC:
+            raise ValueError(f"{path} no es una grabación de partida")
+        if version != VERSION:
+            raise ValueError(
+                f"{path}: grabación de la versión {version}; este juego solo lee la versión {VERSION}"
+            )
+
+        _, _, seed, level, interval, n_ticks, n_clicks, n_hashes, intercept = _HEADER.unpack_from(data)
+        payload = zlib.decompress(data[_HEADER.size:])
+        tick_ms = array("H")
+        tick_ms.frombytes(payload[: n_ticks * tick_ms.itemsize])
+        offset = n_ticks * tick_ms.itemsize
+        clicks = [_CLICK.unpack_from(payload, offset + idx * _CLICK.size) for idx in range(n_clicks)]
+        offset += n_clicks * _CLICK.size
+        hashes = array("Q")
+        hashes.frombytes(payload[offset: offset + n_hashes * hashes.itemsize])
+        return cls(
+            seed,
+            None if level < 0 else level,
+            interval,
+            tick_ms,
+            clicks,
+            hashes,
+            "intercept" if intercept else "homing",
+        )
+
+
+class ReplayRecorder:
+    """Captura las entradas de una partida en curso.
+
+    En el bucle principal, ``record_click`` se llama por cada clic y
+    ``record_tick`` una vez por frame, después de ``GameManager.update``.
+    """
+
+    def __init__(
+        self,
+        seed: int,
+        level: int | None = None,
+        hash_interval: int = 30,
+        projectile_mode: str = "homing",
+    ):
+        self.replay = Replay(seed, level, hash_interval, projectile_mode=projectile_mode)
+        self.tick = 0
+
+    def record_click(self, pos, camera=None):
+        # Los clics en el mapa dependen de la vista, así que se guarda con ellos
+        view = (camera.x, camera.y, camera.zoom) if camera is not None else (0.0, 0.0, 1.0)
+        self.replay.clicks.append((self.tick, int(pos[0]), int(pos[1]), *view))
+
+    def record_tick(self, tick_ms: int, game):
+        self.replay.tick_ms.append(max(0, min(0xFFFF, int(tick_ms))))
+        if self.tick % self.replay.hash_interval == 0:
+            self.replay.hashes.append(state_hash(game))
+        self.tick += 1
+
+    def save(self, path: str | Path) -> Path:
+        return self.replay.save(path)
+
+
+def start_session(game, seed: int, level: int | None = None, projectile_mode: str | None = None):
+    """Deja ``game`` en el estado inicial común a grabación y reproducción."""
+
+    if projectile_mode is not None:
+        game.projectile_mode = projectile_mode
+    game.rng.reseed(seed)
+    if level is not None:
+        game.load_level(level)
+
+
+def run_replay(
+    replay: Replay,
+    game=None,
+    on_tick=None,
+    checkpoint_every: int = 0,
+    resume_from: tuple[int, bytes] | None = None,
+) -> dict:
+    """Reproduce ``replay`` sin limitar la velocidad y compara los hashes.
+
+    ``on_tick(tick, hash)`` se invoca con el hash de cada tick, lo que permite
+    localizar con precisión una desincronía entre dos puntos de control.
+    Con ``checkpoint_every`` se guarda un snapshot cada N ticks, y
+    ``resume_from=(tick, snapshot)`` retoma la reproducción desde uno de ellos
+    en lugar de empezar desde el principio.
+    """
+
+    from game import snapshot
+
+    if game is None:
+        from game.game_manager import GameManager
+
+        game = GameManager()
+    start_session(game, replay.seed, replay.level, replay.projectile_mode)
+    first_tick = 0
+    if resume_from is not None:
+        first_tick, data = resume_from
+        snapshot.restore(game, data)
+
+    clicks = sorted(click for click in replay.clicks if click[0] >= first_tick)
+    expected = replay.hashes
+    click_idx = 0
+    first_mismatch = None
+    checked = 0
+    checkpoints: dict[int, bytes] = {}
+    start = time.perf_counter()
+
+    for tick in range(first_tick, len(replay.tick_ms)):
+        ms = replay.tick_ms[tick]
+        if checkpoint_every and tick % checkpoint_every == 0 and game.current_level_index is not None:
+            checkpoints[tick] = snapshot.capture(game)
+        while click_idx < len(clicks) and clicks[click_idx][0] == tick:
+            _, x, y, cam_x, cam_y, zoom = clicks[click_idx]
+            game.camera.set_view(cam_x, cam_y, zoom)
+            game.handle_click((x, y))
+            click_idx += 1
+
+        game.advance(ms / 1000.0)
+
+        if on_tick is not None or tick % replay.hash_interval == 0:
+            current = state_hash(game)
+            if on_tick is not None:
+                on_tick(tick, current)
+            if tick % replay.hash_interval == 0:
+                slot = tick // replay.hash_interval
+                if slot < len(expected):
+                    checked += 1
+                    if first_mismatch is None and expected[slot] != current:
+                        first_mismatch = tick
+
+    elapsed = time.perf_counter() - start
+    ticks = len(replay.tick_ms) - first_tick
+    return {
+        "ticks": ticks,
+        "checkpoints": checked,
+        "snapshots": checkpoints,
+        "first_mismatch": first_mismatch,
+        "wall_time": elapsed,
+        "ticks_per_sec": ticks / elapsed if elapsed > 0 else 0.0,
+        "game": game,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Reproduce una partida grabada sin ventana.")
+    parser.add_argument("path", type=Path)
+    parser.add_argument("--verbose", action="store_true", help="muestra el hash de cada tick")
+    args = parser.parse_args()
+
+    import logging
+    import os
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import pygame
+
+    from game import settings
+
+    pygame.init()
+    pygame.display.set_mode((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT))
+
+    replay = Replay.load(args.path)
+    # Los avisos de la partida solo se muestran en modo detallado
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING, format="%(message)s")
+    on_tick = (lambda tick, value: print(f"{tick:8d} {value:016x}")) if args.verbose else None
+    result = run_replay(replay, on_tick=on_tick)
+
+    game = result["game"]
+    print(f"Ticks reproducidos: {result['ticks']} ({result['ticks_per_sec']:.0f} ticks/s)")
+    print(f"Estado final: {game.state} | Oleada {game.wave} | $ {game.money} | Vidas {game.lives}")
+    if result["first_mismatch"] is None:
+        print(f"Sin desincronías ({result['checkpoints']} puntos de control verificados)")
+        return 0
+    print(
+        f"Desincronía detectada en el tick {result['first_mismatch']} "
+        f"(intervalo de control: {replay.hash_interval} ticks)"
+    )
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
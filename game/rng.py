@@ -0,0 +1,98 @@
+# game/rng.py
+"""Flujos de números aleatorios independientes por subsistema.
+
+Cada subsistema (intervalos de llegada, elección de tipo, elección de camino,
+estadísticas de enemigos y los generadores de SimPy) tiene su propio
+``random.Random`` sembrado a partir de una semilla maestra. Así, añadir una
+extracción en un subsistema no desplaza los resultados de los demás, y dos
+procesos con la misma semilla obtienen exactamente las mismas secuencias.
+
+Las semillas derivadas se calculan con BLAKE2b (no con ``hash``), de modo que
+son estables entre ejecuciones y entre procesos.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import random
+
+# Nombre de cada flujo. Cada uno queda disponible como atributo (``rng.spawn``).
+STREAMS = ("spawn", "tier", "path", "enemy_stats", "arrivals", "service")
+
+
+def derive_seed(seed: int, *keys) -> int:
+    """Deriva una semilla de 64 bits a partir de ``seed`` y de claves adicionales."""
+
+    material = ":".join(str(part) for part in (seed, *keys)).encode("utf-8")
+    return int.from_bytes(hashlib.blake2b(material, digest_size=8).digest(), "little")
+
+
+class RandomStreams:
+    """Conjunto de flujos ``random.Random`` derivados de una misma semilla."""
+
+    def __init__(self, seed: int | None = None):
+        self.seed = 0
+        self._numpy: dict[str, object] = {}
+        for name in STREAMS:
+            setattr(self, name, random.Random())
+        self.reseed(seed)
+
+    def reseed(self, seed: int | None = None):
+        """Vuelve a sembrar todos los flujos en su sitio.
+
+        Los objetos ``random.Random`` se conservan, por lo que las referencias
+        que ya tengan otros componentes siguen siendo válidas.
+        """
+        self.seed = seed if seed is not None else random.randrange(2**63)
+        for name in STREAMS:
+            self.stream(name).seed(derive_seed(self.seed, name))
+        self._numpy.clear()
+
+    def stream(self, name: str) -> random.Random:
+        return getattr(self, name)
+
+    def for_worker(self, worker_id: int) -> "RandomStreams":
+        """Flujos reproducibles para un proceso trabajador concreto."""
+        return RandomStreams(derive_seed(self.seed, "worker", worker_id))
+
+    # ------------------------------------------------------------------
+    # Extracciones en bloque
+    # ------------------------------------------------------------------
+    def expovariates(self, name: str, lambd: float, count: int) -> list[float]:
+        """``count`` tiempos exponenciales consecutivos del flujo ``name``."""
+        expovariate = self.stream(name).expovariate
+        return [expovariate(lambd) for _ in range(count)]
+
+    def numpy(self, name: str):
+        """``numpy.random.Generator`` asociado al flujo ``name``.
+
+        Se siembra de forma independiente del ``random.Random`` homónimo y se
+        crea bajo demanda, así que NumPy solo es necesario si se usa.
+        """
+        generator = self._numpy.get(name)
+        if generator is None:
+            import numpy as np
+
+            generator = np.random.default_rng(derive_seed(self.seed, name, "numpy"))
+            self._numpy[name] = generator
+        return generator
+
+    # ------------------------------------------------------------------
+    # Estado (para snapshots y repeticiones)
+    # ------------------------------------------------------------------
+    def getstate(self) -> dict:
+        return {
+            "seed": self.seed,
+            "streams": {name: self.stream(name).getstate() for name in STREAMS},
+            "numpy": {
+                name: generator.bit_generator.state for name, generator in self._numpy.items()
+            },
+        }
+
+    def setstate(self, state: dict):
+        self.seed = state["seed"]
+        for name, stream_state in state["streams"].items():
+            self.stream(name).setstate(stream_state)
+        self._numpy.clear()
+        for name, generator_state in state.get("numpy", {}).items():
+            self.numpy(name).bit_generator.state = generator_state
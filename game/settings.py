@@ -12,6 +12,40 @@ SCALE = 1.5
 LAMBDA_RATE = 0.5
 MAX_LIVES = 3
 
+# Navegación de enemigos: "caminos" (cada enemigo sigue un camino precalculado)
+# o "flujo" (campo de flujo compartido). Cada nivel puede redefinirla con la
+# clave "navegacion" de su configuración.
+NAVIGATION_MODE = "caminos"
+
+# Cámara: el terreno se pre-renderiza en bloques de TERRAIN_CHUNK_TILES casillas
+# por lado y se conservan a lo sumo TERRAIN_CHUNK_CACHE bloques en memoria.
+TERRAIN_CHUNK_TILES = 8
+TERRAIN_CHUNK_CACHE = 64
+CAMERA_MIN_ZOOM = 0.5
+CAMERA_MAX_ZOOM = 2.0
+CAMERA_PAN_SPEED = 900  # píxeles de pantalla por segundo
+CAMERA_ZOOM_STEP = 1.1
+
+# Simulación a paso fijo: la lógica avanza en pasos de 1 / SIMULATION_HZ
+# segundos, independientemente de los FPS de dibujo. Si un frame se retrasa,
+# se ejecutan como máximo MAX_SIMULATION_STEPS pasos y el resto se descarta.
+SIMULATION_HZ = 120
+MAX_SIMULATION_STEPS = 8
+# Las velocidades de enemigos y proyectiles están expresadas en píxeles por
+# frame a esta frecuencia (la del bucle original).
+SPEED_REFERENCE_HZ = 60
+
+# Proyectiles: "homing" persigue al objetivo frame a frame; "intercept" calcula
+# el punto de impacto al disparar y programa el daño (game/ballistics.py).
+PROJECTILE_MODE = "homing"
+
+# Instancias reservadas de antemano para reutilizar enemigos y proyectiles
+ENEMY_POOL_SIZE = 128
+PROJECTILE_POOL_SIZE = 256
+
+# Intervalo (segundos reales) entre muestras enviadas al exportador de métricas
+METRICS_EXPORT_INTERVAL = 1.0
+
 # Camino temporal (lista de coordenadas)
 PATH = [(int(x * SCALE), int(y * SCALE)) for (x, y) in [
     (50, 300), (150, 300), (250, 250),
@@ -69,6 +103,8 @@ TOWER_TYPES = {
 
 TOWER_RANGE = 180       # antes 150
 TOWER_FIRE_RATE = 1.2   # antes 1.0
+# Objetivo por defecto: "first", "last", "strongest", "weakest" o "closest"
+TOWER_TARGETING = "first"
 PROJECTILE_SPEED = 6
 PROJECTILE_DAMAGE = 35
 
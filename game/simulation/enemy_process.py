@@ -3,25 +3,37 @@
 
 
 import simpy
-import random
+
+from game.alias_table import AliasTable
+from game.rng import RandomStreams
 
 
 class EnemyGenerator:
 
-    def __init__(self, env: simpy.Environment, num_towers: int, lambda_rate: float, mu_rate: float, metrics):
+    def __init__(self, env: simpy.Environment, num_towers: int, lambda_rate: float, mu_rate: float, metrics, rng: RandomStreams | None = None, enemy_tiers: list[dict] | None = None):
         
         self.env = env
+        # Llegadas y servicios usan flujos separados para que sean reproducibles
+        self.rng = rng if rng is not None else RandomStreams()
         self.server = simpy.Resource(env, capacity=num_towers)
         self.lambda_rate = lambda_rate
         self.mu_rate = mu_rate
         self.metrics = metrics
 
+        # Multiclase: cada llegada elige un tipo de enemigo con la misma tabla
+        # de alias que usa el juego. ``salud_factor`` alarga el servicio.
+        self.enemy_tiers = enemy_tiers or []
+        self.tier_table = AliasTable.from_tiers(self.enemy_tiers)
+
     def enemy_process(self, enemy_id: int):
 
         # Proceso de un enemigo: llegada, espera y servicio
 
         arrival_time = self.env.now
-        print(f"[{arrival_time:6.2f}] Enemigo {enemy_id} llega. ")
+        tier = self.enemy_tiers[self.tier_table.draw(self.rng.tier)] if self.tier_table else {}
+        name = tier.get("nombre", "")
+        label = f" ({name})" if name else ""
+        print(f"[{arrival_time:6.2f}] Enemigo {enemy_id}{label} llega. ")
 
         with self.server.request() as request:
             yield request
@@ -32,12 +44,14 @@ class EnemyGenerator:
 
         # Tiempo de servicio exponencial
 
-        service_time = random.expovariate(self.mu_rate)
+        service_time = self.rng.service.expovariate(self.mu_rate / tier.get("salud_factor", 1.0))
         yield self.env.timeout(service_time)
 
         print(f"[{self.env.now:6.2f}] Enemigo {enemy_id} elminado en {service_time:.2f}s ")
         self.metrics.enemies_defeated += 1
-        self.metrics.money += self.metrics.reward_per_enemy
+        self.metrics.money += tier.get("recompensa", self.metrics.reward_per_enemy)
+        if name:
+            self.metrics.defeated_by_tier[name] = self.metrics.defeated_by_tier.get(name, 0) + 1
 
     def generate_enemies(self):
 
@@ -45,6 +59,6 @@ class EnemyGenerator:
 
         enemy_id = 0
         while True:
-            yield self.env.timeout(random.expovariate(self.lambda_rate))
+            yield self.env.timeout(self.rng.arrivals.expovariate(self.lambda_rate))
             enemy_id += 1
             self.env.process(self.enemy_process(enemy_id))
\ No newline at end of file
@@ -5,17 +5,19 @@
 
 
 import simpy
+from game.rng import RandomStreams
 from .enemy_process import EnemyGenerator
 from .player_economy import PlayerEconomy
 from .metrics import SimulationMetrics
 
 class TowerDefenseEnv:
-    def __init__(self, num_towers: int, lambda_rate: float, mu_rate: float):
+    def __init__(self, num_towers: int, lambda_rate: float, mu_rate: float, seed: int | None = None, enemy_tiers: list[dict] | None = None):
 
         self.env = simpy.Environment()
         self.num_towers = num_towers
         self.lambda_rate = lambda_rate
         self.mu_rate = mu_rate
+        self.rng = RandomStreams(seed)
 
         # inicializador de metricas compartidas
 
@@ -29,7 +31,9 @@ class TowerDefenseEnv:
             num_towers = num_towers,
             lambda_rate = lambda_rate,
             mu_rate = mu_rate,
-            metrics = self.metrics
+            metrics = self.metrics,
+            rng = self.rng,
+            enemy_tiers = enemy_tiers
         )
 
         self.economy = PlayerEconomy (
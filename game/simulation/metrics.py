@@ -7,6 +7,8 @@ class SimulationMetrics:
         # Métricas generales
         self.wait_times = []
         self.enemies_defeated = 0
+        # Enemigos eliminados por tipo (simulación multiclase)
+        self.defeated_by_tier: dict[str, int] = {}
 
         # Economía del jugador
         self.money = 100.0
@@ -26,3 +28,5 @@ class SimulationMetrics:
         print(f"Torres finales: {towers}")
         print(f"Dinero final: {self.money:.2f}")
         print(f"Tiempo promedio de espera: {avg_wait:.2f}s")
+        for name, count in self.defeated_by_tier.items():
+            print(f"  {name}: {count} eliminados")
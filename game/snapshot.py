@@ -0,0 +1,403 @@
+# game/snapshot.py
+"""Snapshots binarios y versionados del estado de una partida.
+
+Un snapshot contiene todo lo necesario para continuar una partida en curso:
+contadores de oleada, dinero, vidas, enemigos, torres (con sus mejoras),
+proyectiles y, opcionalmente, el estado de los flujos aleatorios. No incluye
+el mapa: al restaurar se reutilizan los tiles, caminos y casillas del nivel ya
+cargado, y solo si el nivel es distinto se llama a ``load_level``.
+
+Formato (little endian)::
+
+    cabecera | tabla de cadenas | partida | calendario de la oleada | enemigos | torres | rng
+
+Las cadenas (estado, tipos de torre, sprite sets...) se guardan una sola vez
+en la tabla y el resto de registros las referencian por índice.
+
+Solo se leen snapshots de la versión :data:`VERSION`; cualquier cambio en
+los registros debe subirla.
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+from array import array
+from pathlib import Path
+
+from game import settings
+from game.rng import STREAMS
+from game.wave_schedule import WaveSchedule
+from entities.enemy import Enemy
+from entities.tower import Tower
+
+MAGIC = b"TDSS"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sHh")
+_U8 = struct.Struct("<B")
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+# estado, oleada, oleadas objetivo, enemigos por oleada, generados en la oleada,
+# oleada activa, oleada activa antes de pausar, spawn_timer, tiempo,
+# λ, multiplicador de velocidad, de salud, crecimiento de velocidad y de salud,
+# dinero, vidas, total generado, tiempo pendiente del paso fijo
+_GAME = struct.Struct("<BIIII??dddddddqqId")
+# camino, x, y, índice, velocidad, salud, salud máx., recompensa, vivo, radio,
+# color (r, g, b), sprite set, dirección, mira a la izquierda, frame, temporizador,
+# usa campo de flujo, casilla destino
+_ENEMY = struct.Struct("<HddIddqq?HBBBBB?Hd?i")
+# x, y, tipo, estrategia de objetivo, rango, cadencia, daño, velocidad de
+# proyectil, último disparo
+_TOWER = struct.Struct("<hhBBdddddH")
+# x, y, enemigo objetivo, velocidad, daño, impacto programado, punto de
+# impacto (x, y), instante del disparo, instante del impacto
+_PROJECTILE = struct.Struct("<ddidd?dddd")
+_MT_STATE = struct.Struct("<B?d")
+
+_DIRECTIONS = ("down", "up", "side")
+
+
+def _num(value: float):
+    """Devuelve ``int`` cuando el valor es entero, para conservar los tipos originales."""
+    return int(value) if float(value).is_integer() else value
+
+
+class _Strings:
+    def __init__(self):
+        self.values: list[str] = []
+        self._index: dict[str, int] = {}
+
+    def ref(self, value: str) -> int:
+        idx = self._index.get(value)
+        if idx is None:
+            idx = len(self.values)
+            self.values.append(value)
+            self._index[value] = idx
+        return idx
+
+    def pack(self) -> bytes:
+        parts = [_U16.pack(len(self.values))]
+        for value in self.values:
+            encoded = value.encode("utf-8")
+            parts.append(_U8.pack(len(encoded)))
+            parts.append(encoded)
+        return b"".join(parts)
+
+
+class _Reader:
+    def __init__(self, data: bytes):
+        self.view = memoryview(data)
+        self.offset = 0
+
+    def unpack(self, fmt: struct.Struct):
+        values = fmt.unpack_from(self.view, self.offset)
+        self.offset += fmt.size
+        return values
+
+    def take(self, size: int) -> memoryview:
+        chunk = self.view[self.offset: self.offset + size]
+        self.offset += size
+        return chunk
+
+
+# ----------------------------------------------------------------------
+# Captura
+# ----------------------------------------------------------------------
+def capture(game, include_rng: bool = True) -> bytes:
+    """Serializa la partida en curso de ``game``."""
+
+    if game.current_level_index is None:
+        raise ValueError("Solo se pueden guardar partidas con un nivel cargado")
+
+    strings = _Strings()
+    body: list[bytes] = []
+
+    body.append(
+        _GAME.pack(
+            strings.ref(game.state),
+            game.wave,
+            game.target_waves,
+            game.enemies_per_wave,
+            game.spawned_in_wave,
+            game.wave_active,
+            game._wave_was_active,
+            game.spawn_timer,
+            game.elapsed,
+            game.lambda_base,
+            game.speed_multiplier,
+            game.health_multiplier,
+            game.wave_speed_growth,
+            game.wave_health_growth,
+            game.money,
+            game.lives,
+            game.total_spawned,
+            game.sim_accumulator,
+        )
+    )
+    body.append(game.wave_schedule.to_bytes())
+
+    path_index = {id(path): idx for idx, path in enumerate(game.paths)}
+    enemy_index = {id(enemy): idx for idx, enemy in enumerate(game.enemies)}
+    body.append(_U32.pack(len(game.enemies)))
+    for enemy in game.enemies:
+        color = enemy.base_color
+        body.append(
+            _ENEMY.pack(
+                path_index.get(id(enemy.path), 0),
+                enemy.pos[0],
+                enemy.pos[1],
+                enemy.index,
+                enemy.speed,
+                enemy.health,
+                enemy.max_health,
+                enemy.reward,
+                enemy.alive,
+                enemy.base_radius,
+                color[0],
+                color[1],
+                color[2],
+                strings.ref(enemy.sprite_set),
+                _DIRECTIONS.index(enemy.direction),
+                enemy.facing_left,
+                enemy.frame_index,
+                enemy.animation_timer,
+                enemy.flow is not None,
+                enemy.cell,
+            )
+        )
+
+    upgrade_keys = list(settings.TOWER_UPGRADES)
+    body.append(_U16.pack(len(game.towers)))
+    for tower in game.towers:
+        # Los proyectiles cuyo objetivo ya salió de la lista (o cuya instancia
+        # se recicló para otro enemigo) no volverán a impactar, así que no se
+        # guardan.
+        projectiles = [
+            p
+            for p in tower.projectiles
+            if p.alive and id(p.target) in enemy_index and p.target.serial == p.target_serial
+        ]
+        body.append(
+            _TOWER.pack(
+                tower.pos[0],
+                tower.pos[1],
+                strings.ref(tower.type_key),
+                strings.ref(tower.targeting),
+                tower.range,
+                tower.fire_rate,
+                tower.damage,
+                tower.projectile_speed,
+                tower.last_shot,
+                len(projectiles),
+            )
+        )
+        body.append(bytes(tower.get_upgrade_level(key) for key in upgrade_keys))
+        for p in projectiles:
+            scheduled = p.hit_time is not None
+            impact = p.impact if scheduled else (0.0, 0.0)
+            body.append(
+                _PROJECTILE.pack(
+                    p.pos[0],
+                    p.pos[1],
+                    enemy_index[id(p.target)],
+                    p.speed,
+                    p.damage,
+                    scheduled,
+                    impact[0],
+                    impact[1],
+                    p.fire_time,
+                    p.hit_time if scheduled else 0.0,
+                )
+            )
+
+    body.append(_U8.pack(include_rng))
+    if include_rng:
+        rng_state = game.rng.getstate()
+        body.append(struct.pack("<Q", rng_state["seed"]))
+        for name in STREAMS:
+            mt_version, internal, gauss = rng_state["streams"][name]
+            body.append(_MT_STATE.pack(mt_version, gauss is not None, gauss or 0.0))
+            body.append(array("I", internal).tobytes())
+        extra = json.dumps(rng_state.get("numpy", {})).encode("utf-8")
+        body.append(_U32.pack(len(extra)))
+        body.append(extra)
+
+    header = _HEADER.pack(MAGIC, VERSION, game.current_level_index)
+    return header + strings.pack() + _U8.pack(len(upgrade_keys)) + b"".join(body)
+
+
+# ----------------------------------------------------------------------
+# Restauración
+# ----------------------------------------------------------------------
+def restore(game, data: bytes, restore_rng: bool = True):
+    """Aplica sobre ``game`` un snapshot creado con :func:`capture`."""
+
+    reader = _Reader(data)
+    magic, version, level_index = reader.unpack(_HEADER)
+    if magic != MAGIC:
+        raise ValueError("Los datos no corresponden a un snapshot de partida")
+    if version != VERSION:
+        raise ValueError(
+            f"Snapshot de la versión {version}: este juego solo lee la versión {VERSION}"
+        )
+
+    (count,) = reader.unpack(_U16)
+    strings = []
+    for _ in range(count):
+        (length,) = reader.unpack(_U8)
+        strings.append(bytes(reader.take(length)).decode("utf-8"))
+    (num_upgrades,) = reader.unpack(_U8)
+
+    if game.current_level_index != level_index or not game.paths:
+        game.load_level(level_index)
+
+    (
+        state,
+        game.wave,
+        game.target_waves,
+        game.enemies_per_wave,
+        game.spawned_in_wave,
+        wave_active,
+        wave_was_active,
+        game.spawn_timer,
+        game.elapsed,
+        game.lambda_base,
+        game.speed_multiplier,
+        game.health_multiplier,
+        game.wave_speed_growth,
+        game.wave_health_growth,
+        game.money,
+        game.lives,
+        game.total_spawned,
+        game.sim_accumulator,
+    ) = reader.unpack(_GAME)
+    game.render_alpha = 1.0
+    game.wave_schedule, reader.offset = WaveSchedule.from_bytes(reader.view, reader.offset)
+
+    # Las entidades actuales vuelven a sus reservas; las restauradas salen de ellas
+    game.release_entities()
+    paths = game.paths
+    (num_enemies,) = reader.unpack(_U32)
+    enemies = []
+    for _ in range(num_enemies):
+        (
+            path_idx, x, y, index, speed, health, max_health, reward, alive, radius,
+            r, g, b, sprite_idx, direction, facing_left, frame_index, animation_timer,
+            uses_flow, cell,
+        ) = reader.unpack(_ENEMY)
+        enemies.append(
+            Enemy.restore(
+                paths[path_idx] if path_idx < len(paths) else paths[0],
+                pos=(x, y),
+                index=index,
+                speed=speed,
+                health=_num(health),
+                max_health=max_health,
+                reward=reward,
+                alive=alive,
+                radius=radius,
+                color=(r, g, b),
+                sprite_set=strings[sprite_idx],
+                direction=_DIRECTIONS[direction],
+                facing_left=facing_left,
+                frame_index=frame_index,
+                animation_timer=animation_timer,
+                flow=game.flow_field if uses_flow else None,
+                cell=cell,
+                pool=game.enemy_pool,
+            )
+        )
+
+    upgrade_keys = list(settings.TOWER_UPGRADES)[:num_upgrades]
+    (num_towers,) = reader.unpack(_U16)
+    towers = []
+    for _ in range(num_towers):
+        (
+            x, y, type_idx, targeting_idx, rng_, fire_rate, damage, proj_speed, last_shot,
+            num_proj,
+        ) = reader.unpack(_TOWER)
+        tower = Tower((x, y), strings[type_idx], game.projectile_pool)
+        tower.targeting = strings[targeting_idx]
+        tower.range = _num(rng_)
+        tower.fire_rate = _num(fire_rate)
+        tower.damage = _num(damage)
+        tower.projectile_speed = _num(proj_speed)
+        tower.last_shot = last_shot
+        levels = reader.take(num_upgrades)
+        for key, level in zip(upgrade_keys, levels):
+            tower.upgrade_levels[key] = level
+        for _ in range(num_proj):
+            (
+                px, py, target_idx, speed, damage, scheduled, impact_x, impact_y,
+                fire_time, hit_time,
+            ) = reader.unpack(_PROJECTILE)
+            # Los proyectiles de impacto programado no se mueven: su posición es
+            # siempre la de la torre
+            origin = tower.pos if scheduled else (px, py)
+            projectile = game.projectile_pool.acquire(
+                origin, enemies[target_idx], _num(damage), _num(speed)
+            )
+            if scheduled:
+                projectile.aim((impact_x, impact_y), fire_time, hit_time)
+            tower.projectiles.append(projectile)
+        towers.append(tower)
+
+    (has_rng,) = reader.unpack(_U8)
+    if has_rng:
+        (seed,) = struct.unpack_from("<Q", reader.take(8))
+        streams = {}
+        for name in STREAMS:
+            mt_version, has_gauss, gauss = reader.unpack(_MT_STATE)
+            internal = array("I")
+            internal.frombytes(reader.take(625 * internal.itemsize))
+            streams[name] = (mt_version, tuple(internal), gauss if has_gauss else None)
+        (extra_len,) = reader.unpack(_U32)
+        numpy_state = json.loads(bytes(reader.take(extra_len)).decode("utf-8"))
+        if restore_rng:
+            game.rng.setstate({"seed": seed, "streams": streams, "numpy": numpy_state})
+
+    game.enemies = enemies
+    game.enemy_index.rebuild(enemies)
+    game.towers = towers
+    game.tower_scheduler.clear()
+    game.hits.clear()
+    for tower in towers:
+        for projectile in tower.projectiles:
+            if projectile.hit_time is not None:
+                game.hits.schedule(projectile, tower)
+    occupied = {tower.pos for tower in towers}
+    for spot in game.spots:
+        spot.occupied = spot.pos in occupied
+
+    game.overlay_buttons = []
+    game.tower_menu = None
+    game.build_menu = None
+    game.pause_button["text"] = "Menú"
+
+    # Los estados con overlay se reconstruyen con sus propios métodos para que
+    # los botones queden igual que en la partida original.
+    game.state = "playing"
+    game.wave_active = wave_active
+    game._wave_was_active = wave_was_active
+    state = strings[state]
+    if state == "paused":
+        game.wave_active = wave_was_active
+        game.enter_pause_menu()
+    elif state == "game_over":
+        game.trigger_game_over()
+    elif state in {"level_complete", "victory"}:
+        game.handle_level_complete()
+    # Los eventos emitidos al reconstruir el estado no corresponden a la partida
+    game.events.clear()
+    game.queue_stats.reset()
+
+
+def save(game, path: str | Path, include_rng: bool = True) -> Path:
+    path = Path(path)
+    path.write_bytes(capture(game, include_rng=include_rng))
+    return path
+
+
+def load(game, path: str | Path, restore_rng: bool = True):
+    restore(game, Path(path).read_bytes(), restore_rng=restore_rng)
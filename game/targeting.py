@@ -0,0 +1,423 @@
+# game/targeting.py
+"""Estrategias de selección de objetivo para las torres.
+
+Cada torre elige a quién dispara según su ``targeting``:
+
+- ``"first"``: el enemigo en alcance más avanzado en su recorrido;
+- ``"last"``: el menos avanzado;
+- ``"strongest"`` / ``"weakest"``: el de más / menos salud;
+- ``"closest"``: el más cercano a la torre.
+
+Para no recorrer (ni ordenar) todos los enemigos en cada disparo,
+:class:`EnemyIndex` los mantiene repartidos en las casillas del mapa. Cada
+enemigo cambia de casilla como mucho una vez por paso y solo entonces se mueve
+de lista. Una torre consulta únicamente las casillas que toca su círculo de
+alcance (calculadas una vez por alcance), de modo que el coste de elegir
+objetivo depende de cuántos enemigos tiene cerca y no del tamaño de la
+oleada. Además:
+
+- cada casilla guarda una cota superior de la salud de sus enemigos (la salud
+  solo baja; se ajusta cada vez que se recorre la casilla) y ``"strongest"``
+  las visita de mayor a menor cota, parando cuando ninguna puede mejorar al
+  mejor candidato;
+- ``"first"`` y ``"last"`` hacen lo mismo con cotas fijas por casilla de la
+  distancia que le queda a un enemigo hasta el final (calculadas por nivel a
+  partir de los caminos o de las distancias del campo de flujo);
+- ``"closest"`` recorre las casillas de la más cercana a la más lejana y se
+  detiene en cuanto ninguna restante puede tener un enemigo más cerca;
+- ``"weakest"`` no tiene cota útil (la salud baja sin pasar por el índice) y
+  examina todos los enemigos de las casillas al alcance.
+
+Los empates se resuelven a favor del enemigo que apareció antes (menor
+``serial``), igual que el orden de la lista, para que el resultado no dependa
+del orden interno de las casillas.
+"""
+
+from __future__ import annotations
+
+import math
+
+from game import settings
+
+INF = float("inf")
+
+# Estrategias disponibles, en el orden en que las recorre el menú de la torre
+STRATEGIES = {
+    "first": "Primero",
+    "last": "Último",
+    "strongest": "Más fuerte",
+    "weakest": "Más débil",
+    "closest": "Más cercano",
+}
+
+
+def next_strategy(current: str) -> str:
+    """Estrategia que sigue a ``current`` en el ciclo del menú."""
+    keys = list(STRATEGIES)
+    index = keys.index(current) if current in keys else -1
+    return keys[(index + 1) % len(keys)]
+
+
+def remaining_distance(enemy, cache: dict | None = None) -> float:
+    """Distancia que le queda a ``enemy`` hasta el final de su recorrido.
+
+    ``cache`` guarda por camino las longitudes restantes desde cada punto.
+    """
+    x, y = enemy.pos
+    flow = enemy.flow
+    if flow is not None:
+        cell = enemy.cell
+        if cell < 0:
+            return 0.0
+        cx, cy = flow.center(cell)
+        return flow.distance[cell] * flow.tile_size + math.hypot(cx - x, cy - y)
+    path = enemy.path
+    following = enemy.index + 1
+    if following >= len(path):
+        return 0.0
+    remaining = cache.get(id(path)) if cache is not None else None
+    if remaining is None:
+        remaining = _path_remaining(path)
+        if cache is not None:
+            cache[id(path)] = remaining
+    bx, by = path[following]
+    return remaining[following] + math.hypot(bx - x, by - y)
+
+
+def _key(enemy, strategy: str, distance: float, remaining) -> tuple:
+    """Clave de orden de ``enemy`` para ``strategy`` (menor es mejor)."""
+    if strategy == "closest":
+        return (distance, enemy.serial)
+    if strategy == "strongest":
+        return (-enemy.health, enemy.serial)
+    if strategy == "weakest":
+        return (enemy.health, enemy.serial)
+    if strategy == "last":
+        return (-remaining(enemy), enemy.serial)
+    return (remaining(enemy), enemy.serial)
+
+
+def select(enemies, center, radius: float, strategy: str):
+    """Como :meth:`EnemyIndex.select`, recorriendo la lista ``enemies`` entera."""
+    cx, cy = center
+    best = None
+    best_key = None
+    for enemy in enemies:
+        if not enemy.alive:
+            continue
+        distance = math.hypot(enemy.pos[0] - cx, enemy.pos[1] - cy)
+        if distance > radius:
+            continue
+        key = _key(enemy, strategy, distance, remaining_distance)
+        if best_key is None or key < best_key:
+            best, best_key = enemy, key
+    return best
+
+
+def _path_remaining(path) -> list[float]:
+    """Distancia desde cada punto de ``path`` hasta su final."""
+    remaining = [0.0] * len(path)
+    for i in range(len(path) - 2, -1, -1):
+        (ax, ay), (bx, by) = path[i], path[i + 1]
+        remaining[i] = remaining[i + 1] + math.hypot(bx - ax, by - ay)
+    return remaining
+
+
+class EnemyIndex:
+    """Enemigos agrupados por casilla para elegir objetivo sin recorrerlos todos.
+
+    La rejilla cubre el mapa del nivel (``origin`` y ``size`` en píxeles); los
+    enemigos que se salen de ella cuentan en la casilla del borde más cercana.
+    """
+
+    def __init__(
+        self,
+        origin=(0, 0),
+        size=(0, 0),
+        paths=(),
+        flow=None,
+        tile_size: int = settings.TILE_SIZE,
+    ):
+        self.tile_size = tile_size
+        self.origin = (origin[0], origin[1])
+        self.columns = max(1, -(-int(size[0]) // tile_size))
+        self.rows = max(1, -(-int(size[1]) // tile_size))
+        cells = self.columns * self.rows
+        # Diccionarios como conjuntos ordenados: retirar un enemigo cuesta O(1)
+        # y el orden de recorrido es determinista
+        self.buckets: list[dict] = [{} for _ in range(cells)]
+        # Cota superior de la salud de los enemigos de cada casilla
+        self.max_health = [0] * cells
+        # Longitud restante desde cada punto de paso, por camino
+        self._remaining = {id(path): _path_remaining(path) for path in paths}
+        # Cotas de la distancia restante de cualquier enemigo dentro de cada
+        # casilla; sin información, 0 e infinito (nunca descartan la casilla)
+        self.progress_min = [0.0] * cells
+        self.progress_max = [INF] * cells
+        self._bound_progress(paths, flow)
+        # Casillas que toca cada círculo (centro, alcance), ordenadas por
+        # cercanía, por menor avance restante y por mayor avance restante
+        self._coverage: dict = {}
+        self._by_progress: dict = {}
+        self._by_regress: dict = {}
+        self.count = 0
+        # Cota superior de la velocidad (píxeles por frame de referencia) de
+        # los enemigos del índice; solo crece hasta el próximo ``clear``
+        self.max_speed = 0.0
+
+    def _bound_progress(self, paths, flow):
+        size = self.tile_size
+        lower: dict[int, float] = {}
+        upper: dict[int, float] = {}
+
+        def bound(cell: int, low: float, high: float):
+            lower[cell] = min(lower.get(cell, INF), low)
+            upper[cell] = max(upper.get(cell, 0.0), high)
+
+        if flow is not None:
+            # Un enemigo en una casilla va hacia su centro o hacia la siguiente
+            # (vecinas, a una casilla de distancia): dos casillas de margen
+            # cubren los cruces por las esquinas.
+            for cell, steps in enumerate(flow.distance):
+                if steps >= 0:
+                    x, y = flow.center(cell)
+                    bound(self.cell_of(x, y), max(0, steps - 2) * size, (steps + 2) * size)
+        for path in paths:
+            remaining = self._remaining[id(path)]
+            for i in range(len(path) - 1):
+                # Todo punto del tramo i tiene una distancia restante entre la
+                # de sus extremos; se marcan las casillas de su caja envolvente.
+                (ax, ay), (bx, by) = path[i], path[i + 1]
+                col_lo, row_lo = self._col_row(min(ax, bx) - 1, min(ay, by) - 1)
+                col_hi, row_hi = self._col_row(max(ax, bx) + 1, max(ay, by) + 1)
+                for row in range(row_lo, row_hi + 1):
+                    for col in range(col_lo, col_hi + 1):
+                        bound(row * self.columns + col, remaining[i + 1], remaining[i])
+        for cell, low in lower.items():
+            self.progress_min[cell] = low
+            self.progress_max[cell] = upper[cell]
+
+    def __len__(self) -> int:
+        return self.count
+
+    def clear(self):
+        for bucket in self.buckets:
+            for enemy in bucket:
+                enemy.grid_cell = -1
+            bucket.clear()
+        self.max_health = [0] * len(self.buckets)
+        self.count = 0
+        self.max_speed = 0.0
+
+    # ------------------------------------------------------------------
+    # Mantenimiento
+    # ------------------------------------------------------------------
+    def _col_row(self, x: float, y: float) -> tuple[int, int]:
+        col = int((x - self.origin[0]) // self.tile_size)
+        row = int((y - self.origin[1]) // self.tile_size)
+        col = 0 if col < 0 else self.columns - 1 if col >= self.columns else col
+        row = 0 if row < 0 else self.rows - 1 if row >= self.rows else row
+        return col, row
+
+    def cell_of(self, x: float, y: float) -> int:
+        col, row = self._col_row(x, y)
+        return row * self.columns + col
+
+    def add(self, enemy):
+        cell = self.cell_of(enemy.pos[0], enemy.pos[1])
+        enemy.grid_cell = cell
+        self.buckets[cell][enemy] = None
+        if enemy.health > self.max_health[cell]:
+            self.max_health[cell] = enemy.health
+        if enemy.speed > self.max_speed:
+            self.max_speed = enemy.speed
+        self.count += 1
+
+    def remove(self, enemy):
+        cell = enemy.grid_cell
+        if cell < 0:
+            return
+        bucket = self.buckets[cell]
+        del bucket[enemy]
+        if not bucket:
+            self.max_health[cell] = 0
+        enemy.grid_cell = -1
+        self.count -= 1
+
+    def move(self, enemy):
+        """Actualiza la casilla de ``enemy`` tras avanzarlo."""
+        # Se llama para cada enemigo en cada paso: el caso habitual (sigue en
+        # la misma casilla) evita las llamadas auxiliares
+        x, y = enemy.pos
+        ox, oy = self.origin
+        size = self.tile_size
+        columns = self.columns
+        col = int((x - ox) // size)
+        row = int((y - oy) // size)
+        if 0 <= col < columns and 0 <= row < self.rows:
+            cell = row * columns + col
+        else:
+            cell = self.cell_of(x, y)
+        if cell != enemy.grid_cell:
+            self.remove(enemy)
+            self.add(enemy)
+
+    def rebuild(self, enemies):
+        """Vuelve a indexar los enemigos vivos de ``enemies``."""
+        self.clear()
+        for enemy in enemies:
+            if enemy.alive:
+                self.add(enemy)
+
+    # ------------------------------------------------------------------
+    # Consultas
+    # ------------------------------------------------------------------
+    def remaining(self, enemy) -> float:
+        """Distancia que le queda a ``enemy`` hasta el final de su recorrido."""
+        return remaining_distance(enemy, self._remaining)
+
+    def coverage(self, center, radius: float) -> list[tuple[float, int]]:
+        """``(distancia mínima, casilla)`` de las casillas que toca el círculo."""
+        key = (center[0], center[1], radius)
+        cells = self._coverage.get(key)
+        if cells is not None:
+            return cells
+        size = self.tile_size
+        ox, oy = self.origin
+        cx, cy = center
+        col_lo = max(0, int((cx - radius - ox) // size))
+        col_hi = min(self.columns - 1, int((cx + radius - ox) // size))
+        row_lo = max(0, int((cy - radius - oy) // size))
+        row_hi = min(self.rows - 1, int((cy + radius - oy) // size))
+        cells = []
+        for row in range(row_lo, row_hi + 1):
+            top = oy + row * size
+            dy = max(top - cy, 0, cy - (top + size))
+            for col in range(col_lo, col_hi + 1):
+                left = ox + col * size
+                dx = max(left - cx, 0, cx - (left + size))
+                gap = math.hypot(dx, dy)
+                if gap <= radius:
+                    cells.append((gap, row * self.columns + col))
+        # Un enemigo fuera del mapa cuenta en la casilla del borde que contiene
+        # su proyección sobre la rejilla, que nunca está más lejos de una torre
+        # (dentro del mapa) que el propio enemigo: basta con estas casillas.
+        cells.sort()
+        self._coverage[key] = cells
+        return cells
+
+    def entry_delay(self, center, radius: float) -> float:
+        """Cota inferior de los segundos hasta que algún enemigo pueda entrar en el círculo.
+
+        Un enemigo nunca se acerca más rápido que su velocidad. Se recorren
+        anillos de casillas alrededor de ``center``, como mucho
+        ``radius // tile_size + 3``: las casillas ocupadas fuera del alcance
+        aportan ``(distancia a la casilla - radius) / max_speed`` sin mirar sus
+        enemigos, y en las que toca el círculo (las mismas que acaba de
+        recorrer :meth:`select`) se usa la distancia y velocidad de cada uno.
+        Más allá del último anillo basta con su distancia: la torre volverá a
+        mirar al despertar.
+        """
+        if not self.count or self.max_speed <= 0:
+            return INF
+        size = self.tile_size
+        ox, oy = self.origin
+        cx, cy = center
+        columns, rows = self.columns, self.rows
+        buckets = self.buckets
+        fastest = self.max_speed * settings.SPEED_REFERENCE_HZ
+        col0, row0 = self._col_row(cx, cy)
+        # Anillos hasta el borde más lejano de la rejilla
+        last = max(col0, columns - 1 - col0, row0, rows - 1 - row0)
+        rings = min(last + 1, int(radius // size) + 3)
+        best = INF
+        for ring in range(rings):
+            # Entre la casilla de ``center`` y las del anillo hay ring - 1 casillas
+            if ((ring - 1) * size - radius) / fastest >= best:
+                break
+            row_lo, row_hi = row0 - ring, row0 + ring
+            col_lo, col_hi = col0 - ring, col0 + ring
+            for row in range(max(0, row_lo), min(rows - 1, row_hi) + 1):
+                if row == row_lo or row == row_hi:
+                    cols = range(max(0, col_lo), min(columns - 1, col_hi) + 1)
+                else:
+                    cols = [col for col in (col_lo, col_hi) if 0 <= col < columns]
+                top = oy + row * size
+                dy = max(top - cy, 0, cy - (top + size))
+                for col in cols:
+                    bucket = buckets[row * columns + col]
+                    if not bucket:
+                        continue
+                    left = ox + col * size
+                    dx = max(left - cx, 0, cx - (left + size))
+                    gap = math.hypot(dx, dy)
+                    if gap > radius:
+                        # Fuera del alcance basta la cota de la casilla
+                        best = min(best, (gap - radius) / fastest)
+                        continue
+                    # Casilla que ``select`` ya recorrió: cota exacta por enemigo
+                    for enemy in bucket:
+                        speed = enemy.speed
+                        if not enemy.alive or speed <= 0:
+                            continue
+                        distance = math.hypot(enemy.pos[0] - cx, enemy.pos[1] - cy)
+                        delay = (distance - radius) / (speed * settings.SPEED_REFERENCE_HZ)
+                        if delay < best:
+                            best = delay
+        else:
+            if rings <= last:
+                best = min(best, ((rings - 1) * size - radius) / fastest)
+        return max(0.0, best)
+
+    def _ordered(self, center, radius: float, strategy: str) -> list[tuple[float, int]]:
+        """Casillas al alcance con la cota que permite cortar el recorrido.
+
+        La cota es el menor valor posible de la clave de ``strategy`` dentro
+        de la casilla, y las casillas salen ordenadas por ella: en cuanto una
+        supera la clave del mejor candidato, ninguna de las siguientes puede
+        mejorarlo.
+        """
+        cells = self.coverage(center, radius)
+        if strategy == "strongest":
+            # Las cotas de salud cambian durante la partida: se ordena cada vez
+            max_health = self.max_health
+            return sorted((-max_health[cell], cell) for _, cell in cells)
+        if strategy == "first":
+            cache, bounds = self._by_progress, self.progress_min
+        elif strategy == "last":
+            cache, bounds = self._by_regress, [-bound for bound in self.progress_max]
+        else:
+            return cells
+        key = (center[0], center[1], radius)
+        ordered = cache.get(key)
+        if ordered is None:
+            ordered = cache[key] = sorted((bounds[cell], cell) for _, cell in cells)
+        return ordered
+
+    def select(self, center, radius: float, strategy: str):
+        """Enemigo vivo en el círculo que mejor cumple ``strategy``, o ``None``."""
+        cx, cy = center
+        buckets = self.buckets
+        max_health = self.max_health
+        remaining = self.remaining
+        bounded = strategy != "weakest"
+        best = None
+        best_key = None
+        for bound, cell in self._ordered(center, radius, strategy):
+            if bounded and best is not None and bound > best_key[0]:
+                break
+            strongest = 0
+            for enemy in buckets[cell]:
+                if not enemy.alive:
+                    continue
+                if enemy.health > strongest:
+                    strongest = enemy.health
+                distance = math.hypot(enemy.pos[0] - cx, enemy.pos[1] - cy)
+                if distance > radius:
+                    continue
+                key = _key(enemy, strategy, distance, remaining)
+                if best_key is None or key < best_key:
+                    best, best_key = enemy, key
+            # Tras recorrerla, la cota de la casilla pasa a ser exacta
+            max_health[cell] = strongest
+        return best
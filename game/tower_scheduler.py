@@ -0,0 +1,169 @@
+# game/tower_scheduler.py
+"""Disparo de torres guiado por eventos.
+
+En lugar de que cada torre compruebe en cada frame si ya recargó y recorra
+los enemigos buscando objetivo, :class:`TowerScheduler` guarda en un
+montículo el próximo instante en que cada torre necesita atención:
+
+- tras disparar, el fin de la recarga (``last_shot + 1 / fire_rate``);
+- si al despertar no hay ningún enemigo en alcance, la torre duerme hasta el
+  primer instante en que alguno *podría* entrar en su radio:
+  ``(distancia - alcance) / velocidad`` con la casilla ocupada más cercana
+  del ``EnemyIndex`` y la mayor velocidad de sus enemigos, una cota inferior
+  porque un enemigo nunca se acerca más rápido que su velocidad
+  (:meth:`game.targeting.EnemyIndex.entry_delay`). Cada enemigo nuevo
+  adelanta el despertar de las torres dormidas si le corresponde una cota
+  menor.
+
+Como las cotas nunca se pasan del instante real de entrada, las torres
+disparan en los mismos ticks que con la comprobación por frame, pero las que
+recargan o no tienen enemigos cerca no cuestan nada. Los proyectiles solo se
+actualizan en las torres que tienen alguno en vuelo.
+"""
+
+from __future__ import annotations
+
+import heapq
+
+from utils.helpers import compact
+
+INF = float("inf")
+# Margen para que el redondeo de una cota nunca retrase un despertar un tick
+EPSILON = 1e-9
+
+
+class TowerScheduler:
+    """Montículo de próximos despertares de las torres de una partida."""
+
+    def __init__(self):
+        self._heap: list = []
+        self._seq = 0
+        # Diccionarios como conjuntos ordenados: el orden de inserción es
+        # determinista (a diferencia de un ``set`` de objetos).
+        self._towers: dict = {}
+        self._sleeping: dict = {}
+        self._armed: list = []
+        # Enemigos aparecidos en este tick, pendientes de avisar a las torres
+        self._arrivals: list = []
+        self.wakeups = 0
+
+    def __len__(self) -> int:
+        return len(self._towers)
+
+    def clear(self):
+        for tower in self._towers:
+            tower.armed = False
+        self._heap.clear()
+        self._towers.clear()
+        self._sleeping.clear()
+        self._armed.clear()
+        self._arrivals.clear()
+
+    # ------------------------------------------------------------------
+    # Planificación
+    # ------------------------------------------------------------------
+    def _push(self, tower, when: float):
+        tower.wake_time = when
+        if when < INF:
+            self._seq += 1
+            heapq.heappush(self._heap, (when, self._seq, tower))
+
+    def sync(self, towers, now: float):
+        """Registra las torres de ``towers`` que aún no se conocen."""
+        if len(towers) == len(self._towers):
+            return
+        for tower in towers:
+            if tower not in self._towers:
+                self._towers[tower] = None
+                self._push(tower, now)
+                if tower.projectiles:
+                    self.arm(tower)
+
+    def wake(self, tower, when: float):
+        """Adelanta el próximo despertar de ``tower`` a ``when`` si es anterior."""
+        if tower in self._towers and when < tower.wake_time:
+            self._sleeping.pop(tower, None)
+            self._push(tower, when)
+
+    def arm(self, tower):
+        if not tower.armed:
+            tower.armed = True
+            self._armed.append(tower)
+
+    def enemy_appeared(self, enemy):
+        """Anota un enemigo nuevo; se tiene en cuenta en el próximo ``update``.
+
+        Las cotas se calculan allí, con la posición ya avanzada en el paso de
+        los enemigos, para que sean válidas desde ese mismo instante.
+        """
+        self._arrivals.append(enemy)
+
+    def _notify_arrivals(self, now: float):
+        for enemy in self._arrivals:
+            if not enemy.alive:
+                continue
+            # Despierta antes a las torres dormidas a las que puede llegar (y
+            # siguen dormidas: otro enemigo nuevo puede adelantarlas más)
+            for tower in self._sleeping:
+                when = now + tower.entry_delay(enemy) - EPSILON
+                if when < tower.wake_time:
+                    self._push(tower, when)
+        self._arrivals.clear()
+
+    def _pop_due(self, now: float) -> list:
+        heap = self._heap
+        due = []
+        while heap and heap[0][0] <= now:
+            when, _, tower = heapq.heappop(heap)
+            # Entradas obsoletas: la torre se reprogramó o ya no está
+            if tower.wake_time != when or tower not in self._towers:
+                continue
+            tower.wake_time = INF
+            self._sleeping.pop(tower, None)
+            due.append(tower)
+        return due
+
+    # ------------------------------------------------------------------
+    # Paso de simulación
+    # ------------------------------------------------------------------
+    def update(self, towers, enemies, now: float, dt: float, events=None, hits=None, index=None):
+        self.sync(towers, now)
+        if self._arrivals:
+            self._notify_arrivals(now)
+
+        # Proyectiles en vuelo, solo de las torres que los tienen
+        def step(tower):
+            if tower.update_projectiles(dt, events, hits):
+                return True
+            tower.armed = False
+            return False
+
+        if self._armed:
+            compact(self._armed, step)
+
+        # Torres cuyo despertar venció. Las que se reprograman aquí no vuelven
+        # a salir en este mismo tick.
+        for tower in self._pop_due(now):
+            self.wakeups += 1
+            reload_time = 1 / tower.fire_rate
+            if now - tower.last_shot < reload_time:
+                self._push(tower, tower.last_shot + reload_time)
+                continue
+            delay = tower.try_fire(enemies, now, events, hits, index)
+            # La cota también puede ser 0 sin disparo (un enemigo en una
+            # casilla al alcance pero fuera del radio): se vuelve a mirar en el
+            # próximo tick
+            if tower.last_shot == now:
+                self.arm(tower)
+                self._push(tower, now + reload_time)
+            else:
+                self._sleeping[tower] = None
+                self._push(tower, now + delay - EPSILON if delay < INF else INF)
+
+    def stats(self) -> dict:
+        return {
+            "towers": len(self._towers),
+            "sleeping": len(self._sleeping),
+            "armed": len(self._armed),
+            "wakeups": self.wakeups,
+        }
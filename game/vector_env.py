@@ -0,0 +1,308 @@
+# game/vector_env.py
+"""Varias partidas de :class:`game.agent_env.GameEnv` avanzando a la vez.
+
+- :class:`VectorGameEnv` las ejecuta en el propio proceso y escribe las
+  observaciones directamente en un arreglo ``(N, D)`` reservado una vez.
+- :class:`SubprocVectorGameEnv` reparte las partidas entre procesos
+  trabajadores. Acciones, observaciones, recompensas, indicadores de fin y
+  máscaras de acciones viven en memoria compartida (``RawArray``): cada
+  trabajador escribe sus filas en su sitio y por las tuberías solo viaja la
+  orden y la información de los episodios que terminan.
+
+Con ``board=True`` cada partida vuelca además su tablero
+(:mod:`game.observation`) en la fila ``i`` de ``boards``, un arreglo
+``(N, board_size)`` del mismo bloque; ``board_views(boards, shape)`` lo ve
+como ``(N, canales, filas, columnas)`` sin copiarlo.
+
+Ambas devuelven en ``step`` arreglos ``(obs, recompensas, terminados,
+truncados, infos)`` y reinician automáticamente las partidas que terminan:
+la observación devuelta para esa fila es ya la del nuevo episodio y la final
+queda en ``infos[i]["final_observation"]``. Los arreglos devueltos son vistas
+de los búferes internos y se sobrescriben en el siguiente ``step``.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import random
+
+import numpy as np
+
+from game.agent_env import GameEnv
+from game.level_cache import LevelCache
+from game.rng import derive_seed
+
+
+def _env_seeds(seed: int | None, count: int, offset: int = 0) -> list[int]:
+    """Semillas reproducibles e independientes para ``count`` partidas."""
+    if seed is None:
+        seed = random.randrange(2**63)
+    return [derive_seed(seed, "env", offset + i) for i in range(count)]
+
+
+def _new_level_cache() -> LevelCache:
+    from maps import LEVELS
+
+    return LevelCache(LEVELS)
+
+
+class _Buffers:
+    """Arreglos de un lote de partidas sobre un bloque de memoria común."""
+
+    def __init__(
+        self, num_envs: int, observation_size: int, num_actions: int, board_size: int = 0, block=None
+    ):
+        layout, nbytes = self.layout(num_envs, observation_size, num_actions, board_size)
+        self.block = block if block is not None else bytearray(nbytes)
+        memory = memoryview(self.block).cast("B")
+        for name, dtype, shape, offset in layout:
+            count = int(np.prod(shape))
+            view = np.frombuffer(memory, dtype=dtype, count=count, offset=offset)
+            setattr(self, name, view.reshape(shape))
+
+    @staticmethod
+    def layout(num_envs: int, observation_size: int, num_actions: int, board_size: int = 0):
+        """``(nombre, dtype, forma, desplazamiento)`` de cada arreglo y tamaño total."""
+        arrays = (
+            ("observations", np.float32, (num_envs, observation_size)),
+            ("rewards", np.float32, (num_envs,)),
+            ("terminated", np.bool_, (num_envs,)),
+            ("truncated", np.bool_, (num_envs,)),
+            ("actions", np.int64, (num_envs,)),
+            ("masks", np.bool_, (num_envs, num_actions)),
+            ("boards", np.float32, (num_envs, board_size)),
+        )
+        layout = []
+        offset = 0
+        for name, dtype, shape in arrays:
+            layout.append((name, dtype, shape, offset))
+            # Cada arreglo empieza alineado a 8 bytes
+            nbytes = int(np.prod(shape)) * np.dtype(dtype).itemsize
+            offset += -(-nbytes // 8) * 8
+        return layout, max(8, offset)
+
+
+class VectorGameEnv:
+    """``num_envs`` partidas independientes en este proceso, en paso sincronizado."""
+
+    def __init__(self, num_envs: int, level: int = 0, seed: int | None = None, **env_kwargs):
+        cache = env_kwargs.pop("level_cache", None) or _new_level_cache()
+        seeds = _env_seeds(seed, num_envs)
+        self.envs = [GameEnv(level, level_cache=cache, seed=s, **env_kwargs) for s in seeds]
+        first = self.envs[0]
+        self.num_envs = num_envs
+        self.observation_size = first.observation_size
+        self.num_actions = first.num_actions
+        self.board_shape = first.board_shape
+        self.buffers = _Buffers(
+            num_envs, self.observation_size, self.num_actions, first.board_size
+        )
+        self.boards = self.buffers.boards
+        _bind_boards(self.envs, self.boards)
+
+    def reset(self, seed: int | None = None):
+        seeds = _env_seeds(seed, self.num_envs) if seed is not None else [None] * self.num_envs
+        observations = self.buffers.observations
+        infos = [
+            env.reset(seed=s, out=observations[i])[1]
+            for i, (env, s) in enumerate(zip(self.envs, seeds))
+        ]
+        return observations, infos
+
+    def step(self, actions):
+        buffers = self.buffers
+        observations = buffers.observations
+        infos = []
+        for i, (env, action) in enumerate(zip(self.envs, actions)):
+            _, reward, terminated, truncated, info = env.step(action, out=observations[i])
+            buffers.rewards[i] = reward
+            buffers.terminated[i] = terminated
+            buffers.truncated[i] = truncated
+            if terminated or truncated:
+                _record_final(env, info, observations[i])
+                env.reset(out=observations[i])
+            infos.append(info)
+        return observations, buffers.rewards, buffers.terminated, buffers.truncated, infos
+
+    def action_masks(self) -> np.ndarray:
+        masks = self.buffers.masks
+        for i, env in enumerate(self.envs):
+            env.action_mask(out=masks[i])
+        return masks
+
+    def close(self):
+        for env in self.envs:
+            env.close()
+
+
+def _bind_boards(envs, boards):
+    """Hace que cada partida con tablero escriba en su fila de ``boards``."""
+    for env, row in zip(envs, boards):
+        if env.board is not None:
+            env.board.rebind(row)
+
+
+def _record_final(env, info: dict, observation):
+    info["final_observation"] = observation.copy()
+    if env.board is not None:
+        info["final_board"] = np.array(env.board.memoryview())
+    info["final_info"] = dict(info)
+
+
+def _worker(conn, block, lo: int, hi: int, num_envs: int, sizes, level: int, seeds, env_kwargs):
+    """Bucle de un proceso trabajador que atiende las partidas ``lo..hi-1``."""
+    buffers = _Buffers(num_envs, *sizes, block=block)
+    cache = _new_level_cache()
+    envs = [GameEnv(level, level_cache=cache, seed=s, **env_kwargs) for s in seeds]
+    _bind_boards(envs, buffers.boards[lo:hi])
+    observations = buffers.observations
+    try:
+        while True:
+            command, payload = conn.recv()
+            if command == "step":
+                finished = {}
+                for i, env in enumerate(envs, lo):
+                    _, reward, terminated, truncated, info = env.step(
+                        buffers.actions[i], out=observations[i]
+                    )
+                    buffers.rewards[i] = reward
+                    buffers.terminated[i] = terminated
+                    buffers.truncated[i] = truncated
+                    if terminated or truncated:
+                        _record_final(env, info, observations[i])
+                        env.reset(out=observations[i])
+                        finished[i] = info
+                conn.send(finished)
+            elif command == "reset":
+                infos = {}
+                for i, env in enumerate(envs, lo):
+                    seed = payload[i - lo] if payload is not None else None
+                    infos[i] = env.reset(seed=seed, out=observations[i])[1]
+                conn.send(infos)
+            elif command == "masks":
+                for i, env in enumerate(envs, lo):
+                    env.action_mask(out=buffers.masks[i])
+                conn.send(None)
+            elif command == "close":
+                break
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for env in envs:
+            env.close()
+        conn.close()
+
+
+class SubprocVectorGameEnv:
+    """``num_envs`` partidas repartidas entre ``num_workers`` procesos.
+
+    ``context`` elige el método de arranque de ``multiprocessing`` (``"fork"``,
+    ``"spawn"``...); por defecto el de la plataforma.
+    """
+
+    def __init__(
+        self,
+        num_envs: int,
+        level: int = 0,
+        seed: int | None = None,
+        num_workers: int | None = None,
+        context: str | None = None,
+        **env_kwargs,
+    ):
+        # Cada trabajador compila sus niveles: la caché no viaja entre procesos
+        env_kwargs.pop("level_cache", None)
+        # Una partida de prueba fija los tamaños de observación y acción
+        probe = GameEnv(level, **env_kwargs)
+        self.num_envs = num_envs
+        self.observation_size = probe.observation_size
+        self.num_actions = probe.num_actions
+        self.board_shape = probe.board_shape
+        sizes = (self.observation_size, self.num_actions, probe.board_size)
+        probe.close()
+
+        ctx = multiprocessing.get_context(context)
+        _, nbytes = _Buffers.layout(num_envs, *sizes)
+        self._block = ctx.RawArray("b", nbytes)
+        self.buffers = _Buffers(num_envs, *sizes, block=self._block)
+        self.boards = self.buffers.boards
+
+        num_workers = max(1, min(num_envs, num_workers or multiprocessing.cpu_count()))
+        seeds = _env_seeds(seed, num_envs)
+        bounds = [num_envs * w // num_workers for w in range(num_workers + 1)]
+        self._slices = list(zip(bounds[:-1], bounds[1:]))
+        self._pipes = []
+        self._processes = []
+        for lo, hi in self._slices:
+            parent, child = ctx.Pipe()
+            process = ctx.Process(
+                target=_worker,
+                args=(
+                    child,
+                    self._block,
+                    lo,
+                    hi,
+                    num_envs,
+                    sizes,
+                    level,
+                    seeds[lo:hi],
+                    env_kwargs,
+                ),
+                daemon=True,
+            )
+            process.start()
+            child.close()
+            self._pipes.append(parent)
+            self._processes.append(process)
+        self.closed = False
+
+    def _broadcast(self, command: str, payloads=None) -> dict:
+        for w, pipe in enumerate(self._pipes):
+            pipe.send((command, payloads[w] if payloads is not None else None))
+        merged = {}
+        for pipe in self._pipes:
+            reply = pipe.recv()
+            if reply:
+                merged.update(reply)
+        return merged
+
+    def reset(self, seed: int | None = None):
+        payloads = None
+        if seed is not None:
+            seeds = _env_seeds(seed, self.num_envs)
+            payloads = [seeds[lo:hi] for lo, hi in self._slices]
+        replies = self._broadcast("reset", payloads)
+        return self.buffers.observations, [replies.get(i, {}) for i in range(self.num_envs)]
+
+    def step(self, actions):
+        """Como :meth:`VectorGameEnv.step`; ``infos`` solo trae datos de los episodios terminados."""
+        buffers = self.buffers
+        buffers.actions[:] = actions
+        finished = self._broadcast("step")
+        infos = [finished.get(i, {}) for i in range(self.num_envs)]
+        return buffers.observations, buffers.rewards, buffers.terminated, buffers.truncated, infos
+
+    def action_masks(self) -> np.ndarray:
+        self._broadcast("masks")
+        return self.buffers.masks
+
+    def close(self):
+        if self.closed:
+            return
+        for pipe in self._pipes:
+            try:
+                pipe.send(("close", None))
+            except (BrokenPipeError, OSError):
+                pass
+        for process in self._processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        for pipe in self._pipes:
+            pipe.close()
+        self.closed = True
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
@@ -0,0 +1,142 @@
+# game/wave_schedule.py
+"""Calendario de aparición pre-generado para una oleada completa.
+
+Al empezar una oleada se sortean de una vez, para todos sus enemigos, el
+instante de aparición (llegadas de Poisson con tasa λ), el tipo de enemigo,
+el camino y la velocidad y salud base. Con NumPy cada columna sale de una
+sola llamada vectorizada; sin él se usan los flujos ``random.Random``.
+
+Durante la oleada, ``GameManager.update`` solo avanza un cursor sobre el
+calendario, y el calendario completo puede inspeccionarse (``rows()``) o
+guardarse en un snapshot (``to_bytes``/``from_bytes``).
+"""
+
+from __future__ import annotations
+
+import struct
+from array import array
+from itertools import accumulate
+
+from game.alias_table import AliasTable
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: se sortea entrada a entrada
+    np = None
+
+_HEADER = struct.Struct("<II")  # entradas, cursor
+_COLUMNS = (("times", "d"), ("tiers", "H"), ("paths", "H"), ("speeds", "d"), ("healths", "q"))
+
+
+def _as_array(typecode: str, values) -> array:
+    result = array(typecode)
+    if np is not None and isinstance(values, np.ndarray):
+        result.frombytes(np.ascontiguousarray(values, dtype=np.dtype(typecode)).tobytes())
+    else:
+        result.extend(values)
+    return result
+
+
+class WaveSchedule:
+    """Columnas paralelas con una entrada por enemigo de la oleada.
+
+    Los valores se guardan en ``array`` de la biblioteca estándar: indexarlos
+    devuelve ``float``/``int`` de Python, igual que los sorteos individuales.
+    """
+
+    def __init__(self, times=(), tiers=(), paths=(), speeds=(), healths=(), cursor: int = 0):
+        self.times = _as_array("d", times)
+        self.tiers = _as_array("H", tiers)
+        self.paths = _as_array("H", paths)
+        self.speeds = _as_array("d", speeds)
+        self.healths = _as_array("q", healths)
+        self.cursor = cursor
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    @property
+    def remaining(self) -> int:
+        return len(self.times) - self.cursor
+
+    @property
+    def next_time(self) -> float:
+        """Instante (desde el inicio de la oleada) de la próxima aparición."""
+        return self.times[self.cursor] if self.cursor < len(self.times) else float("inf")
+
+    def pop(self) -> tuple[int, int, float, int]:
+        """Devuelve ``(tipo, camino, velocidad, salud)`` de la entrada actual y avanza."""
+        i = self.cursor
+        self.cursor = i + 1
+        return self.tiers[i], self.paths[i], self.speeds[i], self.healths[i]
+
+    def rows(self) -> list[tuple[float, int, int, float, int]]:
+        return list(zip(self.times, self.tiers, self.paths, self.speeds, self.healths))
+
+    # ------------------------------------------------------------------
+    # Generación
+    # ------------------------------------------------------------------
+    @classmethod
+    def generate(
+        cls,
+        rng,
+        count: int,
+        lambd: float,
+        tiers: list[dict],
+        num_paths: int,
+        tier_table: AliasTable | None = None,
+    ) -> "WaveSchedule":
+        """Sortea ``count`` apariciones usando los flujos de ``rng`` (``RandomStreams``).
+
+        ``tier_table`` es la tabla de alias compilada del nivel; si no se da,
+        se construye a partir de los pesos de ``tiers``.
+        """
+        if count <= 0 or num_paths <= 0:
+            return cls()
+
+        tiers = tiers or [{}]
+        if tier_table is None:
+            tier_table = AliasTable.from_tiers(tiers)
+        speed_ranges = [tier.get("velocidad", (1.5, 3.0)) for tier in tiers]
+        health_ranges = [tier.get("salud", (80, 150)) for tier in tiers]
+
+        if np is not None:
+            times = np.cumsum(rng.numpy("spawn").exponential(1.0 / lambd, count))
+            tier_idx = tier_table.draw_many(rng.numpy("tier"), count)
+            path_idx = rng.numpy("path").integers(0, num_paths, size=count)
+            stats = rng.numpy("enemy_stats")
+            speed_lo, speed_hi = np.asarray(speed_ranges, dtype=float)[tier_idx].T
+            speeds = stats.uniform(speed_lo, speed_hi)
+            health_lo, health_hi = np.asarray(health_ranges, dtype=np.int64)[tier_idx].T
+            healths = stats.integers(health_lo, health_hi, endpoint=True)
+            return cls(times, tier_idx, path_idx, speeds, healths)
+
+        times = list(accumulate(rng.expovariates("spawn", lambd, count)))
+        tier_idx = tier_table.draw_many(rng.tier, count)
+        path_idx = [rng.path.randrange(num_paths) for _ in range(count)]
+        stats = rng.enemy_stats
+        speeds = [stats.uniform(*speed_ranges[t]) for t in tier_idx]
+        healths = [stats.randint(*health_ranges[t]) for t in tier_idx]
+        return cls(times, tier_idx, path_idx, speeds, healths)
+
+    # ------------------------------------------------------------------
+    # Serialización
+    # ------------------------------------------------------------------
+    def to_bytes(self) -> bytes:
+        parts = [_HEADER.pack(len(self), self.cursor)]
+        parts.extend(getattr(self, name).tobytes() for name, _ in _COLUMNS)
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data, offset: int = 0) -> tuple["WaveSchedule", int]:
+        """Reconstruye un calendario; devuelve también el desplazamiento final."""
+        count, cursor = _HEADER.unpack_from(data, offset)
+        offset += _HEADER.size
+        schedule = cls(cursor=cursor)
+        for name, typecode in _COLUMNS:
+            column = array(typecode)
+            size = count * column.itemsize
+            column.frombytes(bytes(data[offset: offset + size]))
+            offset += size
+            setattr(schedule, name, column)
+        return schedule, offset
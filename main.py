@@ -1,18 +1,57 @@
+import argparse
+import logging
+import random
+import time
 import pygame, sys
 from game.game_manager import GameManager
 from game import settings
+from game.replay import ReplayRecorder, start_session
+from utils.metrics_exporter import MetricsExporter
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Tower Defense - Simulación λ/μ")
+    parser.add_argument("--record", metavar="ARCHIVO", help="graba la partida para reproducirla luego")
+    parser.add_argument("--seed", type=int, help="semilla de aleatoriedad (por defecto, al azar)")
+    parser.add_argument("--level", type=int, help="nivel inicial (1..N); sin él se abre el menú")
+    parser.add_argument(
+        "--metrics-port", type=int, help="sirve métricas Prometheus en 127.0.0.1:PUERTO/metrics"
+    )
+    parser.add_argument("--metrics-file", metavar="ARCHIVO", help="añade las métricas (JSON) a un archivo rotativo")
+    parser.add_argument(
+        "--projectiles",
+        choices=("homing", "intercept"),
+        default=settings.PROJECTILE_MODE,
+        help="proyectiles que persiguen al objetivo o con impacto calculado al disparar",
+    )
+    return parser.parse_args()
+
 
 def main():
+    args = parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     pygame.init()
     screen = pygame.display.set_mode((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT))
     pygame.display.set_caption("Tower Defense - Simulación λ/μ (versión jugable)")
     clock = pygame.time.Clock()
 
     game = GameManager()
+    game.projectile_mode = args.projectiles
+    profiler = game.profiler
+    seed = args.seed if args.seed is not None else random.randrange(2**63)
+    level = args.level - 1 if args.level else None
+    start_session(game, seed, level)
+    recorder = ReplayRecorder(seed, level, projectile_mode=game.projectile_mode) if args.record else None
+    exporter = None
+    if args.metrics_port is not None or args.metrics_file:
+        exporter = MetricsExporter(port=args.metrics_port, file_path=args.metrics_file).start()
+    next_export = time.perf_counter()
     running = True
 
     while running:
-        dt = clock.tick(settings.FPS) / 1000.0
+        tick_ms = clock.tick(settings.FPS)
+        dt = tick_ms / 1000.0
+        profiler.start_frame()
 
         # --- EVENTOS ---
         for event in pygame.event.get():
@@ -20,12 +59,35 @@ def main():
                 running = False
             elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 # ✅ Envía el clic al GameManager
+                if recorder:
+                    recorder.record_click(event.pos, game.camera)
                 game.handle_click(event.pos)
+            else:
+                game.handle_camera_event(event)
+        game.scroll_camera(dt, pygame.key.get_pressed())
+        profiler.lap("eventos")
 
         # --- ACTUALIZAR Y DIBUJAR ---
-        game.update(dt)
+        # La simulación avanza a paso fijo; el dibujo interpola entre pasos
+        game.advance(dt)
+        if recorder:
+            recorder.record_tick(tick_ms, game)
         game.draw(screen)
+        profiler.mark()
         pygame.display.flip()
+        profiler.lap("flip")
+        profiler.end_frame()
+
+        # El exportador trabaja en otro hilo; aquí solo se encola la muestra
+        if exporter and time.perf_counter() >= next_export:
+            exporter.publish(game.metrics_sample())
+            next_export = time.perf_counter() + settings.METRICS_EXPORT_INTERVAL
+
+    if exporter:
+        exporter.stop()
+    if recorder:
+        path = recorder.save(args.record)
+        print(f"Partida grabada en {path} (semilla {seed})")
 
     pygame.quit()
     sys.exit()
@@ -0,0 +1,168 @@
+"""
+generator.py
+---------------------------------------
+Generador procedural de mapas grandes.
+
+Produce matrices con los mismos códigos de celda que usan los niveles y
+``extraer_caminos``: 0 suelo, 1 camino, 2 base de torre, 3 inicio, 4 fin.
+Cada mapa tiene una única salida en el borde derecho y varios inicios en los
+bordes izquierdo, superior e inferior. Los caminos se trazan como recorridos
+aleatorios sesgados hacia la salida y se detienen al tocar un camino ya
+trazado, de modo que las rutas se ramifican y convergen.
+
+Uso típico::
+
+    mapa = generar_mapa(200, 120, num_inicios=8, semilla=7)
+    nivel = crear_nivel_generado(200, 120, num_inicios=8, semilla=7)
+"""
+
+from __future__ import annotations
+
+import random
+
+from .map_utils import calcular_campo_distancias, crear_tiles, extraer_caminos
+
+SUELO, CAMINO, BASE_TORRE, INICIO, FIN = 0, 1, 2, 3, 4
+
+MIN_DIMENSION = 5
+MAX_DIMENSION = 500
+
+# Probabilidad de que un paso avance hacia la salida en lugar de desviarse
+SESGO_SALIDA = 0.65
+
+
+def _elegir_inicios(columnas: int, filas: int, cantidad: int, rng: random.Random):
+    """Casillas de inicio distintas en la mitad izquierda del contorno."""
+    candidatos = [(0, y) for y in range(1, filas - 1)]
+    mitad = max(2, columnas // 2)
+    candidatos += [(x, 0) for x in range(1, mitad)]
+    candidatos += [(x, filas - 1) for x in range(1, mitad)]
+    cantidad = max(1, min(cantidad, len(candidatos)))
+    return rng.sample(candidatos, cantidad)
+
+
+def _trazar(mapa, inicio, salida, rng: random.Random):
+    """Marca como camino un recorrido desde ``inicio`` hasta la salida o un camino previo."""
+    filas = len(mapa)
+    columnas = len(mapa[0])
+    x, y = inicio
+    sx, sy = salida
+    propias = {inicio}
+    while (x, y) != (sx, sy):
+        dx = (sx > x) - (sx < x)
+        dy = (sy > y) - (sy < y)
+        if rng.random() < SESGO_SALIDA:
+            # Avanza por el eje con más distancia pendiente (o al azar si empatan)
+            if dx and (not dy or rng.random() < abs(sx - x) / (abs(sx - x) + abs(sy - y))):
+                x += dx
+            else:
+                y += dy
+        else:
+            # Desvío perpendicular que mantiene el recorrido dentro del borde interior
+            if rng.random() < 0.5:
+                ny = y + rng.choice((-1, 1))
+                if 1 <= ny < filas - 1:
+                    y = ny
+            else:
+                nx = x + rng.choice((-1, 1))
+                if 1 <= nx < columnas - 1:
+                    x = nx
+
+        if (x, y) in propias:
+            continue
+        propias.add((x, y))
+        valor = mapa[y][x]
+        if valor in (FIN, CAMINO):
+            # Llegó a la salida o se unió a una ruta que ya llega a ella
+            return
+        if valor == SUELO:
+            mapa[y][x] = CAMINO
+
+
+def _colocar_bases(mapa, densidad: float, rng: random.Random):
+    """Convierte en bases de torre algunas casillas de suelo junto a los caminos."""
+    filas = len(mapa)
+    columnas = len(mapa[0])
+    for y in range(filas):
+        fila = mapa[y]
+        arriba = mapa[y - 1] if y > 0 else None
+        abajo = mapa[y + 1] if y < filas - 1 else None
+        for x in range(columnas):
+            if fila[x] != SUELO:
+                continue
+            junto_camino = (
+                (x > 0 and fila[x - 1] == CAMINO)
+                or (x < columnas - 1 and fila[x + 1] == CAMINO)
+                or (arriba is not None and arriba[x] == CAMINO)
+                or (abajo is not None and abajo[x] == CAMINO)
+            )
+            if junto_camino and rng.random() < densidad:
+                fila[x] = BASE_TORRE
+
+
+def generar_mapa(
+    columnas: int,
+    filas: int,
+    num_inicios: int = 4,
+    semilla: int | None = None,
+    densidad_torres: float = 0.12,
+) -> list[list[int]]:
+    """Genera un mapa válido de ``columnas`` x ``filas`` casillas.
+
+    Todos los inicios quedan conectados con la única salida; si no fuera así
+    se lanza ``ValueError``. Con la misma semilla el resultado es idéntico.
+    """
+    for nombre, valor in (("columnas", columnas), ("filas", filas)):
+        if not MIN_DIMENSION <= valor <= MAX_DIMENSION:
+            raise ValueError(
+                f"{nombre} debe estar entre {MIN_DIMENSION} y {MAX_DIMENSION} (recibido {valor})"
+            )
+
+    rng = random.Random(semilla)
+    mapa = [[SUELO] * columnas for _ in range(filas)]
+
+    salida = (columnas - 1, rng.randrange(1, filas - 1))
+    mapa[salida[1]][salida[0]] = FIN
+
+    inicios = _elegir_inicios(columnas, filas, num_inicios, rng)
+    for x, y in inicios:
+        mapa[y][x] = INICIO
+    for inicio in inicios:
+        _trazar(mapa, inicio, salida, rng)
+
+    _colocar_bases(mapa, densidad_torres, rng)
+
+    campo = calcular_campo_distancias(mapa)
+    desconectados = [inicio for inicio in inicios if not campo.alcanzable(*inicio)]
+    if desconectados:
+        raise ValueError(f"Inicios sin conexión con la salida: {desconectados}")
+    return mapa
+
+
+def crear_nivel_generado(
+    columnas: int,
+    filas: int,
+    num_inicios: int = 4,
+    semilla: int | None = None,
+    densidad_torres: float = 0.12,
+    base: dict | None = None,
+) -> dict:
+    """Entrada de nivel (``{"config", "creator"}``) con un mapa generado.
+
+    ``base`` aporta el resto de la configuración (enemigos, multiplicadores,
+    dinero...); por defecto se usa la del primer nivel.
+    """
+    if base is None:
+        from . import LEVELS
+
+        base = LEVELS[0]["config"]
+
+    mapa = generar_mapa(columnas, filas, num_inicios, semilla, densidad_torres)
+    config = {key: value for key, value in base.items() if key != "tipos_camino"}
+    config["nombre"] = f"Generado {columnas}x{filas}"
+    config["mapa"] = mapa
+
+    def creator():
+        return crear_tiles(mapa), extraer_caminos(mapa)
+
+    return {"config": config, "creator": creator}
@@ -0,0 +1,260 @@
+"""
+level_loader.py
+---------------------------------------
+Niveles definidos como datos en ``maps/levels/*.json``.
+
+Cada archivo contiene la configuración completa de un nivel (nombre, matriz
+del mapa, enemigos, multiplicadores, etc.) con las mismas claves que usaba
+``CONFIG_NIVEL_N``. Los archivos solo se leen cuando se consulta el nivel.
+
+La parte costosa de preparar un mapa (campo de distancias y caminos) se
+compila una vez a ``maps/levels/.cache/<nivel>/`` como arreglos ``.npy`` que
+luego se abren con ``mmap``. La caché se invalida sola cuando cambia el
+archivo del nivel. Si NumPy no está instalado, todo se calcula en memoria.
+
+Los datos que muestra el menú (nombre, oleadas, dinero, vidas y
+multiplicadores, :attr:`LevelFile.info`) se guardan aparte en
+``.cache/<nivel>/info.json``, de modo que construir el menú no obliga a leer
+los archivos completos de los niveles.
+
+Cada archivo de la caché se escribe en un temporal y se sustituye con
+``os.replace``: varios procesos (p. ej. los trabajadores de
+``SubprocVectorGameEnv``) pueden compilar el mismo nivel a la vez sin que
+ninguno lea un archivo a medias ni trunque uno que otro tiene mapeado.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+
+from .map_utils import (
+    CampoDistancias,
+    calcular_campo_distancias,
+    crear_tiles,
+    extraer_caminos,
+)
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: sin él no hay caché binaria
+    np = None
+
+log = logging.getLogger(__name__)
+
+LEVELS_DIR = Path(__file__).resolve().parent / "levels"
+CACHE_DIR = LEVELS_DIR / ".cache"
+CACHE_FORMAT = 1
+
+# Claves de cada enemigo que el juego espera como tuplas (rangos y colores)
+_TUPLE_KEYS = ("velocidad", "salud", "color")
+# Claves de la configuración que se muestran en el menú de niveles
+_INFO_KEYS = ("nombre", "oleadas_victoria", "dinero_inicial", "vidas_inicial", "multiplicadores")
+
+
+def _replace_atomic(path: Path, write):
+    """Escribe ``path`` con ``write(archivo)`` en un temporal y lo sustituye de golpe."""
+    handle = tempfile.NamedTemporaryFile(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False
+    )
+    try:
+        with handle:
+            write(handle)
+        os.replace(handle.name, path)
+    except BaseException:
+        Path(handle.name).unlink(missing_ok=True)
+        raise
+
+
+def _normalize_config(config: dict) -> dict:
+    enemigos = []
+    for enemigo in config.get("enemigos", []):
+        enemigo = dict(enemigo)
+        for key in _TUPLE_KEYS:
+            if isinstance(enemigo.get(key), list):
+                enemigo[key] = tuple(enemigo[key])
+        enemigos.append(enemigo)
+    config["enemigos"] = enemigos
+    return config
+
+
+class CompiledMap:
+    """Resultado compilado de un mapa: matriz, campo de distancias y caminos."""
+
+    def __init__(self, mapa, campo: CampoDistancias, caminos: list[list[tuple[int, int]]]):
+        self.mapa = mapa
+        self.campo = campo
+        self.caminos = caminos
+
+
+class LevelFile:
+    """Nivel respaldado por un archivo JSON, cargado bajo demanda.
+
+    Admite el acceso ``entry["config"]`` y ``entry["creator"]`` de las
+    entradas de ``LEVELS`` basadas en diccionarios, y ``entry["info"]``.
+    """
+
+    def __init__(self, path: str | Path, cache_dir: str | Path | None = CACHE_DIR):
+        self.path = Path(path)
+        self.cache_dir = Path(cache_dir) / self.path.stem if cache_dir is not None else None
+        self._config: dict | None = None
+        self._info: dict | None = None
+        self._digest: str | None = None
+        self._compiled: CompiledMap | None = None
+
+    def __repr__(self) -> str:
+        return f"LevelFile({self.path.name!r})"
+
+    # Compatibilidad con las entradas tipo diccionario
+    def __getitem__(self, key: str):
+        if key == "config":
+            return self.config
+        if key == "creator":
+            return self.create
+        if key == "info":
+            return self.info
+        raise KeyError(key)
+
+    def get(self, key: str, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    @property
+    def config(self) -> dict:
+        if self._config is None:
+            with self.path.open(encoding="utf-8") as handle:
+                self._config = _normalize_config(json.load(handle))
+        return self._config
+
+    @property
+    def info(self) -> dict:
+        """Datos del nivel para el menú, sin leer el mapa si la caché está al día."""
+        if self._info is None:
+            self._info = self._load_info()
+        return self._info
+
+    def _load_info(self) -> dict:
+        cached = self._read_cache_json("info.json")
+        if cached is not None:
+            return cached["info"]
+        info = {key: self.config[key] for key in _INFO_KEYS if key in self.config}
+        if self.cache_dir is not None:
+            data = {"formato": CACHE_FORMAT, "fuente": self._source_digest(), "info": info}
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                _replace_atomic(
+                    self.cache_dir / "info.json",
+                    lambda handle: handle.write(json.dumps(data).encode("utf-8")),
+                )
+            except OSError as exc:
+                log.warning("No se pudo escribir la caché de %s: %s", self.path.name, exc)
+        return info
+
+    @property
+    def tipos_camino(self) -> tuple[int, ...]:
+        return tuple(self.config.get("tipos_camino", (1,)))
+
+    def create(self):
+        """Genera los tiles y caminos del nivel (equivalente a ``crear_mapa_nivel_N``)."""
+        compiled = self.compiled()
+        return crear_tiles(self.config["mapa"]), compiled.caminos
+
+    # ------------------------------------------------------------------
+    # Compilación y caché binaria
+    # ------------------------------------------------------------------
+    def compiled(self) -> CompiledMap:
+        if self._compiled is None:
+            self._compiled = self._load_cache() or self._compile()
+        return self._compiled
+
+    def _source_digest(self) -> str:
+        if self._digest is None:
+            self._digest = hashlib.sha1(self.path.read_bytes()).hexdigest()
+        return self._digest
+
+    def _read_cache_json(self, name: str) -> dict | None:
+        """Contenido de ``name`` en la caché si corresponde al archivo actual."""
+        if self.cache_dir is None:
+            return None
+        try:
+            data = json.loads((self.cache_dir / name).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if data.get("formato") != CACHE_FORMAT or data.get("fuente") != self._source_digest():
+            return None
+        return data
+
+    def _compile(self) -> CompiledMap:
+        mapa = self.config["mapa"]
+        tipos = self.tipos_camino
+        campo = calcular_campo_distancias(mapa, tipos)
+        caminos = extraer_caminos(mapa, tipos)
+        compiled = CompiledMap(mapa, campo, caminos)
+        if np is not None and self.cache_dir is not None:
+            try:
+                self._write_cache(compiled)
+            except OSError as exc:
+                log.warning("No se pudo escribir la caché de %s: %s", self.path.name, exc)
+        return compiled
+
+    def _write_cache(self, compiled: CompiledMap):
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        campo = compiled.campo
+        puntos = [punto for camino in compiled.caminos for punto in camino]
+        offsets = [0]
+        for camino in compiled.caminos:
+            offsets.append(offsets[-1] + len(camino))
+
+        arrays = {
+            "mapa.npy": np.asarray(compiled.mapa, dtype=np.int8),
+            "distancia.npy": np.asarray(campo.distancia, dtype=np.int32),
+            "siguiente.npy": np.asarray(campo.siguiente, dtype=np.int32),
+            "caminos.npy": np.asarray(puntos, dtype=np.int32).reshape(-1, 2),
+            "caminos_offsets.npy": np.asarray(offsets, dtype=np.int64),
+        }
+        for name, values in arrays.items():
+            _replace_atomic(self.cache_dir / name, lambda handle: np.save(handle, values))
+        # meta.json se escribe al final: su presencia indica una caché completa
+        meta = {"formato": CACHE_FORMAT, "fuente": self._source_digest()}
+        _replace_atomic(
+            self.cache_dir / "meta.json", lambda handle: handle.write(json.dumps(meta).encode("utf-8"))
+        )
+
+    def _load_cache(self) -> CompiledMap | None:
+        if np is None or self._read_cache_json("meta.json") is None:
+            return None
+
+        try:
+            mapa = np.load(self.cache_dir / "mapa.npy", mmap_mode="r")
+            distancia = np.load(self.cache_dir / "distancia.npy", mmap_mode="r")
+            siguiente = np.load(self.cache_dir / "siguiente.npy", mmap_mode="r")
+            puntos = np.load(self.cache_dir / "caminos.npy")
+            offsets = np.load(self.cache_dir / "caminos_offsets.npy")
+        except (OSError, ValueError):
+            return None
+
+        filas, columnas = mapa.shape
+        # Un memoryview sobre el arreglo mapeado evita copiarlo y devuelve
+        # enteros de Python al indexar, igual que ``array``.
+        campo = CampoDistancias(
+            filas, columnas, memoryview(distancia).cast("B").cast("i"),
+            memoryview(siguiente).cast("B").cast("i"),
+        )
+        puntos_lista = [tuple(punto) for punto in puntos.tolist()]
+        caminos = [
+            puntos_lista[inicio:fin] for inicio, fin in zip(offsets[:-1].tolist(), offsets[1:].tolist())
+        ]
+        return CompiledMap(mapa, campo, caminos)
+
+
+def discover_levels(directory: str | Path = LEVELS_DIR) -> list[LevelFile]:
+    """Lista los niveles de ``directory`` ordenados por nombre de archivo, sin leerlos."""
+    directory = Path(directory)
+    cache_dir = directory / ".cache"
+    return [LevelFile(path, cache_dir) for path in sorted(directory.glob("*.json"))]
@@ -4,7 +4,7 @@ main.py
 Ejemplo de uso de los mapas del módulo "maps".
 """
 import pygame
-from .map_level_1 import crear_mapa_nivel_1, CONFIG_NIVEL_1
+from . import LEVELS
 
 
 ANCHO = 900
@@ -17,9 +17,10 @@ def main():
     clock = pygame.time.Clock()
 
     # Crear mapa
-    tiles, caminos = crear_mapa_nivel_1()
+    nivel = LEVELS[0]
+    tiles, caminos = nivel["creator"]()
 
-    print(f"🗺️ Mapa: {CONFIG_NIVEL_1['nombre']}")
+    print(f"🗺️ Mapa: {nivel['config']['nombre']}")
     print(f"👣 Caminos detectados: {len(caminos)}")
 
     corriendo = True
@@ -15,7 +15,9 @@ Dependencias:
 
 import os
 import pygame
+from array import array
 from collections import deque
+from functools import lru_cache
 from math import gcd
 # --------------------------------------------
 # 🎨 CONFIGURACIÓN VISUAL
@@ -87,9 +89,93 @@ def _vecinos(x, y):
         yield x + dx, y + dy
 
 
+class CampoDistancias:
+    """Distancia al final y siguiente paso para cada casilla del mapa.
+
+    Se obtiene con una única BFS multi-origen desde las casillas finales, por
+    lo que todos los puntos de inicio comparten el mismo cálculo. Los datos se
+    guardan en arreglos planos indexados por ``fila * columnas + col``:
+
+    - ``distancia``: pasos hasta el final, o -1 si la casilla no lo alcanza.
+    - ``siguiente``: índice de la casilla vecina más cercana al final, o -1.
+    """
+
+    def __init__(self, filas: int, columnas: int, distancia: array, siguiente: array):
+        self.filas = filas
+        self.columnas = columnas
+        self.distancia = distancia
+        self.siguiente = siguiente
+
+    def indice(self, x: int, y: int) -> int:
+        return y * self.columnas + x
+
+    def alcanzable(self, x: int, y: int) -> bool:
+        return self.distancia[y * self.columnas + x] >= 0
+
+    def camino_desde(self, x: int, y: int) -> list[tuple[int, int]]:
+        """Camino más corto (en casillas) desde ``(x, y)`` hasta el final."""
+        columnas = self.columnas
+        actual = y * columnas + x
+        if self.distancia[actual] < 0:
+            return []
+        siguiente = self.siguiente
+        camino = []
+        while actual >= 0:
+            camino.append((actual % columnas, actual // columnas))
+            actual = siguiente[actual]
+        return camino
+
+
+@lru_cache(maxsize=32)
+def _campo_cacheado(celdas, permitidos, tipo_fin) -> CampoDistancias:
+    filas = len(celdas)
+    columnas = len(celdas[0]) if filas else 0
+    total = filas * columnas
+    distancia = array("i", [-1]) * total
+    siguiente = array("i", [-1]) * total
+
+    cola = deque()
+    for fila_idx, fila in enumerate(celdas):
+        for col_idx, valor in enumerate(fila):
+            if valor == tipo_fin:
+                idx = fila_idx * columnas + col_idx
+                distancia[idx] = 0
+                cola.append(idx)
+
+    while cola:
+        actual = cola.popleft()
+        x, y = actual % columnas, actual // columnas
+        paso = distancia[actual] + 1
+        for nx, ny in _vecinos(x, y):
+            if not (0 <= nx < columnas and 0 <= ny < filas):
+                continue
+            vecino = ny * columnas + nx
+            if distancia[vecino] >= 0 or celdas[ny][nx] not in permitidos:
+                continue
+            distancia[vecino] = paso
+            siguiente[vecino] = actual
+            cola.append(vecino)
+
+    return CampoDistancias(filas, columnas, distancia, siguiente)
+
+
+def calcular_campo_distancias(mapa, tipos_camino=(1,), tipo_inicio=3, tipo_fin=4) -> CampoDistancias:
+    """Devuelve el campo de distancias del mapa, reutilizándolo si ya se calculó.
+
+    El resultado se guarda en caché según el contenido del mapa, así que no
+    debe modificarse.
+    """
+    permitidos = frozenset(tipos_camino) | {tipo_inicio, tipo_fin}
+    celdas = tuple(tuple(fila) for fila in mapa)
+    return _campo_cacheado(celdas, permitidos, tipo_fin)
+
+
 def extraer_caminos(mapa, tipos_camino=(1,), tipo_inicio=3, tipo_fin=4):
     """Obtiene todos los caminos válidos desde cada punto de inicio hasta el final.
 
+    Los caminos se leen del campo de distancias (una sola BFS desde el final),
+    en lugar de lanzar una búsqueda independiente por cada inicio.
+
     Args:
         mapa: Matriz que describe el terreno del mapa.
         tipos_camino: Valores considerados como casillas transitables.
@@ -103,9 +189,6 @@ def extraer_caminos(mapa, tipos_camino=(1,), tipo_inicio=3, tipo_fin=4):
     if not mapa:
         return []
 
-    filas = len(mapa)
-    columnas = len(mapa[0]) if filas else 0
-
     permitidos = set(tipos_camino)
     permitidos.update({tipo_inicio, tipo_fin})
 
@@ -125,45 +208,12 @@ def extraer_caminos(mapa, tipos_camino=(1,), tipo_inicio=3, tipo_fin=4):
             if inicios:
                 break
 
+    campo = calcular_campo_distancias(mapa, tipos_camino, tipo_inicio, tipo_fin)
     caminos = []
-
-    for inicio in inicios:
-        cola = deque([inicio])
-        visitados = {inicio}
-        padres = {}
-        destino = None
-
-        while cola:
-            actual = cola.popleft()
-            x, y = actual
-
-            if mapa[y][x] == tipo_fin:
-                destino = actual
-                break
-
-            for nx, ny in _vecinos(x, y):
-                if not (0 <= nx < columnas and 0 <= ny < filas):
-                    continue
-                if (nx, ny) in visitados:
-                    continue
-                if mapa[ny][nx] not in permitidos:
-                    continue
-                visitados.add((nx, ny))
-                padres[(nx, ny)] = actual
-                cola.append((nx, ny))
-
-        if destino is None:
-            continue
-
-        camino = []
-        nodo = destino
-        while nodo in padres:
-            camino.append(nodo)
-            nodo = padres[nodo]
-        camino.append(nodo)
-        camino.reverse()
-
-        caminos.append(camino)
+    for x, y in inicios:
+        camino = campo.camino_desde(x, y)
+        if camino:
+            caminos.append(camino)
 
     return caminos
 
@@ -206,6 +256,21 @@ def dimensiones_mapa(mapa):
     return columnas * TILE_SIZE, filas * TILE_SIZE
 
 
+# Nombre del sprite asociado a cada tipo de celda
+NOMBRES_TIPOS = {0: "suelo", 1: "camino", 2: "base_torre", 3: "inicio", 4: "fin"}
+
+
+def crear_tiles(mapa):
+    """Crea el grupo de tiles dibujables (pygame.sprite.Group) de una matriz de mapa."""
+    sprites = {tipo: cargar_sprite(nombre) for tipo, nombre in NOMBRES_TIPOS.items()}
+
+    tiles = pygame.sprite.Group()
+    for fila_idx, fila in enumerate(mapa):
+        for col_idx, tipo in enumerate(fila):
+            tiles.add(Tile(col_idx, fila_idx, tipo, sprites))
+    return tiles
+
+
 class Tile(pygame.sprite.Sprite):
     """
     Clase que representa una celda del mapa.
@@ -214,7 +279,8 @@ class Tile(pygame.sprite.Sprite):
     def __init__(self, x, y, tipo, sprites):
         super().__init__()
         self.tipo = tipo
-        self.image = sprites[tipo].copy()
+        # La superficie se comparte entre todos los tiles del mismo tipo
+        self.image = sprites[tipo]
         self.rect = self.image.get_rect()
         self.rect.x = x * TILE_SIZE
         self.rect.y = y * TILE_SIZE
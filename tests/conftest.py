@@ -0,0 +1,26 @@
+"""Configuración común: pygame sin ventana y la raíz del proyecto en ``sys.path``."""
+
+import contextlib
+import io
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+
+@pytest.fixture(scope="session", autouse=True)
+def headless():
+    from game.agent_env import init_headless
+
+    init_headless()
+
+
+@pytest.fixture
+def quiet():
+    """Silencia los ``print`` del juego dentro del bloque ``with``."""
+    return lambda: contextlib.redirect_stdout(io.StringIO())
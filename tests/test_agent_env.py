@@ -0,0 +1,129 @@
+import numpy as np
+import pytest
+
+from game.agent_env import GLOBAL_FEATURES, GameEnv
+from game.events import EventType
+from game.vector_env import SubprocVectorGameEnv, VectorGameEnv
+
+
+def _build_actions(env, count):
+    """Acciones que construyen la primera torre en ``count`` casillas."""
+    types = len(env.tower_types)
+    return [1 + spot * types for spot in range(count)]
+
+
+def _rollout(env, actions, steps=60):
+    obs, _ = env.reset(seed=4)
+    trace = [obs.copy()]
+    for step in range(steps):
+        obs, reward, terminated, truncated, _ = env.step(actions[step] if step < len(actions) else 0)
+        trace.append((obs.copy(), reward, terminated, truncated))
+    return trace
+
+
+def _same(first, second):
+    assert len(first) == len(second)
+    for a, b in zip(first, second):
+        if isinstance(a, tuple):
+            assert np.array_equal(a[0], b[0]) and a[1:] == b[1:]
+        else:
+            assert np.array_equal(a, b)
+
+
+def test_same_seed_same_episode(quiet):
+    with quiet():
+        env = GameEnv(0, seed=1)
+        actions = _build_actions(env, 3)
+        first = _rollout(env, actions)
+        # Reiniciar con la misma semilla repite el episodio, también en otra instancia
+        _same(first, _rollout(env, actions))
+        _same(first, _rollout(GameEnv(0, seed=99), actions))
+    assert first[-1][0][GLOBAL_FEATURES.index("oleada")] >= 1
+
+
+def test_actions_and_mask(quiet):
+    with quiet():
+        env = GameEnv(0, seed=1)
+        env.reset()
+    assert env.decode_action(0) is None and env.decode_action(env.num_actions) is None
+    build = _build_actions(env, 1)[0]
+    assert env.decode_action(build) == ("build", 0, env.tower_types[0])
+
+    mask = env.action_mask()
+    assert mask.shape == (env.num_actions,) and mask[0] and mask[build]
+    with quiet():
+        _, _, _, _, info = env.step(build)
+    assert info["action_valid"] and env.game.spots[0].occupied
+    mask = env.action_mask()
+    assert not mask[build]
+    with quiet():
+        _, _, _, _, info = env.step(build)  # casilla ocupada: no hace nada
+    assert not info["action_valid"]
+
+    env.game.money = 0
+    assert env.action_mask().tolist() == [True] + [False] * (env.num_actions - 1)
+
+
+def test_reward_counts_each_kill_and_leak_once(quiet):
+    with quiet():
+        env = GameEnv(0, seed=2, kill_scale=0.5, leak_penalty=3.0)
+        env.reset()
+        env.game.money = 10_000
+        rewards = []
+        kills = []
+        leaks = []
+        env.game.events.subscribe(EventType.KILL, lambda event: kills.append(event.value))
+        env.game.events.subscribe(EventType.LEAK, leaks.append)
+        actions = _build_actions(env, env.num_spots)
+        for step in range(300):
+            _, reward, terminated, truncated, _ = env.step(actions[step] if step < len(actions) else 0)
+            rewards.append(reward)
+            if terminated or truncated:
+                break
+    assert kills
+    assert sum(rewards) == pytest.approx(0.5 * sum(kills) - 3.0 * len(leaks))
+
+
+def _vector_rollout(vector, steps=40):
+    obs, _ = vector.reset(seed=6)
+    trace = [obs.copy()]
+    build = np.zeros(vector.num_envs, dtype=np.int64)
+    build[0] = 1
+    idle = np.zeros_like(build)
+    for step in range(steps):
+        obs, rewards, terminated, truncated, _ = vector.step(build if step == 0 else idle)
+        trace.append((obs.copy(), rewards.copy(), terminated.copy(), truncated.copy()))
+    return trace, vector.action_masks().copy()
+
+
+def test_vector_env_autoresets(quiet):
+    with quiet():
+        vector = VectorGameEnv(2, level=0, seed=3, max_steps=5)
+        vector.reset(seed=3)
+        for _ in range(4):
+            vector.step([0, 0])
+        obs, _, terminated, truncated, infos = vector.step([0, 0])
+    assert truncated.all() and not terminated.any()
+    for i, info in enumerate(infos):
+        assert info["final_observation"][GLOBAL_FEATURES.index("tiempo")] > 0
+        # La fila ya es la del nuevo episodio
+        assert obs[i][GLOBAL_FEATURES.index("tiempo")] == 0
+        assert vector.envs[i].steps == 0
+
+
+def test_subprocess_matches_in_process(quiet):
+    with quiet():
+        local = VectorGameEnv(3, level=0, seed=5)
+        expected, expected_masks = _vector_rollout(local)
+        remote = SubprocVectorGameEnv(3, level=0, seed=5, num_workers=2)
+        try:
+            trace, masks = _vector_rollout(remote)
+        finally:
+            remote.close()
+    assert np.array_equal(expected[0], trace[0])
+    for a, b in zip(expected[1:], trace[1:]):
+        assert all(np.array_equal(x, y) for x, y in zip(a, b))
+    # Cada partida tiene su propia semilla
+    assert not np.array_equal(expected[-1][0][1], expected[-1][0][2])
+    assert np.array_equal(masks, expected_masks)
+    assert remote.closed
@@ -0,0 +1,48 @@
+import random
+
+import numpy as np
+import pytest
+
+from game.alias_table import AliasTable
+
+WEIGHTS = [5.0, 1.0, 0.0, 3.0, 0.5]
+
+
+def _expected():
+    total = sum(WEIGHTS)
+    return [w / total for w in WEIGHTS]
+
+
+def test_probabilities_match_weights():
+    table = AliasTable(WEIGHTS)
+    assert table.probabilities() == pytest.approx(_expected())
+
+
+def test_draw_frequencies():
+    table = AliasTable(WEIGHTS)
+    rng = random.Random(1)
+    draws = 200_000
+    counts = [0] * len(WEIGHTS)
+    for _ in range(draws):
+        counts[table.draw(rng)] += 1
+    assert counts[2] == 0
+    for count, p in zip(counts, _expected()):
+        assert count / draws == pytest.approx(p, abs=0.005)
+
+
+def test_draw_many_frequencies_numpy():
+    table = AliasTable(WEIGHTS)
+    draws = 500_000
+    indices = table.draw_many(np.random.default_rng(2), draws)
+    frequencies = np.bincount(indices, minlength=len(WEIGHTS)) / draws
+    assert frequencies == pytest.approx(_expected(), abs=0.005)
+
+
+def test_non_positive_weights_are_uniform():
+    table = AliasTable([0, -1, 0])
+    assert table.probabilities() == pytest.approx([1 / 3] * 3)
+
+
+def test_empty_weights_rejected():
+    with pytest.raises(ValueError):
+        AliasTable([])
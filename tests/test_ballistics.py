@@ -0,0 +1,134 @@
+import math
+
+import pytest
+
+from entities.projectile import Projectile
+from entities.tower import Tower
+from game import settings
+from game.ballistics import INTERCEPT_MODE, HitScheduler, solve_intercept
+from game.events import EventBus, EventType
+from game.game_manager import GameManager
+from game.rng import RandomStreams
+
+HZ = settings.SPEED_REFERENCE_HZ
+
+
+class _Walker:
+    """Enemigo mínimo: recorre ``points`` a ``speed`` píxeles por frame de referencia."""
+
+    def __init__(self, points, speed, health=100, serial=1):
+        self.pos = points[0]
+        self.points = points[1:]
+        self.speed = speed
+        self.health = health
+        self.reward = 5
+        self.serial = serial
+        self.alive = True
+
+    def waypoints(self):
+        return iter(self.points)
+
+    def position_at(self, t):
+        ax, ay = self.pos
+        remaining = self.speed * HZ * t
+        for bx, by in self.points:
+            length = math.hypot(bx - ax, by - ay)
+            if remaining <= length:
+                return ax + (bx - ax) * remaining / length, ay + (by - ay) * remaining / length
+            remaining -= length
+            ax, ay = bx, by
+        return ax, ay
+
+
+class _Shooter:
+    spent_projectiles = 0
+
+
+@pytest.mark.parametrize("origin", [(0, 0), (250, -80), (600, 150)])
+def test_intercept_meets_the_enemy_on_its_path(origin):
+    enemy = _Walker([(0, 100), (300, 100), (300, 400), (900, 400)], speed=2.0)
+    speed = 8.0 * HZ
+    flight, impact = solve_intercept(origin, speed, enemy)
+    assert math.dist(origin, impact) == pytest.approx(speed * flight)
+    assert impact == pytest.approx(enemy.position_at(flight))
+
+
+def test_stationary_and_escaping_targets():
+    still = _Walker([(30, 40), (30, 40)], speed=0.0)
+    assert solve_intercept((0, 0), 10.0, still) == (pytest.approx(5.0), (30, 40))
+
+    # Demasiado rápido para alcanzarlo: se apunta al final del recorrido
+    runner = _Walker([(0, 100), (50, 100)], speed=100.0)
+    flight, impact = solve_intercept((0, 0), 1.0, runner)
+    assert impact == (50, 100) and flight == pytest.approx(math.hypot(50, 100))
+
+
+def _shot(target, hit_time, damage=40):
+    projectile = Projectile((0, 0), target, damage)
+    projectile.aim(target.pos, 0.0, hit_time)
+    return projectile
+
+
+def test_hits_resolve_in_time_order():
+    bus = EventBus()
+    kills = []
+    bus.subscribe(EventType.KILL, lambda event: kills.append(event.value))
+    hits = HitScheduler()
+    enemy = _Walker([(0, 0), (10, 0)], speed=1.0, health=100)
+    tower = _Shooter()
+    for hit_time in (0.3, 0.1, 0.2):
+        hits.schedule(_shot(enemy, hit_time), tower)
+    assert len(hits) == 3 and hits.next_time == 0.1
+
+    assert hits.resolve(0.15, bus) == 1 and enemy.health == 60
+    assert hits.resolve(0.3, bus) == 2 and not enemy.alive
+    bus.dispatch()
+    # La baja se publica en el impacto letal, una sola vez
+    assert kills == [enemy.reward]
+    assert (hits.scheduled, hits.landed, hits.missed, tower.spent_projectiles) == (3, 3, 0, 3)
+    assert hits.next_time == float("inf")
+
+
+def test_shots_at_a_gone_target_miss():
+    hits = HitScheduler()
+    dead = _Walker([(0, 0), (10, 0)], speed=1.0)
+    recycled = _Walker([(0, 0), (10, 0)], speed=1.0, serial=7)
+    hits.schedule(_shot(dead, 0.1), _Shooter())
+    hits.schedule(_shot(recycled, 0.1), _Shooter())
+    dead.alive = False
+    recycled.serial = 8  # la instancia volvió a la reserva y es otro enemigo
+    assert hits.resolve(1.0) == 0 and hits.missed == 2
+    assert recycled.health == 100
+
+
+def _play(mode, quiet, ticks=6000):
+    game = GameManager(rng=RandomStreams(7))
+    game.projectile_mode = mode
+    errors = []
+    with quiet():
+        game.load_level(0)
+        game.lives = 10**6
+        for spot in game.spots[:5]:
+            game.towers.append(Tower(spot.pos))
+            spot.occupied = True
+        resolve = game.hits.resolve
+
+        def measure(now, events=None):
+            for hit_time, _, projectile, _ in game.hits._heap:
+                if hit_time <= now and projectile.alive and projectile.tracking:
+                    errors.append(math.dist(projectile.impact, projectile.target.pos))
+            return resolve(now, events)
+
+        game.hits.resolve = measure
+        for _ in range(ticks):
+            game.update(1 / 120)
+    return game, errors
+
+
+def test_game_intercepts_land_where_predicted(quiet):
+    game, errors = _play(INTERCEPT_MODE, quiet)
+    homing, _ = _play("homing", quiet)
+    assert game.hits.landed > 0 and errors
+    # El error es como mucho lo que el enemigo avanza en un tick
+    assert sorted(errors)[len(errors) // 2] < 5
+    assert game.queue_stats.kills >= 0.8 * homing.queue_stats.kills
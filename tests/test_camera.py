@@ -0,0 +1,111 @@
+import pygame
+import pytest
+
+from game import settings
+from game.camera import Camera, TerrainChunks
+from game.game_manager import GameManager
+from game.level_cache import LevelCache
+from maps.generator import crear_nivel_generado
+from maps.map_utils import crear_tiles
+
+VIEWPORT = (800, 600)
+
+
+def _camera(world=(0, 0, 4000, 3000)):
+    camera = Camera(VIEWPORT)
+    camera.set_world(pygame.Rect(world))
+    return camera
+
+
+def test_small_world_keeps_the_screen_view():
+    camera = _camera((100, 50, 400, 300))
+    assert (camera.x, camera.y, camera.zoom) == (0.0, 0.0, 1.0)
+    camera.pan(500, 500)
+    assert (camera.x, camera.y) == (0.0, 0.0)
+    assert camera.world_to_screen((123, 45)) == (123, 45)
+
+
+def test_pan_is_clamped_to_the_world():
+    camera = _camera()
+    camera.pan(10_000, 10_000)
+    assert (camera.x, camera.y) == (4000 - 800, 3000 - 600)
+    camera.pan(-20_000, -20_000)
+    assert (camera.x, camera.y) == (0.0, 0.0)
+
+
+def test_zoom_keeps_the_anchor_and_limits():
+    camera = _camera()
+    camera.pan(1000, 1000)
+    anchor = (300, 200)
+    world = camera.screen_to_world(anchor)
+    camera.zoom_at(1.5, anchor)
+    assert camera.screen_to_world(anchor) == pytest.approx(world)
+
+    camera.zoom_at(100.0, anchor)
+    assert camera.zoom == settings.CAMERA_MAX_ZOOM
+    camera.zoom_at(0.001, anchor)
+    assert camera.zoom == settings.CAMERA_MIN_ZOOM
+
+
+def test_screen_world_round_trip():
+    camera = _camera()
+    camera.set_view(1234.0, 567.0, 1.25)
+    for pos in ((0, 0), (400, 300), (799, 599)):
+        assert camera.world_to_screen(camera.screen_to_world(pos)) == pos
+    view = camera.view_rect()
+    assert view.collidepoint(camera.screen_to_world((799, 599)))
+
+
+def _chunks(max_cached=64):
+    mapa = crear_nivel_generado(60, 40, semilla=2)["config"]["mapa"]
+    size = (60 * settings.TILE_SIZE, 40 * settings.TILE_SIZE)
+    return TerrainChunks(crear_tiles(mapa), (0, 0), size, chunk_tiles=8, max_cached=max_cached), size
+
+
+def test_only_visible_chunks_are_rendered():
+    chunks, _ = _chunks()
+    chunk_px = 8 * settings.TILE_SIZE
+    view = pygame.Rect(0, 0, *VIEWPORT)
+    keys = list(chunks.visible_chunks(view))
+    assert keys == [
+        (col, row)
+        for row in range(-(-VIEWPORT[1] // chunk_px))
+        for col in range(-(-VIEWPORT[0] // chunk_px))
+    ]
+    chunks.draw(pygame.Surface(VIEWPORT), view)
+    assert len(chunks) == len(keys)
+
+
+def test_chunk_cache_is_bounded():
+    chunks, (width, height) = _chunks(max_cached=4)
+    surface = pygame.Surface(VIEWPORT)
+    for x in range(0, width, 400):
+        for y in range(0, height, 400):
+            chunks.draw(surface, pygame.Rect(x, y, 400, 400))
+            # Siempre caben al menos los bloques visibles (el doble)
+            assert len(chunks) <= chunks.max_cached <= 8
+    assert chunks.cached_bytes <= 8 * (8 * settings.TILE_SIZE) ** 2 * surface.get_bytesize()
+
+
+def test_chunked_terrain_matches_tile_by_tile_drawing():
+    chunks, _ = _chunks()
+    mapa = crear_nivel_generado(60, 40, semilla=2)["config"]["mapa"]
+    tiles = crear_tiles(mapa)
+    view = pygame.Rect(350, 220, *VIEWPORT)
+
+    expected = pygame.Surface(VIEWPORT)
+    for tile in tiles:
+        expected.blit(tile.image, tile.rect.move(-view.x, -view.y))
+    drawn = pygame.Surface(VIEWPORT)
+    chunks.draw(drawn, view, (-view.x, -view.y))
+    assert pygame.image.tobytes(drawn, "RGB") == pygame.image.tobytes(expected, "RGB")
+
+
+def test_click_on_a_scrolled_map_hits_the_spot(quiet):
+    game = GameManager(level_cache=LevelCache([crear_nivel_generado(80, 60, semilla=4)]))
+    with quiet():
+        game.load_level(0)
+    spot = max(game.spots, key=lambda s: s.pos[0] + s.pos[1])
+    game.camera.set_view(spot.pos[0] - 300, spot.pos[1] - 200, 1.0)
+    game.handle_click(game.camera.world_to_screen(spot.pos))
+    assert game.build_menu is not None and game.build_menu["spot"] is spot
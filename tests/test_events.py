@@ -0,0 +1,82 @@
+from game.events import EventBus, EventType
+from game.game_manager import GameManager
+from game.rng import RandomStreams
+
+
+def test_dispatch_delivers_in_emission_order():
+    bus = EventBus(capacity=2)
+    seen = []
+    bus.subscribe(EventType.SPAWN, lambda event: seen.append(("spawn", event.entity)))
+    bus.subscribe(EventType.KILL, lambda event: seen.append(("kill", event.entity, event.value)))
+    bus.time = 1.5
+    bus.emit(EventType.SPAWN, "a")
+    bus.emit(EventType.KILL, "a", value=10)
+    bus.emit(EventType.SPAWN, "b")  # supera la capacidad inicial
+    bus.emit(EventType.LEAK, "b")  # sin suscriptores
+    assert len(bus) == 4
+    assert bus.dispatch() == 4
+    assert seen == [("spawn", "a"), ("kill", "a", 10), ("spawn", "b")]
+    assert len(bus) == 0 and bus.dispatched == 4
+
+
+def test_handlers_can_emit_during_dispatch():
+    bus = EventBus()
+    seen = []
+    bus.subscribe(EventType.KILL, lambda event: bus.emit(EventType.WAVE_START, value=2))
+    bus.subscribe(EventType.WAVE_START, lambda event: seen.append(event.value))
+    bus.emit(EventType.KILL)
+    assert bus.dispatch() == 2
+    assert seen == [2]
+
+
+def test_records_are_reused_and_released():
+    bus = EventBus(capacity=4)
+    records = []
+    bus.subscribe(EventType.SHOT, records.append)
+    bus.emit(EventType.SHOT, "objetivo", "torre")
+    bus.dispatch()
+    bus.emit(EventType.SHOT, "otro")
+    bus.dispatch()
+    assert records[0] is records[1]
+    assert records[0].entity is None and records[0].source is None
+
+
+def test_unsubscribe_and_clear():
+    bus = EventBus()
+    seen = []
+    bus.subscribe(EventType.HIT, seen.append)
+    bus.unsubscribe(EventType.HIT, seen.append)
+    bus.unsubscribe(EventType.HIT, seen.append)  # ya no está: no falla
+    bus.emit(EventType.HIT)
+    assert bus.dispatch() == 1 and seen == []
+    bus.emit(EventType.HIT)
+    bus.clear()
+    assert bus.dispatch() == 0
+
+
+def test_game_economy_follows_the_events(quiet):
+    game = GameManager(rng=RandomStreams(2))
+    counts = dict.fromkeys(EventType, 0)
+    rewards = []
+
+    def count(event):
+        counts[event.type] += 1
+        if event.type == EventType.KILL:
+            rewards.append(event.value)
+
+    for event_type in EventType:
+        game.events.subscribe(event_type, count)
+    with quiet():
+        game.load_level(0)
+        game.money = 10_000
+        for spot in game.spots:
+            game.build_tower(spot, "guardian")
+        money = game.money
+        lives = game.lives
+        for _ in range(4000):
+            game.update(1 / 120)
+    assert counts[EventType.SPAWN] == game.total_spawned > 0
+    assert counts[EventType.KILL] > 0 and counts[EventType.SHOT] >= counts[EventType.KILL]
+    assert counts[EventType.HIT] >= counts[EventType.KILL]
+    assert game.money == money + sum(rewards)
+    assert game.lives == lives - counts[EventType.LEAK]
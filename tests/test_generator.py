@@ -0,0 +1,61 @@
+import pytest
+
+from game.game_manager import GameManager
+from game.level_cache import LevelCache
+from maps.generator import (
+    BASE_TORRE,
+    FIN,
+    INICIO,
+    MAX_DIMENSION,
+    MIN_DIMENSION,
+    crear_nivel_generado,
+    generar_mapa,
+)
+from maps.map_utils import calcular_campo_distancias, extraer_caminos
+
+
+@pytest.mark.parametrize("columnas, filas, inicios", [(5, 5, 1), (40, 25, 4), (200, 120, 8)])
+def test_generated_maps_are_valid(columnas, filas, inicios):
+    mapa = generar_mapa(columnas, filas, num_inicios=inicios, semilla=3)
+    assert len(mapa) == filas and all(len(fila) == columnas for fila in mapa)
+    assert {valor for fila in mapa for valor in fila} <= {0, 1, 2, 3, 4}
+
+    finales = [(x, y) for y, fila in enumerate(mapa) for x, valor in enumerate(fila) if valor == FIN]
+    assert len(finales) == 1 and finales[0][0] == columnas - 1
+    puntos_inicio = [(x, y) for y, fila in enumerate(mapa) for x, valor in enumerate(fila) if valor == INICIO]
+    assert 1 <= len(puntos_inicio) <= inicios
+    assert all(x == 0 or y in (0, filas - 1) for x, y in puntos_inicio)
+
+    campo = calcular_campo_distancias(mapa)
+    assert all(campo.alcanzable(x, y) for x, y in puntos_inicio)
+    assert len(extraer_caminos(mapa)) == len(puntos_inicio)
+
+
+def test_same_seed_same_map():
+    assert generar_mapa(60, 40, 5, semilla=11) == generar_mapa(60, 40, 5, semilla=11)
+    assert generar_mapa(60, 40, 5, semilla=11) != generar_mapa(60, 40, 5, semilla=12)
+
+
+def test_tower_density():
+    vacio = generar_mapa(50, 50, 3, semilla=1, densidad_torres=0.0)
+    lleno = generar_mapa(50, 50, 3, semilla=1, densidad_torres=0.5)
+    assert not any(BASE_TORRE in fila for fila in vacio)
+    assert sum(fila.count(BASE_TORRE) for fila in lleno) > 0
+
+
+@pytest.mark.parametrize("columnas", [MIN_DIMENSION - 1, MAX_DIMENSION + 1])
+def test_rejects_out_of_range_sizes(columnas):
+    with pytest.raises(ValueError):
+        generar_mapa(columnas, 20)
+
+
+def test_generated_level_plays(quiet):
+    nivel = crear_nivel_generado(60, 40, num_inicios=4, semilla=5)
+    assert nivel["config"]["nombre"] == "Generado 60x40"
+    game = GameManager(level_cache=LevelCache([nivel]))
+    with quiet():
+        game.load_level(0)
+        for _ in range(600):
+            game.update(1 / 120)
+    assert game.state == "playing" and game.paths and game.spots
+    assert game.total_spawned > 0
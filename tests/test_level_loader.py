@@ -0,0 +1,68 @@
+import logging
+import shutil
+
+import pytest
+
+from game.game_manager import GameManager
+from game.level_cache import LevelCache
+from maps import level_loader
+from maps.level_loader import LEVELS_DIR, LevelFile, discover_levels
+
+pytestmark = pytest.mark.skipif(level_loader.np is None, reason="la caché binaria necesita NumPy")
+
+
+@pytest.fixture
+def levels_dir(tmp_path):
+    for path in sorted(LEVELS_DIR.glob("*.json")):
+        shutil.copy(path, tmp_path / path.name)
+    return tmp_path
+
+
+def test_discover_levels_does_not_read_files(levels_dir):
+    levels = discover_levels(levels_dir)
+    assert [level.path.name for level in levels] == sorted(p.name for p in levels_dir.glob("*.json"))
+    assert all(level._config is None for level in levels)
+
+
+def test_compiled_cache_round_trip(levels_dir):
+    fresh = discover_levels(levels_dir)[1]
+    compiled = fresh.compiled()
+    assert (levels_dir / ".cache" / fresh.path.stem / "meta.json").exists()
+
+    cached = discover_levels(levels_dir)[1].compiled()
+    assert cached.caminos == compiled.caminos
+    assert list(cached.campo.distancia) == list(compiled.campo.distancia)
+    assert list(cached.campo.siguiente) == list(compiled.campo.siguiente)
+    assert cached.mapa.tolist() == compiled.mapa
+
+
+def test_cache_is_invalidated_when_the_file_changes(levels_dir):
+    level = discover_levels(levels_dir)[0]
+    level.compiled()
+    assert LevelFile(level.path, levels_dir / ".cache")._load_cache() is not None
+
+    level.path.write_text(level.path.read_text(encoding="utf-8") + "\n", encoding="utf-8")
+    assert LevelFile(level.path, levels_dir / ".cache")._load_cache() is None
+
+
+def test_menu_info_comes_from_the_cache(levels_dir, quiet):
+    for level in discover_levels(levels_dir):
+        assert level.info["nombre"] == level.config["nombre"]
+
+    levels = discover_levels(levels_dir)
+    with quiet():
+        game = GameManager(level_cache=LevelCache(levels))
+    assert [button["text"] for button in game.menu_buttons] == [
+        level.info["nombre"] for level in levels
+    ]
+    assert all(level._config is None for level in levels)
+
+
+def test_cache_write_failure_is_logged(levels_dir, caplog):
+    blocked = levels_dir / "bloqueado"
+    blocked.write_text("")  # un archivo donde debería ir el directorio de la caché
+    level = LevelFile(sorted(levels_dir.glob("*.json"))[0], blocked)
+    with caplog.at_level(logging.WARNING, logger=level_loader.__name__):
+        compiled = level.compiled()
+    assert compiled.caminos
+    assert "No se pudo escribir la caché" in caplog.text
@@ -0,0 +1,81 @@
+from collections import deque
+
+import pytest
+
+from maps import LEVELS
+from maps.generator import generar_mapa
+from maps.map_utils import _vecinos, extraer_caminos
+
+
+def _caminos_referencia(mapa, tipos_camino=(1,), tipo_inicio=3, tipo_fin=4):
+    """BFS desde cada inicio, como la versión original de ``extraer_caminos``."""
+    if not mapa:
+        return []
+    filas = len(mapa)
+    columnas = len(mapa[0])
+    permitidos = set(tipos_camino) | {tipo_inicio, tipo_fin}
+    inicios = [
+        (x, y) for y, fila in enumerate(mapa) for x, valor in enumerate(fila) if valor == tipo_inicio
+    ]
+    if not inicios:
+        for y, fila in enumerate(mapa):
+            for x, valor in enumerate(fila):
+                if valor in permitidos:
+                    inicios.append((x, y))
+                    break
+            if inicios:
+                break
+
+    caminos = []
+    for inicio in inicios:
+        cola = deque([inicio])
+        padres = {inicio: None}
+        destino = None
+        while cola:
+            actual = cola.popleft()
+            x, y = actual
+            if mapa[y][x] == tipo_fin:
+                destino = actual
+                break
+            for nx, ny in _vecinos(x, y):
+                if 0 <= nx < columnas and 0 <= ny < filas and (nx, ny) not in padres:
+                    if mapa[ny][nx] in permitidos:
+                        padres[(nx, ny)] = actual
+                        cola.append((nx, ny))
+        if destino is None:
+            continue
+        camino = []
+        nodo = destino
+        while nodo is not None:
+            camino.append(nodo)
+            nodo = padres[nodo]
+        caminos.append(camino[::-1])
+    return caminos
+
+
+@pytest.mark.parametrize("index", range(len(LEVELS)))
+def test_extraer_caminos_levels(index):
+    config = LEVELS[index]["config"]
+    tipos = tuple(config.get("tipos_camino", (1,)))
+    assert extraer_caminos(config["mapa"], tipos) == _caminos_referencia(config["mapa"], tipos)
+
+
+@pytest.mark.parametrize("semilla", [1, 7, 42])
+def test_extraer_caminos_generated(semilla):
+    # Con varios caminos igual de cortos el desempate puede diferir de la
+    # búsqueda original: se exige la misma longitud, extremos y contigüidad.
+    mapa = generar_mapa(40, 30, num_inicios=4, semilla=semilla)
+    caminos = extraer_caminos(mapa)
+    referencia = _caminos_referencia(mapa)
+    assert len(caminos) == len(referencia)
+    for camino, esperado in zip(caminos, referencia):
+        assert len(camino) == len(esperado)
+        assert camino[0] == esperado[0] and camino[-1] == esperado[-1]
+        for (ax, ay), (bx, by) in zip(camino, camino[1:]):
+            assert abs(ax - bx) + abs(ay - by) == 1
+            assert mapa[by][bx] in (1, 3, 4)
+
+
+def test_extraer_caminos_without_exit():
+    mapa = [[3, 1, 1, 0]]
+    assert extraer_caminos(mapa) == _caminos_referencia(mapa) == []
@@ -0,0 +1,76 @@
+import json
+import time
+import urllib.request
+
+from game.game_manager import GameManager
+from game.rng import RandomStreams
+from utils.metrics_exporter import GAME_METRICS, MetricsExporter, format_prometheus
+
+
+def _wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_format_scalars_and_labelled_series():
+    text = format_prometheus({"td_money": 150, "td_lambda": {"config": 0.5, 'me"dido': 2}}, dropped=3)
+    lines = text.splitlines()
+    assert "# HELP td_money Dinero disponible" in lines
+    assert "# TYPE td_money gauge" in lines
+    assert "td_money 150.0" in lines
+    assert 'td_lambda{fuente="config"} 0.5' in lines
+    assert 'td_lambda{fuente="me\\"dido"} 2.0' in lines
+    assert lines[-1] == "td_exporter_dropped_total 3"
+
+
+def test_unknown_metrics_use_a_generic_series_label():
+    text = format_prometheus({"otra": {"a": 1}})
+    assert "# HELP otra" not in text
+    assert "# TYPE otra gauge" in text and 'otra{serie="a"} 1.0' in text
+
+
+def test_full_queue_drops_without_blocking():
+    exporter = MetricsExporter(queue_size=2)  # sin arrancar: nadie consume
+    assert exporter.publish({"td_wave": 1}) and exporter.publish({"td_wave": 2})
+    assert not exporter.publish({"td_wave": 3})
+    assert (exporter.published, exporter.dropped) == (2, 1)
+
+
+def test_worker_serves_the_latest_sample(quiet, tmp_path):
+    log_file = tmp_path / "metrics.jsonl"
+    with quiet():
+        exporter = MetricsExporter(port=0, file_path=log_file).start()
+    try:
+        assert exporter.port != 0
+        exporter.publish({"td_wave": 1})
+        exporter.publish({"td_wave": 2, "td_phase_ms": {"update": 1.5}})
+        _wait_for(lambda: "td_wave 2.0" in exporter.render())
+
+        url = f"http://{exporter.host}:{exporter.port}/metrics"
+        with urllib.request.urlopen(url, timeout=2) as response:
+            assert response.headers["Content-Type"].startswith("text/plain")
+            body = response.read().decode("utf-8")
+        assert 'td_phase_ms{fase="update"} 1.5' in body
+    finally:
+        exporter.stop()
+
+    records = [json.loads(line) for line in log_file.read_text(encoding="utf-8").splitlines()]
+    assert [record["td_wave"] for record in records] == [1, 2]
+    assert all("ts" in record for record in records)
+
+
+def test_game_sample_is_fully_described(quiet):
+    game = GameManager(rng=RandomStreams(3))
+    with quiet():
+        game.load_level(0)
+        for _ in range(600):
+            game.update(1 / 120)
+    sample = game.metrics_sample()
+    assert set(sample) == set(GAME_METRICS)
+    assert sample["td_level"] == 1 and sample["td_enemies_alive"] == len(game.enemies)
+    for name, value in sample.items():
+        label = GAME_METRICS[name][2]
+        assert isinstance(value, dict) == bool(label), name
+    format_prometheus(sample)
@@ -0,0 +1,115 @@
+import math
+
+import numpy as np
+import pytest
+
+from game import settings
+from game.agent_env import GLOBAL_FEATURES, GameEnv
+from game.game_manager import GameManager
+from game.observation import CHANNELS, SCALARS, board_size, board_views, map_shape
+from game.rng import RandomStreams
+
+DT = 1 / 120
+
+
+def _play(game, quiet, ticks=1500):
+    with quiet():
+        game.load_level(2)
+        game.money = 10_000
+        for spot in game.spots[:3]:
+            game.build_tower(spot, "guardian")
+        for _ in range(ticks):
+            game.update(DT)
+            if game.state != "playing":
+                break
+
+
+def test_board_views_share_the_block():
+    shape = (3, 4)
+    block = bytearray(board_size(shape) * 4)
+    scalars, board = board_views(block, shape)
+    assert scalars.shape == (len(SCALARS),) and board.shape == (len(CHANNELS), *shape)
+    board[-1, 2, 3] = 5.0
+    assert np.frombuffer(block, dtype=np.float32)[-1] == 5.0
+
+    rows = np.zeros((2, board_size(shape)), dtype=np.float32)
+    scalars, board = board_views(rows, shape)
+    assert scalars.shape == (2, len(SCALARS)) and board.shape == (2, len(CHANNELS), *shape)
+    with pytest.raises(ValueError):
+        board_views(bytearray(8), shape)
+
+
+def test_menu_state_exports_only_the_tick():
+    tensors = GameManager().export_board()
+    assert tensors.scalars[:5].tolist() == [0.0] * 5 and tensors.scalars[5] == 1.0
+    assert not tensors.board.any()
+
+
+def test_board_matches_the_game(quiet):
+    game = GameManager(rng=RandomStreams(5))
+    block = bytearray(board_size((40, 40)) * 4)
+    tensors = game.export_board(block=block)
+    _play(game, quiet)
+    alive = [enemy for enemy in game.enemies if enemy.alive]
+    assert alive
+
+    scalars, board = board_views(block, tensors.shape)
+    assert scalars[0] == game.money and scalars[1] == game.lives and scalars[3] == len(alive)
+    rows, columns = map_shape(game.level_config["mapa"])
+    assert board[0, :rows, :columns].tolist() == game.level_config["mapa"]
+    assert not board[:, rows:].any() and not board[:, :, columns:].any()
+
+    density = np.zeros((rows, columns))
+    health = np.zeros((rows, columns))
+    for enemy in alive:
+        row, col = divmod(enemy.grid_cell, columns)
+        density[row, col] += 1
+        health[row, col] += enemy.health
+    assert np.array_equal(board[1, :rows, :columns], density)
+    assert np.allclose(board[2, :rows, :columns], health)
+
+    tile = settings.TILE_SIZE
+    ox, oy = game.map_offset
+    for row, col in ((0, 0), (rows // 2, columns // 2), (rows - 1, columns - 1)):
+        center = (ox + tile * (col + 0.5), oy + tile * (row + 0.5))
+        covering = [t for t in game.towers if math.dist(center, t.pos) <= t.range]
+        assert board[3, row, col] == len(covering)
+        assert board[4, row, col] == pytest.approx(sum(t.damage * t.fire_rate for t in covering))
+
+
+def test_rebind_moves_writes_to_the_new_block(quiet):
+    game = GameManager(rng=RandomStreams(5))
+    tensors = game.export_board()
+    _play(game, quiet, 600)
+    other = bytearray(len(tensors.block))
+    tensors.rebind(other)
+    assert bytes(other) == bytes(tensors.block)
+    assert tensors.memoryview()[1] == game.lives
+
+
+def test_observation_counts_only_live_enemies(quiet):
+    env = GameEnv(0, seed=2, ticks_per_step=1)
+    env.reset()
+    game = env.game
+    game.money = 10_000
+    for spot in game.spots:
+        game.build_tower(spot, "guardian")
+    env._spot_towers = list(game.towers)
+    assert len(game.towers) == env.num_spots
+
+    checked = 0
+    with quiet():
+        for _ in range(6000):
+            obs, _, terminated, truncated, _ = env.step(0)
+            if any(not enemy.alive for enemy in game.enemies):
+                # Abatidos en este paso: siguen en la lista hasta el próximo tick
+                checked += 1
+                live = [enemy for enemy in game.enemies if enemy.alive]
+                assert obs[GLOBAL_FEATURES.index("vivos")] == len(live)
+                spots = obs[len(GLOBAL_FEATURES):].reshape(env.num_spots, env.spot_size)
+                for spot, tower, row in zip(game.spots, game.towers, spots):
+                    cells = {cell for _, cell in game.enemy_index.coverage(spot.pos, tower.range)}
+                    assert row[-1] == sum(enemy.grid_cell in cells for enemy in live)
+            if terminated or truncated:
+                break
+    assert checked
@@ -0,0 +1,61 @@
+from game.game_manager import GameManager
+from game.rng import RandomStreams
+from utils.pool import ObjectPool
+
+
+class _Thing:
+    def __init__(self, value):
+        self.reset(value)
+
+    def reset(self, value):
+        self.value = value
+
+
+def test_acquire_reuses_released_instances():
+    pool = ObjectPool(_Thing, capacity=2)
+    first = pool.acquire(1)
+    second = pool.acquire(2)
+    assert (pool.size, pool.allocations, pool.reuses) == (2, 0, 2)
+    third = pool.acquire(3)
+    assert (pool.size, pool.allocations, pool.in_use) == (3, 1, 3)
+
+    pool.release(second)
+    again = pool.acquire(4)
+    assert again is second and again.value == 4
+    assert first.value == 1 and third.value == 3
+
+
+def test_release_all_and_stats():
+    pool = ObjectPool(_Thing)
+    things = [pool.acquire(n) for n in range(5)]
+    pool.release_all(things[1:])
+    assert pool.stats() == {
+        "size": 5, "free": 4, "in_use": 1, "high_water": 5, "allocations": 5, "reuses": 0,
+    }
+    pool.take()
+    assert (pool.free, pool.in_use, pool.high_water, pool.acquired) == (3, 2, 5, 6)
+
+
+def _play(game, ticks):
+    for _ in range(ticks):
+        game.update(1 / 120)
+        projectiles = sum(len(tower.projectiles) for tower in game.towers)
+        # Los enemigos retirados vuelven a la reserva al final de cada tick
+        assert game.enemy_pool.in_use == len(game.enemies)
+        assert game.projectile_pool.in_use == projectiles
+
+
+def test_game_returns_every_entity(quiet):
+    game = GameManager(rng=RandomStreams(4))
+    with quiet():
+        game.load_level(0)
+        game.money = 10_000
+        for spot in game.spots:
+            game.build_tower(spot, "guardian")
+        _play(game, 3000)
+        assert game.enemy_pool.reuses > 0 and game.projectile_pool.reuses > 0
+
+        # Cargar otro nivel devuelve todas las instancias
+        game.load_level(1)
+        assert game.enemy_pool.in_use == game.projectile_pool.in_use == 0
+        _play(game, 600)
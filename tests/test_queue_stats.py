@@ -0,0 +1,79 @@
+import pytest
+
+from game.events import EventBus, EventType
+from game.game_manager import GameManager
+from game.queue_stats import LiveQueueStats
+from game.rng import RandomStreams
+
+
+class _Enemy:
+    pass
+
+
+def _emit(bus, time, event_type, entity):
+    bus.time = time
+    bus.emit(event_type, entity)
+    bus.dispatch()
+
+
+def test_deterministic_arrivals_and_services():
+    bus = EventBus()
+    stats = LiveQueueStats(bus, window=100.0, alpha=0.5)
+    enemies = [_Enemy() for _ in range(5)]
+    # Llegada cada 2 s; el primer disparo al llegar y la baja 1 s después
+    for idx, enemy in enumerate(enemies):
+        _emit(bus, 2.0 * idx, EventType.SPAWN, enemy)
+        _emit(bus, 2.0 * idx, EventType.SHOT, enemy)
+        _emit(bus, 2.0 * idx + 0.5, EventType.SHOT, enemy)  # solo cuenta el primero
+        _emit(bus, 2.0 * idx + 1.0, EventType.KILL, enemy)
+
+    summary = stats.summary(now=10.0, servers=1)
+    assert summary["lambda_ewma"] == pytest.approx(0.5)
+    assert summary["mu_effective"] == pytest.approx(1.0)
+    assert summary["rho"] == pytest.approx(0.5)
+    assert summary["W"] == pytest.approx(1.0)
+    # Un enemigo en el sistema la mitad del tiempo
+    assert summary["L"] == pytest.approx(0.5)
+    assert summary["little_lambda_w"] == pytest.approx(0.5)
+    assert summary["little_error"] == pytest.approx(0.0)
+    assert (summary["kills"], summary["leaks"], summary["in_system"]) == (5, 0, 0)
+
+
+def test_window_rate_and_leaks():
+    bus = EventBus()
+    stats = LiveQueueStats(bus, window=10.0)
+    for second in range(30):
+        _emit(bus, float(second), EventType.SPAWN, _Enemy())
+    assert stats.summary(now=29.0, servers=2)["lambda_window"] == pytest.approx(11 / 10)
+
+    leaked = _Enemy()
+    _emit(bus, 30.0, EventType.SPAWN, leaked)
+    _emit(bus, 31.0, EventType.LEAK, leaked)
+    summary = stats.summary(now=31.0, servers=2)
+    assert summary["leaks"] == 1 and summary["in_system"] == 30
+    assert summary["mu_effective"] == 0.0 and summary["rho"] == 0.0
+
+
+def test_unknown_departures_are_ignored():
+    bus = EventBus()
+    stats = LiveQueueStats(bus)
+    _emit(bus, 1.0, EventType.KILL, _Enemy())  # p. ej. restaurado de un snapshot
+    summary = stats.summary(now=2.0, servers=1)
+    assert (summary["kills"], summary["in_system"], stats.departures) == (0, 0, 0)
+
+
+def test_game_feeds_the_estimators(quiet):
+    game = GameManager(rng=RandomStreams(8))
+    with quiet():
+        game.load_level(0)
+        game.money = 10_000
+        for spot in game.spots[:4]:
+            game.build_tower(spot, "guardian")
+        for _ in range(6000):
+            game.update(1 / 120)
+    stats = game.queue_stats
+    summary = stats.summary(game.elapsed, len(game.towers))
+    assert stats.arrivals == game.total_spawned
+    assert summary["in_system"] == sum(enemy.alive for enemy in game.enemies)
+    assert summary["kills"] > 0 and summary["mu_effective"] > 0
+    assert summary["lambda_ewma"] > 0 and summary["W"] > 0
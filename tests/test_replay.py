@@ -0,0 +1,69 @@
+import random
+
+import pytest
+
+from game import replay as replay_module
+from game.game_manager import GameManager
+from game.replay import Replay, ReplayRecorder, run_replay, start_session
+
+SEED = 42
+TICKS = 1500
+
+
+def _record(quiet, tmp_path):
+    game = GameManager()
+    start_session(game, SEED, None)
+    recorder = ReplayRecorder(SEED, None, hash_interval=10)
+    timing = random.Random(0)
+
+    def click(pos):
+        recorder.record_click(pos, game.camera)
+        game.handle_click(pos)
+
+    with quiet():
+        for tick in range(TICKS):
+            if tick == 5:
+                click(game.menu_buttons[2]["rect"].center)
+            if tick in (20, 21):
+                click(game.spots[tick - 20].pos)
+                click(game.build_menu["buttons"][0]["rect"].center)
+            ms = timing.choice((16, 17, 33))
+            game.advance(ms / 1000)
+            recorder.record_tick(ms, game)
+    assert len(game.towers) == 2
+    return recorder.save(tmp_path / "partida.tdr")
+
+
+def test_replay_round_trip(quiet, tmp_path):
+    path = _record(quiet, tmp_path)
+    replay = Replay.load(path)
+    assert replay.seed == SEED and len(replay.tick_ms) == TICKS
+
+    with quiet():
+        result = run_replay(replay, checkpoint_every=500)
+    assert result["first_mismatch"] is None
+    assert result["checkpoints"] == len(replay.hashes)
+
+    # Retomar desde un punto de control da los mismos hashes
+    with quiet():
+        resumed = run_replay(replay, resume_from=(1000, result["snapshots"][1000]))
+    assert resumed["first_mismatch"] is None
+    assert resumed["checkpoints"] > 0
+
+
+def test_replay_detects_divergence(quiet, tmp_path):
+    replay = Replay.load(_record(quiet, tmp_path))
+    replay.clicks = replay.clicks[:1]  # sin las torres la partida diverge
+    with quiet():
+        result = run_replay(replay)
+    assert result["first_mismatch"] is not None
+
+
+def test_rejects_other_version(quiet, tmp_path):
+    path = _record(quiet, tmp_path)
+    data = bytearray(path.read_bytes())
+    data[4] = replay_module.VERSION + 1
+    path.write_bytes(bytes(data))
+    with pytest.raises(ValueError) as error:
+        Replay.load(path)
+    assert str(replay_module.VERSION + 1) in str(error.value)
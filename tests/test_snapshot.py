@@ -0,0 +1,70 @@
+import pytest
+
+from game import snapshot
+from game.game_manager import GameManager
+from game.replay import state_hash
+from game.rng import RandomStreams
+
+DT = 1 / 120
+
+
+def _game(quiet, projectile_mode="homing"):
+    game = GameManager(rng=RandomStreams(7))
+    game.projectile_mode = projectile_mode
+    with quiet():
+        game.load_level(2)
+        game.money = 10_000
+        for spot in game.spots[:4]:
+            game.build_tower(spot, "guardian")
+        game.upgrade_tower(game.towers[0], "damage")
+    return game
+
+
+def _run(game, quiet, ticks):
+    with quiet():
+        for _ in range(ticks):
+            game.update(DT)
+
+
+@pytest.mark.parametrize("projectile_mode", ["homing", "intercept"])
+def test_capture_restore_round_trip(quiet, projectile_mode):
+    game = _game(quiet, projectile_mode)
+    _run(game, quiet, 900)
+    assert game.enemies and any(tower.projectiles for tower in game.towers)
+    data = snapshot.capture(game)
+
+    copy = GameManager()
+    copy.projectile_mode = projectile_mode
+    with quiet():
+        snapshot.restore(copy, data)
+    assert state_hash(copy) == state_hash(game)
+    assert snapshot.capture(copy) == data
+
+    # Restaurado, sigue exactamente la misma partida
+    _run(game, quiet, 600)
+    _run(copy, quiet, 600)
+    assert state_hash(copy) == state_hash(game)
+
+
+def test_restart_level_matches_fresh_load(quiet):
+    game = _game(quiet)
+    start = snapshot.capture(game, include_rng=False)
+    _run(game, quiet, 600)
+    with quiet():
+        snapshot.restore(game, start, restore_rng=False)
+    assert snapshot.capture(game, include_rng=False) == start
+    assert game.enemy_pool.in_use == len(game.enemies)
+
+
+def test_rejects_other_data(quiet):
+    with pytest.raises(ValueError):
+        snapshot.restore(GameManager(), b"XXXX" + bytes(16))
+
+
+@pytest.mark.parametrize("version", [snapshot.VERSION - 1, snapshot.VERSION + 1])
+def test_other_version_names_both_versions(quiet, version):
+    data = bytearray(snapshot.capture(_game(quiet)))
+    data[4:6] = version.to_bytes(2, "little")
+    with pytest.raises(ValueError) as error:
+        snapshot.restore(GameManager(), bytes(data))
+    assert str(version) in str(error.value) and str(snapshot.VERSION) in str(error.value)
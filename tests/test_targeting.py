@@ -0,0 +1,84 @@
+import math
+
+import pygame
+import pytest
+
+from game import settings
+from game.game_manager import GameManager
+from game.rng import RandomStreams
+from game.targeting import INF, STRATEGIES, EnemyIndex, next_strategy, select
+
+DT = 1 / 120
+
+
+@pytest.fixture
+def game(quiet):
+    game = GameManager(rng=RandomStreams(4))
+    with quiet():
+        game.load_level(1)
+        game.lives = 10**6
+        for tick in range(600):
+            if tick % 10 == 0:
+                game.spawn_enemy()
+            game.update(DT)
+    assert len(game.enemies) > 20
+    return game
+
+
+def test_strategies_cycle_in_menu_order():
+    keys = list(STRATEGIES)
+    assert [next_strategy(key) for key in keys] == keys[1:] + keys[:1]
+    assert next_strategy("desconocida") == keys[0]
+
+
+@pytest.mark.parametrize("strategy", list(STRATEGIES))
+def test_index_select_matches_full_scan(game, strategy):
+    for spot in game.spots:
+        for radius in (120, 360, 650):
+            expected = select(game.enemies, spot.pos, radius, strategy)
+            assert game.enemy_index.select(spot.pos, radius, strategy) is expected
+
+
+def test_index_follows_moves_and_removals(game, quiet):
+    index = game.enemy_index
+    with quiet():
+        for _ in range(300):
+            game.update(DT)
+    assert len(index) == len(game.enemies)
+    for enemy in game.enemies:
+        assert enemy in index.buckets[enemy.grid_cell]
+    index.clear()
+    assert len(index) == 0 and all(enemy.grid_cell == -1 for enemy in game.enemies)
+
+
+def test_entry_delay_is_a_lower_bound(game):
+    hz = settings.SPEED_REFERENCE_HZ
+    for spot in game.spots:
+        for radius in (60, 180, 360):
+            exact = min(
+                max(0.0, math.hypot(e.pos[0] - spot.pos[0], e.pos[1] - spot.pos[1]) - radius)
+                / (e.speed * hz)
+                for e in game.enemies
+                if e.alive
+            )
+            assert game.enemy_index.entry_delay(spot.pos, radius) <= exact + 1e-9
+
+
+def test_entry_delay_without_enemies_is_infinite():
+    assert EnemyIndex(size=(500, 500)).entry_delay((250, 250), 100) == INF
+
+
+def test_tower_menu_without_upgrades_keeps_targeting_button(game, monkeypatch):
+    monkeypatch.setattr(settings, "TOWER_UPGRADES", {})
+    game.money = 10_000
+    tower = game.build_tower(game.spots[0], "guardian")
+    game.open_tower_menu(tower)
+    menu = game.tower_menu
+    assert menu["buttons"] == []
+    rect = menu["targeting_rect"]
+    assert pygame.Rect(0, 0, settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT).contains(rect)
+
+    game.draw(pygame.Surface((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT)))
+    before = tower.targeting
+    assert game._handle_tower_menu_click(rect.center)
+    assert tower.targeting == next_strategy(before)
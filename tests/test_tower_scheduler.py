@@ -0,0 +1,98 @@
+import math
+
+import pytest
+
+from entities.tower import Tower
+from game.events import EventType
+from game.game_manager import GameManager
+from game.rng import RandomStreams
+from game.tower_scheduler import INF, TowerScheduler
+
+DT = 1 / 120
+
+
+def _poll(towers, enemies, now, dt, events=None, hits=None, index=None):
+    """Comprobación por frame de todas las torres, como antes del planificador."""
+    for tower in towers:
+        tower.update_projectiles(dt, events, hits)
+    for tower in towers:
+        if now - tower.last_shot >= 1 / tower.fire_rate:
+            tower.try_fire(enemies, now, events, hits)
+
+
+def _shots(level, polling, ticks=4000):
+    game = GameManager(rng=RandomStreams(11))
+    shots = []
+    game.events.subscribe(
+        EventType.SHOT, lambda event: shots.append((round(event.time, 9), game.towers.index(event.source)))
+    )
+    if polling:
+        game.tower_scheduler.update = _poll
+    game.load_level(level)
+    game.lives = 10**6
+    for spot in game.spots[:8]:
+        game.towers.append(Tower(spot.pos))
+        spot.occupied = True
+    for _ in range(ticks):
+        game.update(DT)
+    return shots, game
+
+
+@pytest.mark.parametrize("level", [0, 1, 2])
+def test_shots_match_per_frame_polling(level, quiet):
+    with quiet():
+        expected, _ = _shots(level, polling=True)
+        shots, game = _shots(level, polling=False)
+    # Dentro de un tick el orden de las torres puede variar
+    assert sorted(shots) == sorted(expected) and shots
+    # Las torres solo despiertan una fracción de los ticks
+    assert game.tower_scheduler.wakeups < len(game.towers) * 4000 / 10
+
+
+def test_idle_towers_sleep_until_woken():
+    scheduler = TowerScheduler()
+    tower = Tower((100, 100))
+    scheduler.update([tower], [], 0.0, DT)
+    assert scheduler.stats() == {"towers": 1, "sleeping": 1, "armed": 0, "wakeups": 1}
+    assert tower.wake_time == INF
+
+    scheduler.wake(tower, 5.0)
+    scheduler.wake(tower, 7.0)  # posterior: no cambia nada
+    assert tower.wake_time == 5.0 and scheduler.stats()["sleeping"] == 0
+    scheduler.update([tower], [], 4.0, DT)
+    assert scheduler.wakeups == 1
+    scheduler.update([tower], [], 5.0, DT)
+    assert scheduler.wakeups == 2 and tower.wake_time == INF
+
+
+def test_new_enemies_wake_sleeping_towers(quiet):
+    game = GameManager(rng=RandomStreams(3))
+    with quiet():
+        game.load_level(0)
+        game.money = 10_000
+        # La torre más alejada de la entrada: el enemigo nuevo no está en alcance
+        start = game.paths[0][0]
+        spot = max(game.spots, key=lambda spot: math.dist(spot.pos, start))
+        game.build_tower(spot, "guardian")
+        tower = game.towers[0]
+        game.wave_active = False  # sin apariciones automáticas
+        game.update(DT)
+        assert tower.wake_time == INF
+
+        game.spawn_enemy(path_index=0)
+        game.update(DT)
+        enemy = game.enemies[0]
+        assert tower.last_shot < game.elapsed < tower.wake_time < INF
+        # El despertar nunca llega después de que el enemigo pueda estar en alcance
+        assert tower.wake_time <= game.elapsed + tower.entry_delay(enemy)
+
+
+def test_clear_forgets_every_tower():
+    scheduler = TowerScheduler()
+    towers = [Tower((0, 0)), Tower((50, 0))]
+    scheduler.sync(towers, 0.0)
+    scheduler.arm(towers[0])
+    scheduler.clear()
+    assert len(scheduler) == 0 and not towers[0].armed
+    scheduler.update([], [], 1.0, DT)
+    assert scheduler.wakeups == 0
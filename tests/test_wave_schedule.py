@@ -0,0 +1,95 @@
+from bisect import bisect_right
+
+import pytest
+
+from game import wave_schedule
+from game.events import EventType
+from game.game_manager import GameManager
+from game.rng import RandomStreams
+from game.wave_schedule import WaveSchedule
+
+TIERS = [
+    {"peso": 3, "velocidad": (1.0, 2.0), "salud": (50, 60)},
+    {"peso": 1, "velocidad": (4.0, 5.0), "salud": (300, 400)},
+]
+
+
+@pytest.fixture(params=["numpy", "random"])
+def backend(request, monkeypatch):
+    if request.param == "random":
+        monkeypatch.setattr(wave_schedule, "np", None)
+    elif wave_schedule.np is None:
+        pytest.skip("NumPy no está instalado")
+    return request.param
+
+
+def test_generated_entries_follow_the_tiers(backend):
+    schedule = WaveSchedule.generate(RandomStreams(4), 500, 2.0, TIERS, 3)
+    assert len(schedule) == schedule.remaining == 500
+    rows = schedule.rows()
+    times = [row[0] for row in rows]
+    assert times == sorted(times) and times[0] > 0
+    # Llegadas de Poisson: unas 2 por segundo
+    assert times[-1] == pytest.approx(500 / 2.0, rel=0.2)
+    for _, tier, path, speed, health in rows:
+        low, high = TIERS[tier]["velocidad"]
+        assert 0 <= path < 3 and low <= speed <= high
+        low, high = TIERS[tier]["salud"]
+        assert low <= health <= high and isinstance(health, int)
+    assert sum(row[1] == 0 for row in rows) > sum(row[1] == 1 for row in rows)
+
+
+def test_same_seed_same_schedule(backend):
+    first = WaveSchedule.generate(RandomStreams(9), 50, 1.0, TIERS, 2).rows()
+    assert first == WaveSchedule.generate(RandomStreams(9), 50, 1.0, TIERS, 2).rows()
+    assert first != WaveSchedule.generate(RandomStreams(10), 50, 1.0, TIERS, 2).rows()
+
+
+def test_empty_schedules():
+    for schedule in (WaveSchedule(), WaveSchedule.generate(RandomStreams(1), 0, 1.0, TIERS, 2),
+                     WaveSchedule.generate(RandomStreams(1), 5, 1.0, TIERS, 0)):
+        assert len(schedule) == 0 and schedule.next_time == float("inf")
+
+
+def test_pop_advances_the_cursor():
+    schedule = WaveSchedule(times=[0.5, 1.0], tiers=[1, 0], paths=[0, 2], speeds=[2.5, 1.5], healths=[90, 80])
+    assert schedule.next_time == 0.5
+    assert schedule.pop() == (1, 0, 2.5, 90)
+    assert (schedule.next_time, schedule.remaining) == (1.0, 1)
+    schedule.pop()
+    assert schedule.next_time == float("inf") and schedule.remaining == 0
+
+
+def test_bytes_round_trip():
+    schedule = WaveSchedule.generate(RandomStreams(2), 20, 1.5, TIERS, 2)
+    schedule.pop()
+    data = b"prefijo" + schedule.to_bytes()
+    restored, offset = WaveSchedule.from_bytes(data, len(b"prefijo"))
+    assert offset == len(data)
+    assert restored.rows() == schedule.rows() and restored.cursor == 1
+
+
+def test_game_spawns_follow_the_schedule(quiet):
+    game = GameManager(rng=RandomStreams(6))
+    spawned = []
+    # Los enemigos vuelven a la reserva: se copian sus valores al aparecer
+    game.events.subscribe(
+        EventType.SPAWN, lambda event: spawned.append((event.entity.speed, event.entity.max_health))
+    )
+    with quiet():
+        game.load_level(0)
+        game.update(1 / 120)
+        schedule = game.wave_schedule
+        rows = schedule.rows()
+        times = [row[0] for row in rows]
+        while schedule.remaining:
+            game.update(1 / 120)
+            # Salen exactamente las entradas ya vencidas
+            assert schedule.cursor == bisect_right(times, game.spawn_timer)
+    assert len(rows) == game.enemies_per_wave == len(spawned)
+    for (enemy_speed, enemy_health), (_, tier, _, speed, health) in zip(spawned, rows):
+        factors = game.enemy_tiers[tier] if game.enemy_tiers else {}
+        speed_multiplier = game.speed_multiplier * factors.get("velocidad_factor", 1.0)
+        health_multiplier = game.health_multiplier * factors.get("salud_factor", 1.0)
+        assert enemy_speed == pytest.approx(speed * speed_multiplier)
+        assert enemy_health == max(1, int(health * health_multiplier))
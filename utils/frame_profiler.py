@@ -0,0 +1,154 @@
+# utils/frame_profiler.py
+"""Cronometraje por fases de cada frame con ventana móvil.
+
+Uso típico en el bucle principal::
+
+    profiler.start_frame()
+    ...  # eventos
+    profiler.lap("eventos")
+    ...
+    profiler.end_frame()
+
+``lap`` atribuye a la fase indicada el tiempo transcurrido desde el último
+punto de control (``start_frame``, ``mark`` o el ``lap`` anterior). Cada
+llamada cuesta un ``perf_counter`` y una suma, por lo que puede quedar activo
+en producción.
+"""
+
+from __future__ import annotations
+
+import csv
+from collections import deque
+from pathlib import Path
+from time import perf_counter
+
+# Fases en el orden en que ocurren dentro de un frame, con su etiqueta visible.
+PHASES = {
+    "eventos": "Eventos",
+    "spawn": "Generación",
+    "enemigos": "Enemigos",
+    "torres": "Torres/proy.",
+    "mapa": "Mapa",
+    "entidades": "Entidades",
+    "ui": "UI",
+    "flip": "Flip",
+}
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = int(round(pct / 100 * (len(sorted_values) - 1)))
+    return sorted_values[max(0, min(len(sorted_values) - 1, rank))]
+
+
+class FrameProfiler:
+    """Acumula la duración de cada fase del frame en una ventana móvil."""
+
+    def __init__(self, window: int = 240, enabled: bool = True):
+        self.enabled = enabled
+        self.window = window
+        self.frame_count = 0
+        self._history: dict[str, deque[float]] = {
+            phase: deque(maxlen=window) for phase in PHASES
+        }
+        self._sums = {phase: 0.0 for phase in PHASES}
+        self._frame_times: deque[float] = deque(maxlen=window)
+        self._current = {phase: 0.0 for phase in PHASES}
+        self._frame_start: float | None = None
+        self._last = 0.0
+
+    # ------------------------------------------------------------------
+    # Registro
+    # ------------------------------------------------------------------
+    def start_frame(self):
+        if not self.enabled:
+            return
+        now = perf_counter()
+        if self._frame_start is not None:
+            self._frame_times.append(now - self._frame_start)
+        self._frame_start = now
+        self._last = now
+        for phase in self._current:
+            self._current[phase] = 0.0
+
+    def mark(self):
+        """Fija un punto de control sin atribuir el tiempo previo a ninguna fase."""
+        if self.enabled:
+            self._last = perf_counter()
+
+    def lap(self, phase: str):
+        if not self.enabled:
+            return
+        now = perf_counter()
+        self._current[phase] += now - self._last
+        self._last = now
+
+    def end_frame(self):
+        if not self.enabled or self._frame_start is None:
+            return
+        for phase, value in self._current.items():
+            history = self._history[phase]
+            if len(history) == history.maxlen:
+                self._sums[phase] -= history[0]
+            history.append(value)
+            self._sums[phase] += value
+        self.frame_count += 1
+
+    # ------------------------------------------------------------------
+    # Consulta
+    # ------------------------------------------------------------------
+    def phase_averages_ms(self) -> dict[str, float]:
+        """Promedio en milisegundos de cada fase dentro de la ventana."""
+        averages = {}
+        for phase, history in self._history.items():
+            averages[phase] = self._sums[phase] / len(history) * 1000 if history else 0.0
+        return averages
+
+    def fps_percentiles(self) -> dict[str, float]:
+        """FPS mediano y de los percentiles lentos (5 % y 1 % peores frames)."""
+        ordered = sorted(self._frame_times)
+        if not ordered:
+            return {"p50": 0.0, "p5": 0.0, "p1": 0.0}
+
+        def to_fps(seconds: float) -> float:
+            return 1.0 / seconds if seconds > 0 else 0.0
+
+        return {
+            "p50": to_fps(_percentile(ordered, 50)),
+            "p5": to_fps(_percentile(ordered, 95)),
+            "p1": to_fps(_percentile(ordered, 99)),
+        }
+
+    def summary(self) -> dict[str, str]:
+        """Líneas listas para mostrarse en el ``MetricsPanel``."""
+        fps = self.fps_percentiles()
+        lines = {"FPS p50/p5/p1": f"{fps['p50']:.0f}/{fps['p5']:.0f}/{fps['p1']:.0f}"}
+        for phase, value in self.phase_averages_ms().items():
+            lines[PHASES[phase]] = f"{value:.2f} ms"
+        return lines
+
+    def export_csv(self, path: str | Path) -> Path:
+        """Escribe la ventana actual (un frame por fila) en un archivo CSV."""
+        path = Path(path)
+        phases = list(PHASES)
+        phase_rows = list(zip(*(self._history[phase] for phase in phases)))
+        frame_times = list(self._frame_times)
+        # El intervalo de un frame se conoce al iniciar el siguiente, por eso
+        # el último frame registrado todavía no tiene duración total.
+        offset = len(frame_times) - len(phase_rows) + 1
+        first_frame = self.frame_count - len(phase_rows)
+        with path.open("w", newline="", encoding="utf-8") as handle:
+            writer = csv.writer(handle)
+            writer.writerow(["frame", "frame_ms", *(f"{phase}_ms" for phase in phases)])
+            for idx, values in enumerate(phase_rows):
+                frame_idx = idx + offset
+                frame_ms = (
+                    f"{frame_times[frame_idx] * 1000:.4f}"
+                    if 0 <= frame_idx < len(frame_times)
+                    else ""
+                )
+                writer.writerow(
+                    [first_frame + idx, frame_ms, *(f"{value * 1000:.4f}" for value in values)]
+                )
+        return path
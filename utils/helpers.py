@@ -1,4 +1,4 @@
-"""Utility helpers for drawing and surface manipulation."""
+"""Utility helpers for drawing, surface manipulation and entity lists."""
 
 from __future__ import annotations
 
@@ -66,4 +66,25 @@ def draw_path(surface, path, color, width=5):
 def draw_build_spots(surface, spots, color, size=40):
     for x, y in spots:
         rect = pygame.Rect(x - size // 2, y - size // 2, size, size)
-        pygame.draw.rect(surface, color, rect, border_radius=8)
\ No newline at end of file
+        pygame.draw.rect(surface, color, rect, border_radius=8)
+
+
+def compact(items: list, step) -> int:
+    """Run ``step`` on every item and drop, in place, those for which it returns false.
+
+    Survivors keep their relative order and are written back over the same
+    list in a single pass, so removing many items at once stays linear
+    (unlike repeated ``list.remove`` calls). ``step`` may update the item and
+    report why it was dropped as a side effect. Returns the number of items
+    removed.
+    """
+
+    write = 0
+    for item in items:
+        if step(item):
+            items[write] = item
+            write += 1
+    removed = len(items) - write
+    if removed:
+        del items[write:]
+    return removed
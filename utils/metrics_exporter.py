@@ -0,0 +1,198 @@
+# utils/metrics_exporter.py
+"""Exportación asíncrona de métricas de la partida.
+
+El bucle de dibujo solo llama a :meth:`MetricsExporter.publish`, que deja la
+muestra en una cola acotada sin bloquear (si la cola está llena la muestra se
+descarta y se cuenta). Un hilo en segundo plano consume la cola, mantiene el
+texto en formato de exposición de Prometheus y, opcionalmente, añade cada
+muestra como una línea JSON a un archivo con rotación. Otro hilo sirve ese
+texto por HTTP en ``http://127.0.0.1:<puerto>/metrics``.
+
+Una muestra es un diccionario ``{nombre: valor}`` o ``{nombre: {etiqueta:
+valor}}``; los nombres conocidos se describen en :data:`GAME_METRICS`.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import queue
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+
+# nombre -> (tipo, ayuda, nombre de la etiqueta para valores con varias series)
+GAME_METRICS = {
+    "td_fps": ("gauge", "FPS por percentil de la ventana del profiler", "percentil"),
+    "td_phase_ms": ("gauge", "Duración media por fase del frame en ms", "fase"),
+    "td_enemies_alive": ("gauge", "Enemigos en pantalla", ""),
+    "td_towers": ("gauge", "Torres construidas (servidores c)", ""),
+    "td_money": ("gauge", "Dinero disponible", ""),
+    "td_lives": ("gauge", "Vidas restantes", ""),
+    "td_wave": ("gauge", "Oleada actual", ""),
+    "td_level": ("gauge", "Nivel actual (1..N, 0 en el menú)", ""),
+    "td_lambda": ("gauge", "Tasa de llegadas configurada y medida", "fuente"),
+    "td_mu_effective": ("gauge", "Tasa de servicio efectiva medida", ""),
+    "td_rho": ("gauge", "Utilización medida", ""),
+    "td_queue_L": ("gauge", "Enemigos promedio en el sistema (L)", ""),
+    "td_queue_W_seconds": ("gauge", "Tiempo medio en el sistema (W)", ""),
+    "td_level_departures": ("gauge", "Enemigos que salieron del sistema en el nivel", "resultado"),
+    "td_pool_size": ("gauge", "Instancias creadas por cada reserva de objetos", "reserva"),
+    "td_pool_high_water": ("gauge", "Máximo de instancias en uso a la vez", "reserva"),
+    "td_pool_allocations": ("counter", "Instancias creadas porque la reserva estaba vacía", "reserva"),
+}
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_prometheus(sample: dict, dropped: int = 0, metrics: dict = GAME_METRICS) -> str:
+    """Convierte una muestra al formato de texto de exposición de Prometheus."""
+    lines = []
+    for name, value in sample.items():
+        kind, help_text, label = metrics.get(name, ("gauge", "", "serie"))
+        if help_text:
+            lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        if isinstance(value, dict):
+            for series, series_value in value.items():
+                lines.append(f'{name}{{{label}="{_escape(str(series))}"}} {float(series_value)!r}')
+        else:
+            lines.append(f"{name} {float(value)!r}")
+    lines.append("# HELP td_exporter_dropped_total Muestras descartadas por cola llena")
+    lines.append("# TYPE td_exporter_dropped_total counter")
+    lines.append(f"td_exporter_dropped_total {dropped}")
+    return "\n".join(lines) + "\n"
+
+
+class MetricsExporter:
+    """Cola acotada + hilo consumidor + servidor HTTP local opcional."""
+
+    def __init__(
+        self,
+        port: int | None = None,
+        host: str = "127.0.0.1",
+        file_path: str | Path | None = None,
+        max_bytes: int = 5 * 1024 * 1024,
+        backup_count: int = 3,
+        queue_size: int = 64,
+    ):
+        self.host = host
+        self.port = port
+        self.file_path = Path(file_path) if file_path else None
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._lock = threading.Lock()
+        self._text = format_prometheus({})
+        self.dropped = 0
+        self.published = 0
+        self._worker: threading.Thread | None = None
+        self._server: ThreadingHTTPServer | None = None
+        self._server_thread: threading.Thread | None = None
+        self._file_logger: logging.Logger | None = None
+
+    # ------------------------------------------------------------------
+    # Ciclo de vida
+    # ------------------------------------------------------------------
+    def start(self) -> "MetricsExporter":
+        if self.file_path is not None:
+            handler = RotatingFileHandler(
+                self.file_path, maxBytes=self.max_bytes, backupCount=self.backup_count, encoding="utf-8"
+            )
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            self._file_logger = logging.getLogger(f"td.metrics.{id(self)}")
+            self._file_logger.propagate = False
+            self._file_logger.setLevel(logging.INFO)
+            self._file_logger.addHandler(handler)
+
+        if self.port is not None:
+            self._server = ThreadingHTTPServer((self.host, self.port), self._make_handler())
+            self._server.daemon_threads = True
+            # Con puerto 0 el sistema asigna uno libre
+            self.port = self._server.server_address[1]
+            self._server_thread = threading.Thread(
+                target=self._server.serve_forever, name="metrics-http", daemon=True
+            )
+            self._server_thread.start()
+            print(f"📈 Métricas en http://{self.host}:{self.port}/metrics")
+
+        self._worker = threading.Thread(target=self._consume, name="metrics-export", daemon=True)
+        self._worker.start()
+        return self
+
+    def stop(self, timeout: float = 2.0):
+        if self._worker is not None:
+            # El centinela puede esperar: al cerrar ya no importa bloquear
+            try:
+                self._queue.put(None, timeout=timeout)
+            except queue.Full:
+                pass  # el hilo es daemon y termina con el proceso
+            self._worker.join(timeout)
+            self._worker = None
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._file_logger is not None:
+            for handler in list(self._file_logger.handlers):
+                handler.close()
+                self._file_logger.removeHandler(handler)
+            self._file_logger = None
+
+    # ------------------------------------------------------------------
+    # Productor (hilo principal)
+    # ------------------------------------------------------------------
+    def publish(self, sample: dict) -> bool:
+        """Encola una muestra sin bloquear; devuelve ``False`` si se descartó."""
+        try:
+            self._queue.put_nowait((time.time(), sample))
+        except queue.Full:
+            self.dropped += 1
+            return False
+        self.published += 1
+        return True
+
+    # ------------------------------------------------------------------
+    # Consumidor (hilo en segundo plano)
+    # ------------------------------------------------------------------
+    def _consume(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            timestamp, sample = item
+            text = format_prometheus(sample, self.dropped)
+            with self._lock:
+                self._text = text
+            if self._file_logger is not None:
+                self._file_logger.info(json.dumps({"ts": timestamp, **sample}, ensure_ascii=False))
+
+    def render(self) -> str:
+        """Texto de la última muestra procesada."""
+        with self._lock:
+            return self._text
+
+    def _make_handler(self):
+        exporter = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] not in ("/metrics", "/"):
+                    self.send_error(404)
+                    return
+                body = exporter.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                # Sin registro por petición en la consola del juego
+                pass
+
+        return Handler
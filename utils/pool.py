@@ -0,0 +1,75 @@
+# utils/pool.py
+"""Reserva de instancias reutilizables para entidades de vida corta.
+
+Enemigos y proyectiles se crean y se descartan continuamente durante una
+oleada. :class:`ObjectPool` conserva las instancias retiradas y las reinicia
+con su método ``reset`` (que recibe los mismos argumentos que el
+constructor), de modo que las oleadas largas dejan de reservar objetos nuevos
+y de generar trabajo para el recolector de basura.
+
+Quien devuelve un objeto con :meth:`ObjectPool.release` debe asegurarse de que
+nadie lo siga usando: la instancia puede reaparecer en el siguiente
+:meth:`ObjectPool.acquire` con otros valores. Solo se devuelven instancias
+obtenidas de la misma reserva, de modo que ``in_use`` es exacto.
+"""
+
+from __future__ import annotations
+
+
+class ObjectPool:
+    """Lista de instancias libres de ``cls`` con estadísticas de uso."""
+
+    def __init__(self, cls, capacity: int = 0):
+        self.cls = cls
+        # Instancias vacías (sin ``__init__``): ``reset`` rellena todos sus campos
+        self._free = [cls.__new__(cls) for _ in range(capacity)]
+        self.size = capacity         # instancias creadas por la reserva
+        self.in_use = 0
+        self.high_water = 0          # máximo de instancias en uso a la vez
+        self.allocations = 0         # instancias creadas porque no había libres
+        self.reuses = 0
+        self.acquired = 0
+
+    def take(self):
+        """Devuelve una instancia sin reiniciar; quien la pide rellena sus campos."""
+        free = self._free
+        if free:
+            obj = free.pop()
+            self.reuses += 1
+        else:
+            obj = self.cls.__new__(self.cls)
+            self.size += 1
+            self.allocations += 1
+        self.acquired += 1
+        self.in_use += 1
+        if self.in_use > self.high_water:
+            self.high_water = self.in_use
+        return obj
+
+    def acquire(self, *args, **kwargs):
+        """Devuelve una instancia reiniciada con ``reset(*args, **kwargs)``."""
+        obj = self.take()
+        obj.reset(*args, **kwargs)
+        return obj
+
+    def release(self, obj):
+        self._free.append(obj)
+        self.in_use -= 1
+
+    def release_all(self, objs):
+        self._free.extend(objs)
+        self.in_use -= len(objs)
+
+    @property
+    def free(self) -> int:
+        return len(self._free)
+
+    def stats(self) -> dict:
+        return {
+            "size": self.size,
+            "free": len(self._free),
+            "in_use": self.in_use,
+            "high_water": self.high_water,
+            "allocations": self.allocations,
+            "reuses": self.reuses,
+        }
@@ -3,17 +3,23 @@ import pygame
 from game import settings
 
 class MetricsPanel:
-    def __init__(self, font):
+    def __init__(self, font, on_export=None):
         self.visible = False
         self.font = font
-        self.rect = pygame.Rect(settings.SCREEN_WIDTH - 310, 60, 300, 220)
-        self.button_rect = pygame.Rect(settings.SCREEN_WIDTH - 130, 10, 120, 35)
+        self.on_export = on_export
+        self.rect = pygame.Rect(settings.SCREEN_WIDTH - 310, 80, 300, 220)
+        # A la izquierda del botón de pausa para no solaparse con él.
+        self.button_rect = pygame.Rect(settings.SCREEN_WIDTH - 350, 25, 150, 40)
+        self.export_rect = pygame.Rect(0, 0, 0, 0)
 
     def handle_click(self, pos):
        # """Alterna entre mostrar/ocultar el panel."""
         if self.button_rect.collidepoint(pos):
             self.visible = not self.visible
             return True
+        if self.visible and self.on_export and self.export_rect.collidepoint(pos):
+            self.on_export()
+            return True
         return False
 
     def draw_button(self, surface):
@@ -25,11 +31,20 @@ class MetricsPanel:
     def draw_panel(self, surface, metrics):
         if not self.visible:
             return
+        line_height = self.font.get_linesize()
+        export_height = 34 if self.on_export else 0
+        self.rect.height = 30 + line_height * len(metrics) + export_height
         pygame.draw.rect(surface, (30, 30, 50, 180), self.rect, border_radius=10)
         pygame.draw.rect(surface, (100, 100, 150), self.rect, 2, border_radius=10)
 
-        y = self.rect.y + 20
+        y = self.rect.y + 15
         for key, val in metrics.items():
             text = self.font.render(f"{key}: {val}", True, (255, 255, 255))
             surface.blit(text, (self.rect.x + 15, y))
-            y += 30
+            y += line_height
+
+        if self.on_export:
+            self.export_rect = pygame.Rect(self.rect.x + 15, y + 4, self.rect.width - 30, 28)
+            pygame.draw.rect(surface, (70, 90, 140), self.export_rect, border_radius=6)
+            label = self.font.render("Exportar CSV", True, (255, 255, 255))
+            surface.blit(label, label.get_rect(center=self.export_rect.center))